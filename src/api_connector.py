@@ -8,27 +8,125 @@ import asyncio
 import os
 import csv
 import time
-from datetime import datetime
+import random
+from collections import Counter
+import httpx
 from google import genai
 from google.genai import types
 from google.genai.errors import APIError
 
 from src import utils
+from src.models import PostModel
+
+try:
+    # Optional: lets the shared client multiplex concurrent requests over HTTP/2
+    import h2
+except ImportError:
+    h2 = None
 
 logger = logging.getLogger(__name__)
 
+# Status codes worth retrying (besides 5xx), and the longest wait between attempts
+RETRYABLE_STATUS_CODES = frozenset((408, 429))
+MAX_RETRY_DELAY = 60
+# Structure Gemini is asked to return for each post, enforced server-side
+ENRICHMENT_RESPONSE_SCHEMA = {
+    'type': 'OBJECT',
+    'properties': {
+        'summary': {'type': 'STRING'},
+        'seo_keywords': {'type': 'ARRAY', 'items': {'type': 'STRING'}},
+        'funnel_stage': {'type': 'STRING'},
+        'target_audience': {'type': 'STRING'},
+        'strategic_analysis': {
+            'type': 'OBJECT',
+            'properties': {
+                field: {'type': 'STRING'} for field in PostModel.REQUIRED_STRATEGIC_ANALYSIS_FIELDS
+            },
+            'required': list(PostModel.REQUIRED_STRATEGIC_ANALYSIS_FIELDS),
+        },
+    },
+    'required': list(PostModel.REQUIRED_ENRICHMENT_FIELDS),
+}
+# Characters reserved for the instructions and [POST n] markers of a grouped request
+GROUP_PROMPT_OVERHEAD = 500
+# Responses larger than this are parsed in a worker thread so they don't stall the event loop
+LARGE_RESPONSE_CHARS = 64 * 1024
+
+# One genai client per process: every connector shares its HTTP connection pool
+# and auth setup instead of building its own.
+_CLIENT = None
+
+def _get_client():
+    """Returns the shared genai client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = genai.Client(http_options=_get_http_options())
+    return _CLIENT
+
+def _get_http_options():
+    """
+    Sizes the async connection pool for the configured live concurrency and
+    enables HTTP/2 when the optional h2 package is installed.
+    """
+    max_connections = utils.get_live_enrichment_config().get('max_connections', 64)
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max(1, max_connections // 2),
+        keepalive_expiry=30
+    )
+    return types.HttpOptions(async_client_args={'limits': limits, 'http2': h2 is not None})
+
+class RateLimiter:
+    """
+    Spaces out API calls so that no more than `requests_per_minute` start in
+    any minute, smoothing bursts instead of letting them trip the quota.
+    """
+    def __init__(self, requests_per_minute):
+        self.interval = 60.0 / requests_per_minute
+        self._next_slot = 0.0
+
+    async def wait(self):
+        """Waits until the caller's slot comes up. Slots are handed out in call order."""
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
 class GeminiAPIConnector:
     """
     A wrapper for all interactions with the Google GenAI SDK, ensuring that
     all API calls are funneled through this single class.
+
+    Args:
+        cache: Optional EnrichmentCache; live results for prompts already sent
+            to the same model are served from it instead of the API.
     """
-    def __init__(self):
+    def __init__(self, cache=None):
+        self.cache = cache
+        requests_per_minute = utils.get_live_enrichment_config().get('requests_per_minute')
+        self.rate_limiter = RateLimiter(requests_per_minute) if requests_per_minute else None
         try:
-            self.client = genai.Client()
+            self.client = _get_client()
         except Exception as e:
             logger.error(f"Failed to initialize Gemini API client. Check your API key. Error: {e}")
             self.client = None
 
+    async def aclose(self):
+        """
+        Closes the client's async HTTP connections. Call once at shutdown; the
+        client is shared by every connector for the lifetime of the application.
+        """
+        global _CLIENT
+        if not self.client:
+            return
+        if _CLIENT is self.client:
+            _CLIENT = None
+        try:
+            await self.client.aio.aclose()
+        except Exception as e:
+            logger.debug(f"Error while closing Gemini API client: {e}")
+
     async def enrich_post_live(self, content, model_name, post_title="Unknown Post", headings=None, primary_competitors=None, dxp_competitors=None):
         """
         Calls the Gemini API asynchronously to get enhanced analysis including strategic insights for a single post.
@@ -45,90 +143,219 @@ class GeminiAPIConnector:
         
         prompt = utils.get_prompt("enrichment_instruction", content=content, headings=headings, primary_competitors=primary_competitors, dxp_competitors=dxp_competitors)
 
-        logger.debug(f"Enriching post: '{post_title[:50]}...'")
-        logger.debug(f"  Content length: {len(content)} characters")
-        logger.debug(f"  Prompt length: {len(prompt)} characters")
+        # Per-post logging uses %-style arguments so nothing is formatted when the level is off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Enriching post: '%s...'", post_title[:50])
+            logger.debug("  Content length: %d characters", len(content))
+            logger.debug("  Prompt length: %d characters", len(prompt))
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(model_name, prompt)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("    ✓ Live enrichment served from cache for '%s'", post_title)
+                return cached
         
         for attempt in range(3): # Retry logic
             try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.wait()
                 response = await self.client.aio.models.generate_content(
                     model=model_name,
-                    contents=prompt
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        response_mime_type="application/json",
+                        response_schema=ENRICHMENT_RESPONSE_SCHEMA
+                    )
                 )
                 
-                # Check if response has content
-                if not response or not hasattr(response, 'text') or not response.text:
-                    logger.warning(f"    Attempt {attempt+1}: API returned empty response for '{post_title}'")
-                    if attempt < 2:
-                        await asyncio.sleep(2 ** attempt)
-                    continue
+                # With a response schema the SDK has already decoded the JSON
+                parsed_json = getattr(response, 'parsed', None)
+                if not isinstance(parsed_json, dict):
+                    # Check if response has content
+                    if not response or not hasattr(response, 'text') or not response.text:
+                        logger.warning("    Attempt %d: API returned empty response for '%s'", attempt + 1, post_title)
+                        if attempt < 2:
+                            await asyncio.sleep(self._retry_delay(attempt))
+                        continue
                 
-                response_text = response.text.strip()
+                    response_text = response.text.strip()
                 
-                # Check if response starts with AFC message (indicates malformed API request)
-                if response_text.startswith("AFC is enabled") or "AFC is enabled" in response_text:
-                    logger.error(f"    Attempt {attempt+1}: AFC error detected - API request is malformed for '{post_title}'")
-                    logger.error(f"    Raw response: {response_text[:200]}...")
-                    if attempt < 2:
-                        await asyncio.sleep(2 ** attempt)
-                    continue
+                    # Check if response starts with AFC message (indicates malformed API request)
+                    if response_text.startswith("AFC is enabled") or "AFC is enabled" in response_text:
+                        logger.error(f"    Attempt {attempt+1}: AFC error detected - API request is malformed for '{post_title}'")
+                        logger.error(f"    Raw response: {response_text[:200]}...")
+                        if attempt < 2:
+                            await asyncio.sleep(self._retry_delay(attempt))
+                        continue
                 
-                # Try to parse as JSON
-                try:
-                    parsed_json = json.loads(response_text)
-                except json.JSONDecodeError as json_error:
-                    # Try to extract JSON from response if it's wrapped in other text
-                    import re
-                    json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-                    if json_match:
+                    # Try to parse as JSON
+                    try:
+                        if len(response_text) > LARGE_RESPONSE_CHARS:
+                            parsed_json = await asyncio.to_thread(utils.json_loads, response_text)
+                        else:
+                            parsed_json = utils.json_loads(response_text)
+                    except json.JSONDecodeError as json_error:
+                        # Try to extract JSON from response if it's wrapped in other text
+                        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
                         try:
-                            parsed_json = json.loads(json_match.group(0))
-                            logger.debug(f"    Successfully extracted JSON from wrapped response")
+                            if not json_match:
+                                raise json_error
+                            parsed_json = utils.json_loads(json_match.group(0))
+                            logger.debug("    Successfully extracted JSON from wrapped response")
                         except json.JSONDecodeError:
-                            # Only log warning if both direct parsing and extraction failed
-                            logger.warning(f"    Attempt {attempt+1}: JSON parsing failed for '{post_title}': {json_error}")
-                            if attempt < 2:
-                                await asyncio.sleep(2 ** attempt)
-                            continue
-                    else:
-                        # Only log warning if both direct parsing and extraction failed
-                        logger.warning(f"    Attempt {attempt+1}: JSON parsing failed for '{post_title}': {json_error}")
-                        if attempt < 2:
-                            await asyncio.sleep(2 ** attempt)
-                        continue
+                            # Unparseable output is not retried: the same prompt would cost another call
+                            logger.warning("    Attempt %d: JSON parsing failed for '%s': %s", attempt + 1, post_title, json_error)
+                            break
                 
                 # Successfully parsed JSON - verify we have actual data
                 if parsed_json and isinstance(parsed_json, dict):
-                    summary = parsed_json.get('summary', 'N/A')
-                    seo_keywords = ', '.join(parsed_json.get('seo_keywords', []))
-                    funnel_stage = parsed_json.get('funnel_stage', 'N/A')
-                    target_audience = parsed_json.get('target_audience', 'N/A')
-                    strategic_analysis = parsed_json.get('strategic_analysis', {})
+                    summary, seo_keywords, funnel_stage, target_audience, strategic_analysis = self._parse_enrichment(parsed_json)
                     
                     # Only mark as successful if we got actual content, not just N/A
                     if summary != 'N/A' or seo_keywords != 'N/A' or funnel_stage != 'N/A':
-                        logger.info(f"    ✓ Live enrichment successful for '{post_title}' (attempt {attempt+1})")
+                        logger.info("    ✓ Live enrichment successful for '%s' (attempt %d)", post_title, attempt + 1)
+                        if cache_key is not None:
+                            self.cache.put(cache_key, (summary, seo_keywords, funnel_stage, target_audience, strategic_analysis))
                         return summary, seo_keywords, funnel_stage, target_audience, strategic_analysis
                     else:
-                        logger.warning(f"    API returned only N/A values for '{post_title}' (attempt {attempt+1})")
+                        logger.warning("    API returned only N/A values for '%s' (attempt %d)", post_title, attempt + 1)
                         if attempt < 2:
-                            await asyncio.sleep(2 ** attempt)
+                            await asyncio.sleep(self._retry_delay(attempt))
                         continue
                 else:
-                    logger.warning(f"    API returned invalid JSON structure for '{post_title}' (attempt {attempt+1})")
-                    if attempt < 2:
-                        await asyncio.sleep(2 ** attempt)
-                    continue
+                    logger.warning("    API returned invalid JSON structure for '%s' (attempt %d)", post_title, attempt + 1)
+                    break
                 
+            except APIError as e:
+                if not self._is_retryable(e):
+                    logger.error(f"    Attempt {attempt+1}: API call failed for '{post_title}' and will not be retried: {e}")
+                    break
+                logger.warning("    Attempt %d: API call failed for '%s': %s", attempt + 1, post_title, e)
+                if attempt < 2:
+                    await asyncio.sleep(self._retry_delay(attempt, e))
             except Exception as e:
-                logger.warning(f"    Attempt {attempt+1}: API call failed for '{post_title}': {e}")
+                logger.warning("    Attempt %d: API call failed for '%s': %s", attempt + 1, post_title, e)
                 if attempt < 2:
-                    await asyncio.sleep(2 ** attempt)
+                    await asyncio.sleep(self._retry_delay(attempt))
         
-        logger.error(f"    ❌ API enrichment completely failed for '{post_title}' after 3 attempts")
-        logger.error(f"    Possible causes: malformed API request (AFC error), network issues, or API rate limiting")
+        logger.error(f"    ❌ API enrichment failed for '{post_title}'")
+        logger.error(f"    Possible causes: malformed API request (AFC error), unparseable response, network issues, or API rate limiting")
         return summary, seo_keywords, funnel_stage, target_audience, strategic_analysis
 
+    async def enrich_posts_group_live(self, posts, model_name, primary_competitors=None, dxp_competitors=None):
+        """
+        Enriches several posts with a single API call that returns one result per
+        post. Cached posts are served from the cache; if the response doesn't line
+        up with the posts, each remaining post falls back to enrich_post_live.
+
+        Returns:
+            list: One (summary, seo_keywords, funnel_stage, target_audience,
+                strategic_analysis) tuple per post, in order.
+        """
+        results = [None] * len(posts)
+        cache_keys = [None] * len(posts)
+        if self.cache is not None:
+            for i, post in enumerate(posts):
+                prompt = utils.get_prompt("enrichment_instruction", content=post['content'], primary_competitors=primary_competitors, dxp_competitors=dxp_competitors)
+                cache_keys[i] = self.cache.make_key(model_name, prompt)
+                results[i] = self.cache.get(cache_keys[i])
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        if self.client and len(pending) > 1:
+            documents = "".join(f"\n\n[POST {n}]\n{posts[i]['content']}" for n, i in enumerate(pending, 1))
+            content = (f"{len(pending)} posts follow, each marked [POST n]. Return a JSON array with "
+                       f"one object per post, in the same order.{documents}")
+            prompt = utils.get_prompt("enrichment_instruction", content=content, primary_competitors=primary_competitors, dxp_competitors=dxp_competitors)
+            items = None
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.wait()
+                response = await self.client.aio.models.generate_content(
+                    model=model_name,
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        response_mime_type="application/json",
+                        response_schema={'type': 'ARRAY', 'items': ENRICHMENT_RESPONSE_SCHEMA}
+                    )
+                )
+                items = response.parsed if isinstance(getattr(response, 'parsed', None), list) else utils.json_loads(response.text)
+            except Exception as e:
+                logger.warning(f"    Grouped request for {len(pending)} posts failed: {e}")
+
+            if isinstance(items, list) and len(items) == len(pending) and all(isinstance(item, dict) for item in items):
+                for i, item in zip(pending, items):
+                    result = self._parse_enrichment(item)
+                    if result[:3] != ('N/A', 'N/A', 'N/A'):
+                        results[i] = result
+                        if cache_keys[i] is not None:
+                            self.cache.put(cache_keys[i], result)
+                logger.info(f"    ✓ Grouped live enrichment returned results for {len(pending)} posts")
+            elif items is not None:
+                logger.warning(f"    Grouped response didn't match its {len(pending)} posts, enriching them one by one")
+
+        # Anything still missing is enriched on its own, with the usual retries
+        missing = [i for i, result in enumerate(results) if result is None]
+        singles = await asyncio.gather(*(
+            self.enrich_post_live(posts[i]['content'], model_name, posts[i]['title'], posts[i].get('headings'), primary_competitors, dxp_competitors)
+            for i in missing
+        ))
+        for i, result in zip(missing, singles):
+            results[i] = result
+        return results
+
+    @staticmethod
+    def _parse_enrichment(parsed_json):
+        """Converts a decoded enrichment object into the result tuple, defaulting missing fields to N/A."""
+        return (
+            parsed_json.get('summary', 'N/A'),
+            ', '.join(parsed_json.get('seo_keywords', [])),
+            parsed_json.get('funnel_stage', 'N/A'),
+            parsed_json.get('target_audience', 'N/A'),
+            parsed_json.get('strategic_analysis', {}),
+        )
+
+    @staticmethod
+    def _group_posts(posts, posts_per_request, max_chars):
+        """
+        Packs posts, in order, into groups of at most posts_per_request whose
+        combined content fits in max_chars. A post larger than max_chars gets a
+        group of its own.
+        """
+        groups, group, group_chars = [], [], 0
+        for post in posts:
+            size = len(post['content'])
+            if group and (len(group) >= posts_per_request or group_chars + size > max_chars):
+                groups.append(group)
+                group, group_chars = [], 0
+            group.append(post)
+            group_chars += size
+        if group:
+            groups.append(group)
+        return groups
+
+    @staticmethod
+    def _is_retryable(error):
+        """Rate limits, timeouts and server errors are worth retrying; other client errors are not."""
+        return error.code in RETRYABLE_STATUS_CODES or (error.code or 0) >= 500
+
+    @staticmethod
+    def _retry_delay(attempt, error=None):
+        """
+        Returns the seconds to wait before the next attempt: the server's
+        Retry-After hint when it sent one, otherwise a jittered exponential
+        backoff so concurrent tasks don't retry in lockstep.
+        """
+        response = getattr(error, 'response', None)
+        retry_after = getattr(response, 'headers', {}).get('retry-after') if response is not None else None
+        if retry_after:
+            try:
+                return min(MAX_RETRY_DELAY, float(retry_after))
+            except ValueError:
+                pass
+        return random.uniform(0, min(MAX_RETRY_DELAY, 2 ** attempt))
+
     def _prepare_content_for_api(self, content, post_title):
         """
         Prepares content for API consumption by cleaning and potentially truncating it.
@@ -187,56 +414,97 @@ class GeminiAPIConnector:
         """
         start_time = time.time()
         logger.info(f"Batch got {len(posts)} posts to Enrich Live with the {model_name} model")
-        tasks = []
+        # Cap in-flight requests: a slot is acquired before each task is created and
+        # released when it finishes, so large sets aren't all scheduled up front
+        live_config = utils.get_live_enrichment_config()
+        max_concurrency = live_config.get('max_concurrency', 10)
+        per_call_timeout = live_config.get('per_call_timeout', 120)
+        posts_per_request = live_config.get('posts_per_request', 1)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        # One request per distinct content: reruns and syndicated posts share a
+        # single API call. Posts without content get no request and a None result.
+        distinct_posts = {}
         for post in posts:
-            if post['content'] and post['content'] != 'N/A':
-                tasks.append(self.enrich_post_live(post['content'], model_name, post['title'], post.get('headings'), primary_competitors, dxp_competitors))
+            content = post['content']
+            if content and content != 'N/A' and content not in distinct_posts:
+                distinct_posts[content] = post
+        if len(distinct_posts) < len(posts):
+            logger.debug(f"  {len(distinct_posts)} distinct contents to enrich out of {len(posts)} posts")
+
+        # Short posts can share a request; the group must fit in the API content limit
+        if posts_per_request > 1:
+            max_chars = utils.get_content_processing_config().get('api_content_limit', 50000) - GROUP_PROMPT_OVERHEAD
+            groups = self._group_posts(list(distinct_posts.values()), posts_per_request, max_chars)
+        else:
+            groups = [[post] for post in distinct_posts.values()]
+
+        tasks = []
+        for group in groups:
+            await semaphore.acquire()
+            if len(group) == 1:
+                coro = self.enrich_post_live(group[0]['content'], model_name, group[0]['title'], group[0].get('headings'), primary_competitors, dxp_competitors)
             else:
-                # Create a completed future for posts with no content
-                future = asyncio.Future()
-                future.set_result(('N/A', 'N/A', 'N/A', 'N/A', {}))
-                tasks.append(future)
+                coro = self.enrich_posts_group_live(group, model_name, primary_competitors, dxp_competitors)
+            task = asyncio.create_task(asyncio.wait_for(coro, per_call_timeout))
+            task.add_done_callback(lambda _: semaphore.release())
+            tasks.append(task)
 
-        gemini_results = await asyncio.gather(*tasks)
+        # A timed-out or crashed request fails only the posts sharing it
+        results_by_content = {}
+        for group, result in zip(groups, await asyncio.gather(*tasks, return_exceptions=True)):
+            if len(group) == 1 or isinstance(result, BaseException):
+                result = [result] * len(group)
+            for post, post_result in zip(group, result):
+                results_by_content[post['content']] = post_result
 
-        transformed_posts = []
         failed_posts = []
+        status_counts = Counter()
         
-        for i, post in enumerate(posts):
-            summary, seo_keywords, funnel_stage, target_audience, strategic_analysis = gemini_results[i]
+        for post in posts:
+            # Each field is looked up once per post in this loop
+            content = post.get('content')
+            title = post['title']
+            result = results_by_content.get(content)
+            if isinstance(result, BaseException):
+                logger.warning("    Live enrichment for '%s' did not complete: %s %s", title, type(result).__name__, result)
+                result = None
+            if result is None:
+                result = ('N/A', 'N/A', 'N/A', 'N/A', {})
+            summary, seo_keywords, funnel_stage, target_audience, strategic_analysis = result
             
             # Check if enrichment actually failed (all core values are N/A despite having content)
-            has_content = post.get('content') and post.get('content') != 'N/A' and len(post.get('content', '').strip()) > 10
+            has_content = content and content != 'N/A' and len(content.strip()) > 10
             all_na_values = (summary == 'N/A' and seo_keywords == 'N/A' and funnel_stage == 'N/A')
             
-            # Initialize metadata if not present
-            if 'metadata' not in post:
-                post['metadata'] = {}
-                
             if has_content and all_na_values:
                 # This indicates API failure for a post that should have been enrichable
-                failed_posts.append(post['title'])
-                post['metadata']['enrichment_status'] = 'failed'
-                logger.warning(f"  ⚠️ Post '{post['title']}' marked as failed - API enrichment returned only N/A values")
+                failed_posts.append(title)
+                status = 'failed'
+                logger.warning("  ⚠️ Post '%s' marked as failed - API enrichment returned only N/A values", title)
             elif not has_content:
                 # Post had no content to enrich
-                post['metadata']['enrichment_status'] = 'no_content'
+                status = 'no_content'
             else:
                 # Successfully enriched
-                post['metadata']['enrichment_status'] = 'completed'
+                status = 'completed'
                 
-            # Update post with enrichment data regardless (for consistency)
-            post['summary'] = summary
-            post['seo_keywords'] = seo_keywords
-            post['funnel_stage'] = funnel_stage
-            post['target_audience'] = target_audience
-            post['strategic_analysis'] = strategic_analysis
-            transformed_posts.append(post)
+            # Initialize metadata if not present
+            post.setdefault('metadata', {})['enrichment_status'] = status
+            # Update post with enrichment data regardless (for consistency).
+            # strategic_analysis is copied so posts sharing a result don't share one dict
+            post.update(
+                summary=summary,
+                seo_keywords=seo_keywords,
+                funnel_stage=funnel_stage,
+                target_audience=target_audience,
+                strategic_analysis=dict(strategic_analysis) if isinstance(strategic_analysis, dict) else strategic_analysis,
+            )
+            status_counts[status] += 1
 
         # Calculate enrichment statistics
-        completed_count = len([p for p in transformed_posts if p.get('metadata', {}).get('enrichment_status') == 'completed'])
-        failed_count = len([p for p in transformed_posts if p.get('metadata', {}).get('enrichment_status') == 'failed'])
-        no_content_count = len([p for p in transformed_posts if p.get('metadata', {}).get('enrichment_status') == 'no_content'])
+        completed_count = status_counts['completed']
+        failed_count = status_counts['failed']
+        no_content_count = status_counts['no_content']
         
         logger.info(f"Live enrichment completed in {time.time() - start_time:.2f} seconds:")
         logger.info(f"  ✅ Successfully enriched: {completed_count}/{len(posts)} posts")
@@ -255,11 +523,7 @@ class GeminiAPIConnector:
             logger.info(f"  ⭕ No content to enrich: {no_content_count} posts")
 
         # Sort the final list
-        posts_with_dates = [p for p in transformed_posts if p.get('publication_date') and p['publication_date'] != 'N/A']
-        posts_without_dates = [p for p in transformed_posts if not p.get('publication_date') or p['publication_date'] == 'N/A']
-        posts_with_dates.sort(key=lambda x: datetime.strptime(x['publication_date'], '%Y-%m-%d'), reverse=True)
-        
-        return posts_with_dates + posts_without_dates
+        return utils.sort_posts_by_date(posts)
 
     def create_batch_job(self, posts, competitor_name, model_name, primary_competitors=None, dxp_competitors=None):
         """
@@ -352,7 +616,7 @@ class GeminiAPIConnector:
             for line in result_content.splitlines():
                 if not line.strip(): continue
                 
-                result_json = json.loads(line)
+                result_json = utils.json_loads(line)
                 key = result_json.get('key')
                 
                 post = original_posts_map.get(key, {})
@@ -375,11 +639,11 @@ class GeminiAPIConnector:
                     
                     parsed_json = None
                     try:
-                        parsed_json = json.loads(text_part)
+                        parsed_json = utils.json_loads(text_part)
                     except json.JSONDecodeError:
                         json_match = re.search(r'\{.*\}', text_part, re.DOTALL)
                         if json_match:
-                            try: parsed_json = json.loads(json_match.group(0))
+                            try: parsed_json = utils.json_loads(json_match.group(0))
                             except json.JSONDecodeError: pass
 
                     # Initialize metadata if not present
@@ -404,11 +668,7 @@ class GeminiAPIConnector:
             from src.transform.content_preprocessor import ContentPreprocessor
             merged_posts = ContentPreprocessor.merge_chunked_results(transformed_posts)
 
-            posts_with_dates = [p for p in merged_posts if p.get('publication_date') and p['publication_date'] != 'N/A']
-            posts_without_dates = [p for p in merged_posts if not p.get('publication_date') or p['publication_date'] == 'N/A']
-            posts_with_dates.sort(key=lambda x: datetime.strptime(x['publication_date'], '%Y-%m-%d'), reverse=True)
-            
-            return posts_with_dates + posts_without_dates
+            return utils.sort_posts_by_date(merged_posts)
 
         except Exception as e:
             logger.error(f"An unexpected error occurred while downloading results for job {job_id}: {e}")
@@ -475,8 +735,8 @@ class GeminiAPIConnector:
                 
                 request_payload = {
                     "contents": [{"parts": [{"text": prompt}]}],
-                    "generationConfig": {"response_mime_type": "application/json"}
+                    "generationConfig": {"response_mime_type": "application/json", "response_schema": ENRICHMENT_RESPONSE_SCHEMA}
                 }
                 json_line = {"key": f"post-{i}", "request": request_payload, "metadata": metadata}
-                jsonl_lines.append(json.dumps(json_line))
+                jsonl_lines.append(utils.json_dumps(json_line))
         return "\n".join(jsonl_lines)
\ No newline at end of file
@@ -21,6 +21,7 @@ class DIContainer:
         self._competitor_config: Optional[dict] = None
         self._state_manager: Optional['StateManager'] = None
         self._api_connector: Optional['GeminiAPIConnector'] = None
+        self._enrichment_cache: Optional['EnrichmentCache'] = None
         self._batch_manager: Optional['BatchJobManager'] = None
         self._scraper_manager: Optional['ScraperManager'] = None
         self._enrichment_manager: Optional['EnrichmentManager'] = None
@@ -62,12 +63,25 @@ class DIContainer:
             logger.debug("StateManager initialized")
         return self._state_manager
     
+    @property
+    def enrichment_cache(self) -> Optional['EnrichmentCache']:
+        """Get or create the EnrichmentCache instance, or None if caching is disabled."""
+        live_config = self.app_config.get('live_enrichment', {})
+        if self._enrichment_cache is None and live_config.get('cache_enabled', True):
+            from .transform.enrichment_cache import EnrichmentCache
+            self._enrichment_cache = EnrichmentCache(
+                live_config.get('cache_path', 'data/cache/enrichment_cache.sqlite'),
+                live_config.get('cache_memory_entries', 1024)
+            )
+            logger.debug("EnrichmentCache initialized")
+        return self._enrichment_cache
+    
     @property
     def api_connector(self) -> 'GeminiAPIConnector':
         """Get or create GeminiAPIConnector instance."""
         if self._api_connector is None:
             from .api_connector import GeminiAPIConnector
-            self._api_connector = GeminiAPIConnector()
+            self._api_connector = GeminiAPIConnector(self.enrichment_cache)
             logger.debug("GeminiAPIConnector initialized")
         return self._api_connector
     
@@ -76,7 +90,7 @@ class DIContainer:
         """Get or create BatchJobManager instance."""
         if self._batch_manager is None:
             from .transform.batch_manager import BatchJobManager
-            self._batch_manager = BatchJobManager(self.app_config)
+            self._batch_manager = BatchJobManager(self.app_config, self.state_manager, self.api_connector)
             logger.debug("BatchJobManager initialized")
         return self._batch_manager
     
@@ -97,7 +111,8 @@ class DIContainer:
             self._enrichment_manager = EnrichmentManager(
                 self.app_config, 
                 self.state_manager, 
-                self.batch_manager
+                self.batch_manager,
+                self.api_connector
             )
             logger.debug("EnrichmentManager initialized")
         return self._enrichment_manager
@@ -111,6 +126,14 @@ class DIContainer:
             logger.debug("ExportManager initialized")
         return self._export_manager
     
+    async def aclose(self):
+        """Release resources held by created managers, such as open API connections."""
+        if self._api_connector is not None:
+            await self._api_connector.aclose()
+            logger.debug("GeminiAPIConnector closed")
+        if self._enrichment_cache is not None:
+            self._enrichment_cache.close()
+    
     def get_competitors_to_process(self, selected_competitor_name: Optional[str] = None) -> list:
         """Get filtered list of competitors to process."""
         return get_competitors_to_process(self.competitor_config, selected_competitor_name)
@@ -3,6 +3,10 @@
 
 from typing import Dict, List, Optional, Any
 
+# Placeholder values that count as "not enriched"; a hashed set avoids building
+# a throwaway list for every membership test
+_MISSING_VALUES = frozenset(('N/A', '', None))
+
 class PostModel:
     """
     Defines the expected structure for enriched blog posts.
@@ -61,52 +65,115 @@ class PostModel:
         all_fields.update(cls.METADATA_FIELDS)
         return all_fields
     
+    # Bit flags describing missing enrichment data (see missing_enrichment_mask)
+    MISSING_SUMMARY = 1 << 0
+    MISSING_SEO_KEYWORDS = 1 << 1
+    MISSING_FUNNEL_STAGE = 1 << 2
+    MISSING_TARGET_AUDIENCE = 1 << 3
+    MISSING_STRATEGIC_ANALYSIS = 1 << 4
+    MISSING_CONTENT_ANGLE = 1 << 5
+    MISSING_COMPETITIVE_DIFFERENTIATION = 1 << 6
+    MISSING_CONTENT_FRESHNESS_SCORE = 1 << 7
+    MISSING_TARGET_PERSONA_INDICATORS = 1 << 8
+    MISSING_CONTENT_DEPTH = 1 << 9
+    FAILED_ENRICHMENT = 1 << 10
+    
+    # Any strategic analysis data missing: the whole object or one of its sub-fields
+    MISSING_STRATEGIC = (MISSING_STRATEGIC_ANALYSIS | MISSING_CONTENT_ANGLE | MISSING_COMPETITIVE_DIFFERENTIATION
+                         | MISSING_CONTENT_FRESHNESS_SCORE | MISSING_TARGET_PERSONA_INDICATORS | MISSING_CONTENT_DEPTH)
+    
+    _BASIC_FIELD_FLAGS = (
+        ('summary', MISSING_SUMMARY),
+        ('seo_keywords', MISSING_SEO_KEYWORDS),
+        ('funnel_stage', MISSING_FUNNEL_STAGE),
+        ('target_audience', MISSING_TARGET_AUDIENCE),
+    )
+    _STRATEGIC_FIELD_FLAGS = (
+        ('content_angle', MISSING_CONTENT_ANGLE),
+        ('competitive_differentiation', MISSING_COMPETITIVE_DIFFERENTIATION),
+        ('content_freshness_score', MISSING_CONTENT_FRESHNESS_SCORE),
+        ('target_persona_indicators', MISSING_TARGET_PERSONA_INDICATORS),
+        ('content_depth', MISSING_CONTENT_DEPTH),
+    )
+    # Flag -> reported field name, in the order fields are reported
+    _FLAG_NAMES = (
+        (MISSING_SUMMARY, 'summary'),
+        (MISSING_SEO_KEYWORDS, 'seo_keywords'),
+        (MISSING_FUNNEL_STAGE, 'funnel_stage'),
+        (MISSING_TARGET_AUDIENCE, 'target_audience'),
+        (MISSING_STRATEGIC_ANALYSIS, 'strategic_analysis'),
+        (MISSING_CONTENT_ANGLE, 'strategic_analysis.content_angle'),
+        (MISSING_COMPETITIVE_DIFFERENTIATION, 'strategic_analysis.competitive_differentiation'),
+        (MISSING_CONTENT_FRESHNESS_SCORE, 'strategic_analysis.content_freshness_score'),
+        (MISSING_TARGET_PERSONA_INDICATORS, 'strategic_analysis.target_persona_indicators'),
+        (MISSING_CONTENT_DEPTH, 'strategic_analysis.content_depth'),
+        (FAILED_ENRICHMENT, 'metadata.enrichment_status'),
+    )
+    
     @classmethod
-    def needs_enrichment(cls, post: Dict[str, Any]) -> tuple[bool, List[str]]:
+    def missing_enrichment_mask(cls, post: Dict[str, Any]) -> int:
         """
-        Determines if a post needs enrichment by checking for missing or invalid enrichment fields.
+        Returns the missing enrichment data of a post as an int of MISSING_* /
+        FAILED_ENRICHMENT flags; 0 means the post doesn't need enrichment.
         
         Args:
             post: Post dictionary to check
             
         Returns:
-            Tuple of (needs_enrichment: bool, missing_fields: List[str])
+            Bit mask of missing fields
         """
-        missing_fields = []
+        get = post.get
         
-        # Check basic enrichment fields
-        for field, expected_type in cls.REQUIRED_ENRICHMENT_FIELDS.items():
-            value = post.get(field)
-            
-            if field == 'strategic_analysis':
-                # Special handling for strategic analysis
-                if not value or not isinstance(value, dict):
-                    missing_fields.append(field)
-                else:
-                    # Check strategic analysis sub-fields
-                    for sub_field in cls.REQUIRED_STRATEGIC_ANALYSIS_FIELDS:
-                        sub_value = value.get(sub_field)
-                        if not sub_value or sub_value in ['N/A', '', None]:
-                            missing_fields.append(f"strategic_analysis.{sub_field}")
-            else:
-                # Check basic enrichment fields
-                if not value or value in ['N/A', '', None]:
-                    missing_fields.append(field)
+        # Posts without content don't need enrichment; checking this first skips
+        # every field lookup for them
+        content = get('content')
+        if not content or content == 'N/A' or len(content.strip()) <= 10:
+            return 0
+        
+        mask = 0
+        
+        # Check basic enrichment fields (values may be lists, which aren't hashable)
+        for field, flag in cls._BASIC_FIELD_FLAGS:
+            value = get(field)
+            if not value or (isinstance(value, str) and value in _MISSING_VALUES):
+                mask |= flag
+        
+        # Special handling for strategic analysis
+        strategic_analysis = get('strategic_analysis')
+        if not strategic_analysis or not isinstance(strategic_analysis, dict):
+            mask |= cls.MISSING_STRATEGIC_ANALYSIS
+        else:
+            for sub_field, flag in cls._STRATEGIC_FIELD_FLAGS:
+                sub_value = strategic_analysis.get(sub_field)
+                if not sub_value or (isinstance(sub_value, str) and sub_value in _MISSING_VALUES):
+                    mask |= flag
         
         # Check enrichment status for explicit failures (in metadata structure)
-        metadata = post.get('metadata', {})
-        if metadata.get('enrichment_status') == 'failed':
-            if 'metadata.enrichment_status' not in missing_fields:
-                missing_fields.append('metadata.enrichment_status')
+        if get('metadata', {}).get('enrichment_status') == 'failed':
+            mask |= cls.FAILED_ENRICHMENT
         
-        # Check if post has content to enrich
-        has_content = post.get('content') and post.get('content') != 'N/A' and len(post.get('content', '').strip()) > 10
-        if not has_content:
-            # Posts without content don't need enrichment
-            return False, []
+        return mask
+    
+    @classmethod
+    def missing_field_names(cls, mask: int) -> List[str]:
+        """Converts a mask from missing_enrichment_mask into field names, e.g. 'strategic_analysis.content_depth'."""
+        return [name for flag, name in cls._FLAG_NAMES if mask & flag]
+    
+    @classmethod
+    def needs_enrichment(cls, post: Dict[str, Any]) -> tuple[bool, List[str]]:
+        """
+        Determines if a post needs enrichment by checking for missing or invalid enrichment fields.
+        
+        Args:
+            post: Post dictionary to check
             
-        needs_enrichment = len(missing_fields) > 0
-        return needs_enrichment, missing_fields
+        Returns:
+            Tuple of (needs_enrichment: bool, missing_fields: List[str])
+        """
+        mask = cls.missing_enrichment_mask(post)
+        if not mask:
+            return False, []
+        return True, cls.missing_field_names(mask)
     
     @classmethod 
     def validate_post_structure(cls, post: Dict[str, Any]) -> tuple[bool, List[str]]:
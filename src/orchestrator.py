@@ -6,6 +6,7 @@ import asyncio
 import os
 from typing import Dict, Any, Optional
 
+from . import utils
 from .di_container import DIContainer
 from .exceptions import (
     ETLError, 
@@ -18,6 +19,32 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+
+class _ProcessedDataSaver:
+    """
+    Runs StateManager.save_processed_data in a worker thread so the event loop
+    isn't blocked by disk I/O. At most one save is in flight: the next competitor
+    is processed while the previous competitor's data is being written.
+    """
+    def __init__(self, state_manager):
+        self._state_manager = state_manager
+        self._pending = None
+
+    async def save(self, posts, competitor_name, source_filename):
+        """Waits for the previous save, then starts this one in the background."""
+        await self.flush()
+        loop = asyncio.get_running_loop()
+        self._pending = loop.run_in_executor(
+            None, self._state_manager.save_processed_data, posts, competitor_name, source_filename
+        )
+
+    async def flush(self):
+        """Waits for the in-flight save, if any, to finish."""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            await pending
+
+
 async def run_pipeline(args: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     The primary orchestration function that executes the ETL workflow.
@@ -28,6 +55,7 @@ async def run_pipeline(args: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     Returns:
         Dictionary with execution results for LLM consumption, or None on success
     """
+    container = None
     try:
         # Initialize DI container
         container = DIContainer()
@@ -77,6 +105,9 @@ async def run_pipeline(args: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         logger.error(f"Unexpected error in pipeline: {e}")
         error = ETLError(f"Unexpected pipeline error: {str(e)}", "PIPELINE_ERROR")
         return error.to_dict()
+    finally:
+        if container is not None:
+            await container.aclose()
 
 
 async def _handle_check_job(container: DIContainer, competitors: list) -> Optional[Dict[str, Any]]:
@@ -160,6 +191,7 @@ async def _handle_analyze(container: DIContainer, competitors: list, analysis_ty
 
 async def _handle_enrich_existing(container: DIContainer, competitors: list, live_model: str, batch_model: str, batch_threshold: int, wait: bool) -> Optional[Dict[str, Any]]:
     """Handle enrichment of existing processed data."""
+    saver = _ProcessedDataSaver(container.state_manager)
     try:
         total_enriched = 0
         for competitor in competitors:
@@ -183,18 +215,22 @@ async def _handle_enrich_existing(container: DIContainer, competitors: list, liv
             )
             
             if final_posts:
-                container.state_manager.save_processed_data(final_posts, competitor['name'], "enrichment_update.json")
+                await saver.save(final_posts, competitor['name'], "enrichment_update.json")
                 total_enriched += len(final_posts)
 
+        await saver.flush()
         logger.info(f"Enrichment process completed - {total_enriched} posts processed")
         return {"success": True, "operation": "enrich", "posts_enriched": total_enriched}
         
     except Exception as e:
         raise EnrichmentError(f"Enrichment failed: {str(e)}", details={"competitors": [c['name'] for c in competitors]})
+    finally:
+        await saver.flush()
 
 
 async def _handle_enrich_raw(container: DIContainer, competitors: list, live_model: str, batch_model: str, batch_threshold: int, wait: bool) -> Optional[Dict[str, Any]]:
     """Handle enrichment of raw scraped data."""
+    saver = _ProcessedDataSaver(container.state_manager)
     try:
         total_enriched = 0
         for competitor in competitors:
@@ -244,19 +280,13 @@ async def _handle_enrich_raw(container: DIContainer, competitors: list, live_mod
                 final_posts = list(unique_posts_map.values())
                 
                 # Sort by publication date if available
-                posts_with_dates = [p for p in final_posts if p.get('publication_date') and p['publication_date'] != 'N/A']
-                posts_without_dates = [p for p in final_posts if not p.get('publication_date') or p['publication_date'] == 'N/A']
-                
                 try:
-                    from datetime import datetime
-                    posts_with_dates.sort(key=lambda x: datetime.strptime(x['publication_date'], '%Y-%m-%d'), reverse=True)
+                    final_sorted_posts = utils.sort_posts_by_date(final_posts)
                 except (ValueError, TypeError):
                     # If date parsing fails, don't sort
-                    pass
-                
-                final_sorted_posts = posts_with_dates + posts_without_dates
+                    final_sorted_posts = final_posts
                 
-                container.state_manager.save_processed_data(
+                await saver.save(
                     final_sorted_posts, 
                     competitor['name'], 
                     os.path.basename(latest_raw_filepath) if latest_raw_filepath else "raw_enrichment_merged.json"
@@ -264,11 +294,14 @@ async def _handle_enrich_raw(container: DIContainer, competitors: list, live_mod
                 total_enriched += len(enriched_posts)
                 logger.info(f"Enriched {len(enriched_posts)} new posts and merged with {len(processed_posts)} existing processed posts for '{competitor['name']}'")
 
+        await saver.flush()
         logger.info(f"Raw enrichment process completed - {total_enriched} posts processed")
         return {"success": True, "operation": "enrich_raw", "posts_enriched": total_enriched}
         
     except Exception as e:
         raise EnrichmentError(f"Raw enrichment failed: {str(e)}", details={"competitors": [c['name'] for c in competitors]})
+    finally:
+        await saver.flush()
 
 
 async def _handle_scrape_only(container: DIContainer, competitors: list, days: Optional[int], scrape_all: bool) -> Optional[Dict[str, Any]]:
@@ -305,6 +338,7 @@ async def _handle_scrape_only(container: DIContainer, competitors: list, days: O
 
 async def _handle_get_posts(container: DIContainer, competitors: list, days: Optional[int], scrape_all: bool, live_model: str, batch_model: str, batch_threshold: int, wait: bool) -> Optional[Dict[str, Any]]:
     """Handle full pipeline: scrape + enrich + save processed data."""
+    saver = _ProcessedDataSaver(container.state_manager)
     try:
         total_processed = 0
         for competitor in competitors:
@@ -340,12 +374,15 @@ async def _handle_get_posts(container: DIContainer, competitors: list, days: Opt
             
             # 4. Save processed data
             if final_posts:
-                container.state_manager.save_processed_data(final_posts, competitor['name'], os.path.basename(raw_filepath))
+                await saver.save(final_posts, competitor['name'], os.path.basename(raw_filepath))
                 total_processed += len(final_posts)
                 logger.info(f"Completed processing {len(final_posts)} posts for '{competitor['name']}'")
 
+        await saver.flush()
         logger.info(f"Full pipeline completed - {total_processed} posts processed")
         return {"success": True, "operation": "get_posts", "posts_processed": total_processed}
         
     except Exception as e:
-        raise ScrapingError(f"Full pipeline failed: {str(e)}", details={"competitors": [c['name'] for c in competitors]})
\ No newline at end of file
+        raise ScrapingError(f"Full pipeline failed: {str(e)}", details={"competitors": [c['name'] for c in competitors]})
+    finally:
+        await saver.flush()
\ No newline at end of file
@@ -4,4 +4,5 @@
 from .state_manager import StateManager
 from .json_adapter import JsonAdapter
 from .csv_adapter import CsvAdapter
+from .parquet_adapter import ParquetAdapter
 from .base_adapter import BaseAdapter
\ No newline at end of file
@@ -1,8 +1,14 @@
 # src/state_management/base_adapter.py
 # This file defines the abstract interface for all storage adapters.
 
+import sys
 from abc import ABC, abstractmethod
 
+# Canonical 'N/A' placeholder; loaded values are swapped for this object so later
+# comparisons against the literal hit CPython's identity fast path
+_NA = sys.intern('N/A')
+_PLACEHOLDER_FIELDS = ('summary', 'seo_keywords', 'funnel_stage', 'target_audience')
+
 class BaseAdapter(ABC):
     """
     Abstract Base Class for Storage Adapters.
@@ -10,6 +16,11 @@ class BaseAdapter(ABC):
     This class defines the 'contract' that all concrete storage adapters
     (e.g., CsvAdapter, SqliteAdapter) must follow.
     """
+    # Post fields the adapter persists; None means the whole post is stored
+    FIELDNAMES = None
+    # Buffer size for data file writes, so large saves need few write syscalls
+    WRITE_BUFFER_SIZE = 1024 * 1024
+
     @abstractmethod
     def save(self, posts, competitor_name, file_type, source_filename=None):
         """
@@ -33,4 +44,28 @@ class BaseAdapter(ABC):
             competitor_name (str): The name of the competitor being processed.
             file_type (str): The type of data to read ('raw' or 'processed').
         """
-        pass
\ No newline at end of file
+        pass
+
+    def iter_read(self, competitor_name, file_type):
+        """
+        Yields post dictionaries one at a time instead of building a list.
+
+        Adapters that can parse incrementally should override this; the default
+        simply iterates over the result of read().
+
+        Args:
+            competitor_name (str): The name of the competitor being processed.
+            file_type (str): The type of data to read ('raw' or 'processed').
+        """
+        yield from self.read(competitor_name, file_type)
+
+    @staticmethod
+    def intern_placeholders(post):
+        """
+        Replaces 'N/A' values in the enrichment fields of a freshly loaded post
+        with the interned 'N/A' string, and returns the post.
+        """
+        for field in _PLACEHOLDER_FIELDS:
+            if post.get(field) == _NA:
+                post[field] = _NA
+        return post
@@ -8,12 +8,25 @@ import logging
 from datetime import datetime
 from .base_adapter import BaseAdapter
 
+try:
+    # Optional: pyarrow's C++ CSV reader is used for state files when installed
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
 logger = logging.getLogger(__name__)
 
 class CsvAdapter(BaseAdapter):
     """
     A storage adapter for saving and managing scraped data in a .csv file.
     """
+    # Columns written to disk; anything else on a post is dropped on save
+    FIELDNAMES = ['title', 'publication_date', 'url', 'funnel_stage', 'seo_keywords', 'summary', 'headings', 'schemas', 'seo_meta_keywords', 'content']
+    # Positions of the columns stored as JSON strings
+    _JSON_FIELD_INDEXES = (FIELDNAMES.index('headings'), FIELDNAMES.index('schemas'))
+
     def save(self, posts, competitor_name, file_type, source_filename=None):
         """
         Saves the list of posts to a CSV file in the 'data/raw/' or 'data/processed/' directory.
@@ -36,23 +49,10 @@ class CsvAdapter(BaseAdapter):
             return None
 
         try:
-            fieldnames = ['title', 'publication_date', 'url', 'funnel_stage', 'seo_keywords', 'summary', 'headings', 'schemas', 'seo_meta_keywords', 'content']
-            
-            posts_to_write = []
-            for post in posts:
-                for field in ['headings', 'schemas']:
-                    if field in post and post[field]:
-                        # Convert the list of dictionaries to a JSON string
-                        post[field] = json.dumps(post[field])
-                    else:
-                        # Save as an empty JSON array if the field is missing or empty
-                        post[field] = '[]'
-                posts_to_write.append(post)
-
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
-                writer.writeheader()
-                writer.writerows(posts_to_write)
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=self.WRITE_BUFFER_SIZE) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(self.FIELDNAMES)
+                writer.writerows(self._encode_row(post) for post in posts)
             
             logger.info(f"Successfully saved {len(posts)} posts to: {filepath}")
             return filepath
@@ -60,31 +60,99 @@ class CsvAdapter(BaseAdapter):
             logger.error(f"Could not write to data file {filepath}: {e}")
             return None
 
+    @classmethod
+    def _encode_row(cls, post):
+        """
+        Returns the post's values in FIELDNAMES order, without modifying the post.
+        Lists of dicts (headings, schemas) are written as JSON strings, and as an
+        empty JSON array when missing or empty.
+        """
+        row = [post.get(field, '') for field in cls.FIELDNAMES]
+        for index in cls._JSON_FIELD_INDEXES:
+            row[index] = json.dumps(row[index]) if row[index] else '[]'
+        return row
+
     def read(self, competitor_name, file_type):
         """
         Reads all posts from a specific data directory (raw or processed) for a given competitor.
         """
+        posts = list(self.iter_read(competitor_name, file_type))
+        logger.info(f"Read {len(posts)} posts from the '{file_type}' directory for '{competitor_name}'.")
+        return posts
+
+    def iter_read(self, competitor_name, file_type):
+        """
+        Yields posts row by row from all CSV files in a specific data directory.
+        """
         input_folder = os.path.join('data', file_type, competitor_name)
-        posts = []
         
         if not os.path.isdir(input_folder):
             logger.warning(f"No '{file_type}' data found for '{competitor_name}'.")
-            return []
+            return
 
         for filename in os.listdir(input_folder):
             if filename.endswith('.csv'):
                 filepath = os.path.join(input_folder, filename)
                 try:
+                    if pa_csv is not None:
+                        posts = self._read_with_pyarrow(filepath)
+                        if posts is not None:
+                            for post in posts:
+                                yield self.intern_placeholders(post)
+                            continue
                     with open(filepath, mode='r', newline='', encoding='utf-8-sig') as f:
-                        reader = csv.DictReader(f)
-                        posts.extend(list(reader))
+                        yield from self._iter_rows(f)
                 except Exception as e:
                     logger.error(f"Could not read file {filepath}: {e}")
-        
-        logger.info(f"Read {len(posts)} posts from the '{file_type}' directory for '{competitor_name}'.")
-        return posts
     
 
+    @staticmethod
+    def _read_with_pyarrow(filepath):
+        """
+        Parses a CSV file with pyarrow's native reader.
+
+        Every column is read as a string so rows match what the csv module
+        produces. Returns None if pyarrow can't parse the file (e.g. ragged
+        rows), in which case the caller falls back to the csv module.
+        """
+        with open(filepath, mode='r', newline='', encoding='utf-8-sig') as f:
+            header = next(csv.reader(f), None)
+        if not header:
+            return []
+        try:
+            table = pa_csv.read_csv(
+                filepath,
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in header},
+                    strings_can_be_null=False,
+                ),
+            )
+        except (pa.ArrowInvalid, ValueError) as e:
+            logger.debug(f"pyarrow could not parse {filepath}, using csv module: {e}")
+            return None
+        return table.to_pylist()
+
+    @staticmethod
+    def _iter_rows(f):
+        """
+        Yields each CSV row as a dict keyed by the header row.
+
+        Equivalent to csv.DictReader (blank lines skipped, short rows padded with
+        None, extra values dropped) but builds each dict with a single zip.
+        """
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return
+        width = len(header)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row = row + [None] * (width - len(row))
+            yield BaseAdapter.intern_placeholders(dict(zip(header, row)))
+
     def read_urls(self, competitor_name, file_type):
         """
         Reads all post URLs from all CSV files in a specific data directory.
@@ -100,10 +168,16 @@ class CsvAdapter(BaseAdapter):
                 filepath = os.path.join(input_folder, filename)
                 try:
                     with open(filepath, mode='r', newline='', encoding='utf-8-sig') as f:
-                        reader = csv.DictReader(f)
+                        reader = csv.reader(f)
+                        header = next(reader, None)
+                        if not header or 'url' not in header:
+                            continue
+                        # Only the url column is needed, so read it by index
+                        # instead of building a dict for every row
+                        url_index = header.index('url')
                         for row in reader:
-                            if 'url' in row and row['url']:
-                                urls.add(row['url'])
+                            if len(row) > url_index and row[url_index]:
+                                urls.add(row[url_index])
                 except Exception as e:
                     logger.error(f"Could not read URLs from file {filepath}: {e}")
         
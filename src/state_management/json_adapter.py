@@ -37,7 +37,7 @@ class JsonAdapter(BaseAdapter):
             return None
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as jsonfile:
+            with open(filepath, 'w', encoding='utf-8', buffering=self.WRITE_BUFFER_SIZE) as jsonfile:
                 json.dump(posts, jsonfile, indent=4)
             
             logger.info(f"Successfully saved {len(posts)} posts to: {filepath}")
@@ -50,12 +50,19 @@ class JsonAdapter(BaseAdapter):
         """
         Reads all posts from a specific data directory (raw or processed) for a given competitor.
         """
+        posts = list(self.iter_read(competitor_name, file_type))
+        logger.info(f"Read {len(posts)} posts from the '{file_type}' directory for '{competitor_name}'.")
+        return posts
+
+    def iter_read(self, competitor_name, file_type):
+        """
+        Yields posts from all JSON files in a specific data directory, one file at a time.
+        """
         input_folder = os.path.join('data', file_type, competitor_name)
-        posts = []
         
         if not os.path.isdir(input_folder):
             logger.warning(f"No '{file_type}' data found for '{competitor_name}'.")
-            return []
+            return
 
         for filename in os.listdir(input_folder):
             if filename.endswith('.json'):
@@ -63,12 +70,11 @@ class JsonAdapter(BaseAdapter):
                 try:
                     with open(filepath, 'r', encoding='utf-8') as f:
                         data = json.load(f)
-                        posts.extend(data)
                 except Exception as e:
                     logger.error(f"Could not read file {filepath}: {e}")
-        
-        logger.info(f"Read {len(posts)} posts from the '{file_type}' directory for '{competitor_name}'.")
-        return posts
+                    continue
+                for post in data:
+                    yield self.intern_placeholders(post)
 
     def read_urls(self, competitor_name, file_type):
         """
@@ -0,0 +1,153 @@
+# src/state_management/parquet_adapter.py
+# This file contains the logic for saving data to a columnar Parquet file.
+
+import os
+import json
+import logging
+from datetime import datetime
+from .base_adapter import BaseAdapter
+
+try:
+    # Optional: only needed when storage.adapter is set to "parquet"
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# Schema metadata key listing the columns stored as JSON strings
+_JSON_COLUMNS_KEY = b'json_columns'
+
+class ParquetAdapter(BaseAdapter):
+    """
+    A storage adapter for saving and managing scraped data in .parquet files.
+
+    Nested fields (headings, schemas, strategic_analysis, metadata...) are stored
+    as JSON strings and decoded again on read, so posts round-trip unchanged.
+    """
+    def __init__(self):
+        if pq is None:
+            raise ImportError("The 'parquet' storage adapter requires pyarrow. Install it with 'pip install pyarrow'.")
+
+    def save(self, posts, competitor_name, file_type, source_filename=None):
+        """
+        Saves the list of posts to a Parquet file in the 'data/raw/' or 'data/processed/' directory.
+        """
+        if not posts:
+            logger.warning(f"No posts provided to save for {competitor_name}.")
+            return None
+
+        output_folder = os.path.join('data', file_type, competitor_name)
+        os.makedirs(output_folder, exist_ok=True)
+
+        # Use a consistent filename based on the type
+        if file_type == 'raw':
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            filepath = os.path.join(output_folder, f"{competitor_name}_{timestamp}.parquet")
+        elif file_type == 'processed' and source_filename:
+            base_filename = os.path.splitext(os.path.basename(source_filename))[0]
+            filepath = os.path.join(output_folder, f"{base_filename}.parquet")
+        else:
+            logger.error(f"Invalid file_type '{file_type}' or missing source_filename for processed data.")
+            return None
+
+        try:
+            rows, json_columns = self._encode_posts(posts)
+            table = pa.Table.from_pylist(rows)
+            table = table.replace_schema_metadata({_JSON_COLUMNS_KEY: json.dumps(sorted(json_columns))})
+            pq.write_table(table, filepath)
+
+            logger.info(f"Successfully saved {len(posts)} posts to: {filepath}")
+            return filepath
+        except (IOError, pa.ArrowException) as e:
+            logger.error(f"Could not write to data file {filepath}: {e}")
+            return None
+
+    def read(self, competitor_name, file_type):
+        """
+        Reads all posts from a specific data directory (raw or processed) for a given competitor.
+        """
+        posts = list(self.iter_read(competitor_name, file_type))
+        logger.info(f"Read {len(posts)} posts from the '{file_type}' directory for '{competitor_name}'.")
+        return posts
+
+    def iter_read(self, competitor_name, file_type):
+        """
+        Yields posts from all Parquet files in a specific data directory, one file at a time.
+        """
+        input_folder = os.path.join('data', file_type, competitor_name)
+
+        if not os.path.isdir(input_folder):
+            logger.warning(f"No '{file_type}' data found for '{competitor_name}'.")
+            return
+
+        for filename in os.listdir(input_folder):
+            if filename.endswith('.parquet'):
+                filepath = os.path.join(input_folder, filename)
+                try:
+                    table = pq.read_table(filepath)
+                except Exception as e:
+                    logger.error(f"Could not read file {filepath}: {e}")
+                    continue
+                for post in self._decode_table(table):
+                    yield self.intern_placeholders(post)
+
+    def read_urls(self, competitor_name, file_type):
+        """
+        Reads all post URLs from all Parquet files in a specific data directory.
+        Only the url column is loaded from disk.
+        """
+        input_folder = os.path.join('data', file_type, competitor_name)
+        urls = set()
+
+        if not os.path.isdir(input_folder):
+            return urls
+
+        for filename in os.listdir(input_folder):
+            if filename.endswith('.parquet'):
+                filepath = os.path.join(input_folder, filename)
+                try:
+                    if 'url' not in pq.read_schema(filepath).names:
+                        continue
+                    column = pq.read_table(filepath, columns=['url']).column('url')
+                    urls.update(url for url in column.to_pylist() if url)
+                except Exception as e:
+                    logger.error(f"Could not read URLs from file {filepath}: {e}")
+
+        logger.info(f"Found {len(urls)} existing URLs in the '{file_type}' directory for '{competitor_name}'.")
+        return urls
+
+    @staticmethod
+    def _encode_posts(posts):
+        """
+        Returns (rows, json_columns): copies of the posts where every column that
+        holds a list or dict in any post is serialised to JSON strings.
+        """
+        json_columns = {
+            key for post in posts for key, value in post.items() if isinstance(value, (list, dict))
+        }
+        rows = []
+        for post in posts:
+            row = dict(post)
+            for key in json_columns:
+                if row.get(key) is not None:
+                    row[key] = json.dumps(row[key])
+            rows.append(row)
+        return rows, json_columns
+
+    @staticmethod
+    def _decode_table(table):
+        """
+        Converts a table back to post dicts, decoding the JSON-encoded columns.
+        Columns a post didn't have (null in the table) are left out of its dict.
+        """
+        metadata = table.schema.metadata or {}
+        json_columns = json.loads(metadata.get(_JSON_COLUMNS_KEY, b'[]'))
+        for row in table.to_pylist():
+            post = {key: value for key, value in row.items() if value is not None}
+            for key in json_columns:
+                if key in post:
+                    post[key] = json.loads(post[key])
+            yield post
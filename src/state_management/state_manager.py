@@ -1,13 +1,20 @@
 # src/state_management/state_manager.py
 # This module contains the centralized manager for all data persistence.
 import os
+import json
 import logging
 from .json_adapter import JsonAdapter
 from .csv_adapter import CsvAdapter
+from .parquet_adapter import ParquetAdapter
 from .base_adapter import BaseAdapter
+from src.models import PostModel
 
 logger = logging.getLogger(__name__)
 
+# Sidecar in each processed-data directory recording, per data file, how many
+# posts still need enrichment (no .json/.csv suffix so adapters never read it)
+STATS_FILENAME = 'enrichment.stats'
+
 class StateManager:
     """
     A centralized manager that handles all data persistence for the ETL pipeline.
@@ -16,6 +23,8 @@ class StateManager:
     def __init__(self, config):
         adapter_name = config.get('storage', {}).get('adapter', 'csv')
         self.adapter = self._get_adapter(adapter_name)
+        # (competitor_name, file_type) -> (directory signature, posts)
+        self._load_cache = {}
 
     def _get_adapter(self, adapter_name) -> BaseAdapter:
         """
@@ -25,6 +34,9 @@ class StateManager:
             return CsvAdapter()
         elif adapter_name == "json":
             return JsonAdapter()
+        elif adapter_name == "parquet":
+            # Requires the optional pyarrow dependency
+            return ParquetAdapter()
         # Add a new adapter here when you need to switch storage
         # elif adapter_name == "gsheets":
         #    return GoogleSheetsAdapter()
@@ -33,19 +45,135 @@ class StateManager:
 
     def save_raw_data(self, posts, competitor_name):
         """Saves raw scraped data."""
+        self._invalidate(competitor_name, 'raw')
         return self.adapter.save(posts, competitor_name, file_type='raw')
 
     def save_processed_data(self, posts, competitor_name, source_filename):
-        """Saves final, enriched data."""
-        return self.adapter.save(posts, competitor_name, file_type='processed', source_filename=source_filename)
+        """Saves final, enriched data and records its enrichment stats."""
+        self._invalidate(competitor_name, 'processed')
+        filepath = self.adapter.save(posts, competitor_name, file_type='processed', source_filename=source_filename)
+        if filepath:
+            self._update_enrichment_stats(filepath, posts)
+        return filepath
+
+    def is_fully_enriched(self, competitor_name):
+        """
+        Returns True when the stats sidecar proves that no processed post for the
+        competitor needs enrichment, without reading the data files. Returns False
+        whenever that can't be proven (missing/stale stats, unknown files).
+        """
+        data_dir = os.path.join('data', 'processed', competitor_name)
+        stats = self._read_enrichment_stats(os.path.join(data_dir, STATS_FILENAME))
+        if not stats:
+            return False
+        
+        try:
+            with os.scandir(data_dir) as entries:
+                data_files = [entry for entry in entries if entry.is_file() and entry.name != STATS_FILENAME]
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        if not data_files:
+            return False
+        
+        for entry in data_files:
+            file_stats = stats.get(entry.name)
+            stat = entry.stat()
+            if (not file_stats
+                    or file_stats.get('mtime_ns') != stat.st_mtime_ns
+                    or file_stats.get('size') != stat.st_size
+                    or file_stats.get('needs_enrichment') != 0):
+                return False
+        return True
+
+    def _update_enrichment_stats(self, filepath, posts):
+        """Records how many of the saved posts still need enrichment, as they were persisted."""
+        stats_path = os.path.join(os.path.dirname(filepath), STATS_FILENAME)
+        fields = self.adapter.FIELDNAMES
+        needs_enrichment = 0
+        for post in posts:
+            # Judge the post by what the adapter actually stored
+            stored = post if fields is None else {field: post.get(field) for field in fields}
+            if PostModel.missing_enrichment_mask(stored):
+                needs_enrichment += 1
+        
+        try:
+            stat = os.stat(filepath)
+            stats = self._read_enrichment_stats(stats_path)
+            stats[os.path.basename(filepath)] = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'needs_enrichment': needs_enrichment,
+            }
+            with open(stats_path, 'w', encoding='utf-8') as f:
+                json.dump(stats, f)
+        except OSError as e:
+            # The sidecar is only an optimisation; discovery falls back to a full read
+            logger.warning(f"Could not update enrichment stats at {stats_path}: {e}")
+
+    @staticmethod
+    def _read_enrichment_stats(stats_path):
+        """Loads the stats sidecar, returning an empty dict if it is missing or unreadable."""
+        try:
+            with open(stats_path, 'r', encoding='utf-8') as f:
+                stats = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return stats if isinstance(stats, dict) else {}
         
     def load_raw_data(self, competitor_name):
         """Loads all raw scraped data."""
-        return self.adapter.read(competitor_name, file_type='raw')
+        return self._cached_read(competitor_name, 'raw')
 
     def load_processed_data(self, competitor_name):
         """Loads all processed data."""
-        return self.adapter.read(competitor_name, file_type='processed')
+        return self._cached_read(competitor_name, 'processed')
+
+    def iter_processed_data(self, competitor_name):
+        """Streams processed posts one at a time without materialising the whole state."""
+        signature = self._data_signature(competitor_name, 'processed')
+        cached = self._load_cache.get((competitor_name, 'processed'))
+        if cached is not None and signature is not None and cached[0] == signature:
+            return iter(cached[1])
+        return self.adapter.iter_read(competitor_name, file_type='processed')
+    
+    def _cached_read(self, competitor_name, file_type):
+        """
+        Reads posts through the adapter, reusing the previous result while the
+        files in the data directory are unchanged (same names, mtimes and sizes).
+        A fresh list is returned each time so callers can reorder or extend it.
+        """
+        key = (competitor_name, file_type)
+        signature = self._data_signature(competitor_name, file_type)
+        cached = self._load_cache.get(key)
+        if cached is not None and signature is not None and cached[0] == signature:
+            logger.debug(f"Using cached '{file_type}' data for '{competitor_name}'")
+            return list(cached[1])
+        
+        posts = self.adapter.read(competitor_name, file_type=file_type)
+        if signature is not None:
+            self._load_cache[key] = (signature, posts)
+        return list(posts)
+
+    def _invalidate(self, competitor_name, file_type):
+        """Drops any cached read for the given competitor and data type."""
+        self._load_cache.pop((competitor_name, file_type), None)
+
+    @staticmethod
+    def _data_signature(competitor_name, file_type):
+        """
+        Returns a hashable snapshot of the files in a data directory, or None
+        if the directory doesn't exist.
+        """
+        data_dir = os.path.join('data', file_type, competitor_name)
+        try:
+            with os.scandir(data_dir) as entries:
+                return tuple(sorted(
+                    (entry.name, stat.st_mtime_ns, stat.st_size)
+                    for entry in entries if entry.is_file()
+                    for stat in (entry.stat(),)
+                ))
+        except (FileNotFoundError, NotADirectoryError):
+            return None
     
     def load_raw_urls(self, competitor_name):
         """Loads all post URLs from the raw data files."""
@@ -1,12 +1,16 @@
 # src/transform/batch_manager.py
 # This file contains the high-level logic for managing Gemini Batch jobs.
 
+import io
 import os
 import json
+import mmap
 import logging
 import asyncio
 import time
 import csv
+import uuid
+import shutil
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
@@ -19,14 +23,27 @@ from src.exceptions import BatchJobError
 
 logger = logging.getLogger(__name__)
 
+# Raw posts are written to JSONL through a 64 KB buffer, this many lines per write
+RAW_POSTS_WRITE_BUFFER = 64 * 1024
+RAW_POSTS_WRITE_BATCH = 256
+
+# CSV source and chunk files are read through a buffer of this size
+CSV_READ_BUFFER = 64 * 1024
+
+# Enrichment fields copied from a batch result onto its original post
+MERGED_ENRICHMENT_FIELDS = ('summary', 'seo_keywords', 'funnel_stage')
+
 class BatchJobManager:
     """
     Manages the entire lifecycle of one or more Gemini Batch jobs, from
     submission to result processing.
     """
-    def __init__(self, app_config: Dict[str, Any]):
-        self.api_connector = GeminiAPIConnector()
-        self.state_manager = StateManager(app_config)
+    def __init__(self, app_config: Dict[str, Any], state_manager: Optional[StateManager] = None,
+                 api_connector: Optional[GeminiAPIConnector] = None):
+        # The connector and state manager are built once per manager and reused by
+        # every job; the DI container passes in its shared instances
+        self.api_connector = api_connector if api_connector is not None else GeminiAPIConnector()
+        self.state_manager = state_manager if state_manager is not None else StateManager(app_config)
     
     async def submit_new_jobs(self, competitor, posts, batch_model, app_config, source_raw_filepath, wait):
         """
@@ -34,6 +51,9 @@ class BatchJobManager:
         """
         competitor_name = competitor['name']
         workspace_folder = os.path.join('workspace', competitor_name)
+        # Each submission keeps its chunk files in its own folder, so cleanup
+        # can remove them all at once
+        batch_folder_name = uuid.uuid4().hex
         
         post_chunks = self._split_posts_into_chunks(posts)
 
@@ -48,12 +68,13 @@ class BatchJobManager:
             if job_id:
                 unsubmitted_path = self._save_raw_posts(chunk, competitor_name, chunk_num=i+1)
                 if not unsubmitted_path: continue
-                submitted_path = os.path.join(workspace_folder, f"temp_posts_chunk_{i+1}.jsonl")
-                os.rename(unsubmitted_path, submitted_path)
+                raw_posts_file = os.path.join(batch_folder_name, f"temp_posts_chunk_{i+1}.jsonl")
+                os.makedirs(os.path.join(workspace_folder, batch_folder_name), exist_ok=True)
+                os.rename(unsubmitted_path, os.path.join(workspace_folder, raw_posts_file))
                 
                 job_tracking_list.append({
                     "job_id": job_id,
-                    "raw_posts_file": os.path.basename(submitted_path),
+                    "raw_posts_file": raw_posts_file,
                     "num_posts": len(chunk)
                 })
             else:
@@ -100,7 +121,7 @@ class BatchJobManager:
                 logger.error(f"Could not read pending jobs file for '{name}'. Skipping.")
                 raise BatchJobError(f"Failed to read pending jobs: {str(e)}", details={"competitor": name})
 
-            statuses = self._poll_job_statuses(pending_jobs)
+            statuses = await self._poll_job_statuses(pending_jobs)
             summary_message, all_succeeded = utils.get_job_status_summary(statuses)
             
             logger.info(f"--- Status for '{name}': {len(pending_jobs)} job(s) ---")
@@ -139,15 +160,49 @@ class BatchJobManager:
             filename = f"unsubmitted_posts_chunk_{chunk_num}.jsonl" if chunk_num else "unsubmitted_posts.jsonl"
             raw_posts_file_path = os.path.join(workspace_folder, filename)
             
-            with open(raw_posts_file_path, "w") as f:
-                for post in posts:
-                    f.write(json.dumps(post) + "\n")
+            with open(raw_posts_file_path, "wb", buffering=RAW_POSTS_WRITE_BUFFER) as f:
+                for start in range(0, len(posts), RAW_POSTS_WRITE_BATCH):
+                    # default=dict flattens chunked posts (ChainMap overlays)
+                    f.write(b"".join(
+                        utils.json_dumps_bytes(post, default=dict) + b"\n"
+                        for post in posts[start:start + RAW_POSTS_WRITE_BATCH]
+                    ))
             logger.info(f"Saved {len(posts)} raw posts to '{os.path.basename(raw_posts_file_path)}' for later processing.")
             return raw_posts_file_path
         except IOError as e:
             logger.error(f"Could not save raw posts to file: {e}")
             return None
 
+    @staticmethod
+    def _read_csv(filepath):
+        """Reads a CSV file into a list of dicts keyed by its header row."""
+        with open(filepath, mode='r', newline='', encoding='utf-8', buffering=CSV_READ_BUFFER) as f:
+            return list(csv.DictReader(f))
+
+    @staticmethod
+    def _read_jsonl(filepath):
+        """
+        Reads a JSONL file into a list of dicts. The file is memory-mapped and
+        each line is parsed straight from the mapping, without line-by-line reads.
+        """
+        with open(filepath, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError, io.UnsupportedOperation):
+                # Empty files can't be mapped; fall back to reading lines
+                return [utils.json_loads(line) for line in f]
+
+            with mapped:
+                posts = []
+                pos, size = 0, len(mapped)
+                while pos < size:
+                    end = mapped.find(b"\n", pos)
+                    if end == -1:
+                        end = size
+                    posts.append(utils.json_loads(mapped[pos:end]))
+                    pos = end + 1
+                return posts
+
     def _split_posts_into_chunks(self, posts, max_size_mb=95):
         """
         Splits a list of posts into chunks, ensuring the estimated size of each
@@ -159,7 +214,8 @@ class BatchJobManager:
         current_size = 0
 
         for post in posts:
-            post_size = len(json.dumps(post).encode('utf-8')) + 1
+            # The exact size of the line _save_raw_posts will write for this post
+            post_size = len(utils.json_dumps_bytes(post, default=dict)) + 1
 
             if current_size + post_size > max_size_bytes and current_chunk:
                 chunks.append(current_chunk)
@@ -186,8 +242,12 @@ class BatchJobManager:
                 "jobs": job_tracking_list
             }
 
-            with open(jobs_file_path, "w") as f:
-                json.dump(data_to_save, f, indent=4)
+            # Write to a temporary file and swap it in, so an interrupted write
+            # never leaves a truncated pending_jobs.json behind
+            temp_file_path = f"{jobs_file_path}.tmp"
+            with open(temp_file_path, "wb") as f:
+                f.write(utils.json_dumps_bytes(data_to_save))
+            os.replace(temp_file_path, jobs_file_path)
             logger.info(f"Saved {len(job_tracking_list)} pending job(s) to '{jobs_file_path}'")
         except IOError as e:
             logger.error(f"Could not save pending jobs file: {e}")
@@ -209,29 +269,59 @@ class BatchJobManager:
         except (KeyboardInterrupt, EOFError):
             logger.info("\nExiting.")
 
-    def _poll_job_statuses(self, pending_jobs):
-        """Polls the API for the status of each job in the list."""
-        statuses = []
-        for job_info in pending_jobs:
-            status = self.api_connector.check_batch_job(job_info['job_id'], verbose=False)
-            statuses.append(status)
-        return statuses
+    async def _poll_job_statuses(self, pending_jobs):
+        """
+        Polls the API for the status of each job in the list. The status calls
+        block on the network, so they run concurrently in worker threads.
+        """
+        return await asyncio.gather(*(
+            asyncio.to_thread(self.api_connector.check_batch_job, job_info['job_id'], verbose=False)
+            for job_info in pending_jobs
+        ))
 
     def _cleanup_workspace(self, competitor, pending_jobs):
-        """Deletes all temporary files after processing is complete."""
+        """
+        Deletes all temporary files after processing is complete.
+        
+        Chunk files live in one folder per submission (recorded as the folder
+        part of each raw_posts_file), which is removed as a whole. Jobs saved
+        before that layout keep their chunk files directly in the workspace
+        and are removed one by one.
+        """
         name = competitor['name']
         workspace_folder = os.path.join('workspace', name)
         jobs_file_path = os.path.join(workspace_folder, "pending_jobs.json")
 
+        batch_folders = set()
         for job_info in pending_jobs:
+            batch_folder_name = os.path.dirname(job_info['raw_posts_file'])
+            if batch_folder_name:
+                batch_folders.add(batch_folder_name)
+                continue
             raw_posts_file_path = os.path.join(workspace_folder, job_info['raw_posts_file'])
             if os.path.exists(raw_posts_file_path):
                 os.remove(raw_posts_file_path)
+
+        for batch_folder_name in batch_folders:
+            shutil.rmtree(os.path.join(workspace_folder, batch_folder_name), ignore_errors=True)
         
         os.remove(jobs_file_path)
         logger.info(f"Cleaned up all temporary files for '{name}'.")
 
 
+    def _download_job_results(self, workspace_folder, job_info):
+        """Loads a job's unsubmitted posts from the workspace and downloads its results."""
+        raw_posts_file_path = os.path.join(workspace_folder, job_info['raw_posts_file'])
+
+        original_posts_chunk = None
+        if os.path.exists(raw_posts_file_path):
+            if raw_posts_file_path.endswith('.jsonl'):
+                original_posts_chunk = self._read_jsonl(raw_posts_file_path)
+            elif raw_posts_file_path.endswith('.csv'):
+                original_posts_chunk = self._read_csv(raw_posts_file_path)
+
+        return self.api_connector.download_batch_results(job_info['job_id'], original_posts_chunk)
+
     async def consolidate_results(self, competitor: Dict[str, Any], pending_jobs: List[Dict[str, Any]], app_config: Dict[str, Any], source_raw_filepath: Optional[str]) -> List[Dict[str, Any]]:
         """
         Downloads results for all successful jobs, consolidates them, and updates the state file.
@@ -256,21 +346,14 @@ class BatchJobManager:
             total_posts = sum(job.get('num_posts', 0) for job in pending_jobs)
             start_time = time.time()
 
-            for job_info in pending_jobs:
-                job_id = job_info['job_id']
-                raw_posts_file_path = os.path.join(workspace_folder, job_info['raw_posts_file'])
-                
-                original_posts_chunk = None
-                if os.path.exists(raw_posts_file_path):
-                    if raw_posts_file_path.endswith('.jsonl'):
-                        with open(raw_posts_file_path, "r") as f:
-                            original_posts_chunk = [json.loads(line) for line in f]
-                    elif raw_posts_file_path.endswith('.csv'):
-                        with open(raw_posts_file_path, mode='r', newline='', encoding='utf-8') as f:
-                            reader = csv.DictReader(f)
-                            original_posts_chunk = list(reader)
-
-                chunk_results = self.api_connector.download_batch_results(job_id, original_posts_chunk)
+            # Downloads block on the network, so they run in worker threads, a few at a time
+            semaphore = asyncio.Semaphore(utils.get_batch_enrichment_config().get('max_concurrent_downloads', 4))
+
+            async def download(job_info):
+                async with semaphore:
+                    return await asyncio.to_thread(self._download_job_results, workspace_folder, job_info)
+
+            for chunk_results in await asyncio.gather(*(download(job_info) for job_info in pending_jobs)):
                 all_enriched_posts.extend(chunk_results)
 
             job_duration = time.time() - start_time
@@ -281,35 +364,25 @@ class BatchJobManager:
                 return []
 
             # Load the original raw data from the saved source file
-            original_posts_map = {}
             original_posts_from_file = []
             if source_raw_filepath and os.path.exists(source_raw_filepath):
                 if source_raw_filepath.endswith('.json'):
-                    with open(source_raw_filepath, 'r', encoding='utf-8') as f:
-                        original_posts_from_file = json.load(f)
+                    with open(source_raw_filepath, 'rb') as f:
+                        original_posts_from_file = utils.json_loads(f.read())
                 elif source_raw_filepath.endswith('.csv'):
-                    with open(source_raw_filepath, mode='r', newline='', encoding='utf-8') as f:
-                        reader = csv.DictReader(f)
-                        original_posts_from_file = list(reader)
+                    original_posts_from_file = self._read_csv(source_raw_filepath)
 
-                for post in original_posts_from_file:
-                    original_posts_map[post['url']] = post
+                original_posts_map = {post['url']: post for post in original_posts_from_file}
             else:
                 logger.warning(f"Could not find the original source file at {source_raw_filepath}. Reconstructing data.")
-                for post in all_enriched_posts:
-                    if 'url' in post:
-                        original_posts_map[post['url']] = post
-            
-            # Merge enriched data with original posts
+                original_posts_map = {post['url']: post for post in all_enriched_posts if 'url' in post}
+
+            # Merge enriched data into the original posts with one lookup per result
             for enriched_post in all_enriched_posts:
-                original_url = enriched_post.get('url')
-                if original_url in original_posts_map:
-                    original_posts_map[original_url].update({
-                        'summary': enriched_post.get('summary', 'N/A'),
-                        'seo_keywords': enriched_post.get('seo_keywords', 'N/A'),
-                        'funnel_stage': enriched_post.get('funnel_stage', 'N/A')
-                    })
-            
+                original_post = original_posts_map.get(enriched_post.get('url'))
+                if original_post is not None:
+                    original_post.update({field: enriched_post.get(field, 'N/A') for field in MERGED_ENRICHMENT_FIELDS})
+
             final_posts = list(original_posts_map.values())
 
             # Save the consolidated results with proper naming
@@ -1,13 +1,69 @@
 # src/transform/content_preprocessor.py
 # Content preprocessing utilities for API consumption
 
+import functools
 import logging
+import os
+import pickle
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import ChainMap, Counter, defaultdict
 from typing import List, Dict, Any, Tuple
 from src import utils
 
 logger = logging.getLogger(__name__)
 
+# Below this many posts the serial path wins over process start-up costs
+_PARALLEL_THRESHOLD = 256
+_PARALLEL_BATCH_SIZE = 64
+
+# ASCII lookup for the printable-character filter: 1 = keep, 0 = drop
+_ASCII_PRINTABLE = bytes(1 if chr(i).isprintable() or chr(i) in '\n\t' else 0 for i in range(128))
+_ASCII_NONPRINTABLE_DELETE = {i: None for i in range(128) if not _ASCII_PRINTABLE[i]}
+
+# Typographic characters replaced in one str.translate pass by _clean_content
+_CHAR_REPLACEMENTS = str.maketrans({
+    '\u2018': "'",    # Left single quotation mark
+    '\u2019': "'",    # Right single quotation mark
+    '\u201c': '"',    # Left double quotation mark
+    '\u201d': '"',    # Right double quotation mark
+    '\u2014': ' - ',  # Em dash (with spaces for better readability)
+    '\u2013': '-',    # En dash
+    '\u2026': '...',  # Horizontal ellipsis
+    '\u00a0': ' ',    # Non-breaking space
+    '\u200b': '',     # Zero-width space
+})
+_WHITESPACE_RE = re.compile(r'\s+')
+_HTML_ENTITY_RE = re.compile(r'&[a-zA-Z0-9#]+;')
+
+# A sentence ending followed by the start of the next sentence, for chunk breaks
+_SENTENCE_END_RE = re.compile(r'[.!?]\s+[A-Z]')
+
+# Short strings (boilerplate, continuation markers, repeated snippets) are
+# cleaned through an LRU cache; longer bodies bypass it to bound memory
+_CLEAN_CACHE_MAX_LENGTH = 8192
+_CLEAN_CACHE_SIZE = 1024
+
+def _clean_text(content: str) -> str:
+    """Applies the _clean_content replacements and filters to a non-empty string."""
+    # Replace smart quotes and other problematic Unicode characters, then
+    # collapse whitespace and drop HTML entities that might have been missed
+    cleaned = _WHITESPACE_RE.sub(' ', content.translate(_CHAR_REPLACEMENTS))
+    cleaned = _HTML_ENTITY_RE.sub(' ', cleaned)
+    
+    # Remove any remaining non-printable characters. ASCII-only content (the
+    # common case) is filtered with a lookup table in C; isprintable() is only
+    # consulted per character when non-ASCII code points are present.
+    if cleaned.isascii():
+        cleaned = cleaned.translate(_ASCII_NONPRINTABLE_DELETE)
+    else:
+        cleaned = ''.join(char for char in cleaned if char.isprintable() or char in '\n\t')
+    
+    return cleaned.strip()
+
+_clean_text_cached = functools.lru_cache(maxsize=_CLEAN_CACHE_SIZE)(_clean_text)
+
 class ContentPreprocessor:
     """
     Handles content preprocessing for API consumption, including cleaning,
@@ -34,81 +90,16 @@ class ContentPreprocessor:
             posts: List of post dictionaries
             
         Returns:
-            List of processed post dictionaries, potentially with chunked posts
+            List of processed post dictionaries, potentially with chunked posts.
+            Chunked posts are ChainMap overlays over the original post; use
+            dict(post) where a plain dictionary is required.
         """
-        processed_posts = []
         max_content_length, chunk_size, chunk_overlap = cls._get_config_values()
         
-        for post in posts:
-            content = post.get('content', '')
-            title = post.get('title', 'Unknown Post')
-            
-            if not content or content == 'N/A':
-                processed_posts.append(post)
-                continue
-            
-            # Clean the content
-            cleaned_content = cls._clean_content(content)
-            
-            # Check if content needs chunking
-            if len(cleaned_content) <= max_content_length:
-                # Content fits in single request
-                processed_post = post.copy()
-                processed_post['content'] = cleaned_content
-                
-                # Initialize metadata structure if not present
-                if 'metadata' not in processed_post:
-                    processed_post['metadata'] = {}
-                    
-                # Calculate content metrics
-                word_count = len(cleaned_content.split())
-                reading_time_minutes = round(word_count / 225, 1)  # 225 words per minute average
-                
-                # Content structure analysis
-                structure_metrics = cls._analyze_content_structure(cleaned_content)
-                
-                processed_post['metadata']['content_processing'] = {
-                    'original_length': len(content),
-                    'processed_length': len(cleaned_content),
-                    'word_count': word_count,
-                    'reading_time_minutes': reading_time_minutes,
-                    'chunked': False,
-                    'cleaning_applied': cleaned_content != content,
-                    **structure_metrics
-                }
-                processed_posts.append(processed_post)
-            else:
-                # Content needs chunking
-                logger.info(f"Content for '{title}' ({len(cleaned_content)} chars) needs chunking")
-                chunks = cls._create_content_chunks(cleaned_content, title, chunk_size, chunk_overlap)
-                
-                for i, chunk in enumerate(chunks):
-                    chunk_post = post.copy()
-                    chunk_post['content'] = chunk
-                    chunk_post['title'] = f"{title} (Part {i+1}/{len(chunks)})"
-                    chunk_post['original_title'] = title
-                    chunk_post['chunk_index'] = i
-                    chunk_post['total_chunks'] = len(chunks)
-                    
-                    # Initialize metadata structure if not present
-                    if 'metadata' not in chunk_post:
-                        chunk_post['metadata'] = {}
-                    
-                    # Calculate metrics for this chunk
-                    chunk_word_count = len(chunk.split())
-                    chunk_reading_time = round(chunk_word_count / 225, 1)
-                    
-                    chunk_post['metadata']['content_processing'] = {
-                        'original_length': len(content),
-                        'chunk_length': len(chunk),
-                        'chunk_word_count': chunk_word_count,
-                        'chunk_reading_time_minutes': chunk_reading_time,
-                        'chunked': True,
-                        'chunk_number': i + 1,
-                        'total_chunks': len(chunks),
-                        'cleaning_applied': True
-                    }
-                    processed_posts.append(chunk_post)
+        if len(posts) >= _PARALLEL_THRESHOLD:
+            processed_posts = cls._prepare_posts_parallel(posts, max_content_length, chunk_size, chunk_overlap)
+        else:
+            processed_posts = _process_batch(posts, max_content_length, chunk_size, chunk_overlap)
         
         original_count = len(posts)
         processed_count = len(processed_posts)
@@ -119,51 +110,153 @@ class ContentPreprocessor:
         return processed_posts
     
     @classmethod
-    def _clean_content(cls, content: str) -> str:
+    def _prepare_posts_parallel(cls, posts: List[Dict[str, Any]], max_content_length: int,
+                                chunk_size: int, chunk_overlap: int) -> List[Dict[str, Any]]:
         """
-        Cleans content by removing or replacing problematic characters.
+        Preprocesses posts in batches across a process pool.
+        
+        Posts are independent of each other, so cleaning and chunking can run
+        outside the GIL. Falls back to the serial path if the pool can't be used.
         
         Args:
-            content: Raw content string
+            posts: List of post dictionaries
+            max_content_length: Maximum content length before chunking
+            chunk_size: Target size of each chunk
+            chunk_overlap: Characters of overlap between chunks
             
         Returns:
-            Cleaned content string
+            List of processed post dictionaries, in input order
         """
-        if not content:
-            return content
-            
-        cleaned = content
+        batches = [posts[i:i + _PARALLEL_BATCH_SIZE] for i in range(0, len(posts), _PARALLEL_BATCH_SIZE)]
+        n = len(batches)
+        try:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = executor.map(
+                    _process_batch, batches,
+                    [max_content_length] * n, [chunk_size] * n, [chunk_overlap] * n
+                )
+                processed_posts = []
+                for batch_result in results:
+                    processed_posts.extend(batch_result)
+                return processed_posts
+        except (OSError, BrokenProcessPool, pickle.PicklingError) as e:
+            logger.warning(f"Parallel preprocessing unavailable ({e}); falling back to serial processing")
+            return _process_batch(posts, max_content_length, chunk_size, chunk_overlap)
+    
+    @classmethod
+    def _prepare_post(cls, post: Dict[str, Any], max_content_length: int,
+                      chunk_size: int, chunk_overlap: int) -> List[Dict[str, Any]]:
+        """
+        Cleans a single post and splits it into chunks if needed.
         
-        # Replace smart quotes and other problematic Unicode characters
-        char_replacements = {
-            ''': "'",    # Left single quotation mark
-            ''': "'",    # Right single quotation mark
-            '"': '"',    # Left double quotation mark  
-            '"': '"',    # Right double quotation mark
-            '—': ' - ',  # Em dash (with spaces for better readability)
-            '–': '-',    # En dash
-            '…': '...',  # Horizontal ellipsis
-            '\u00a0': ' ',  # Non-breaking space
-            '\u200b': '',   # Zero-width space
-            '\u2019': "'",  # Right single quotation mark (alternative)
-            '\u201c': '"',  # Left double quotation mark (alternative)
-            '\u201d': '"',  # Right double quotation mark (alternative)
-        }
+        Args:
+            post: Post dictionary
+            max_content_length: Maximum content length before chunking
+            chunk_size: Target size of each chunk
+            chunk_overlap: Characters of overlap between chunks
+            
+        Returns:
+            List with the processed post, or one entry per chunk
+        """
+        processed_posts = []
+        content = post.get('content', '')
+        title = post.get('title', 'Unknown Post')
         
-        for old_char, new_char in char_replacements.items():
-            cleaned = cleaned.replace(old_char, new_char)
+        if not content or content == 'N/A':
+            return [post]
         
-        # Remove or replace other problematic patterns
-        # Remove excessive whitespace
-        cleaned = re.sub(r'\s+', ' ', cleaned)
+        # Clean the content
+        cleaned_content = cls._clean_content(content)
+        orig_len = len(content)
+        clean_len = len(cleaned_content)
+        # Length check first: the full string compare only runs when lengths match
+        was_cleaned = clean_len != orig_len or cleaned_content != content
         
-        # Remove HTML entities that might have been missed
-        cleaned = re.sub(r'&[a-zA-Z0-9#]+;', ' ', cleaned)
+        # Check if content needs chunking
+        if clean_len <= max_content_length:
+            # Content fits in single request
+            processed_post = post.copy()
+            processed_post['content'] = cleaned_content
+            
+            # Initialize metadata structure if not present
+            if 'metadata' not in processed_post:
+                processed_post['metadata'] = {}
+                
+            # Calculate content metrics
+            word_count = len(cleaned_content.split())
+            reading_time_minutes = round(word_count / 225, 1)  # 225 words per minute average
+            
+            # Content structure analysis
+            structure_metrics = cls._analyze_content_structure(cleaned_content)
+            
+            processed_post['metadata']['content_processing'] = {
+                'original_length': orig_len,
+                'processed_length': clean_len,
+                'word_count': word_count,
+                'reading_time_minutes': reading_time_minutes,
+                'chunked': False,
+                'cleaning_applied': was_cleaned,
+                **structure_metrics
+            }
+            return [processed_post]
+        else:
+            # Content needs chunking
+            logger.info(f"Content for '{title}' ({clean_len} chars) needs chunking")
+            chunks = cls._create_content_chunks(cleaned_content, title, chunk_size, chunk_overlap)
+            total_chunks = len(chunks)
+            
+            # Fields shared by every chunk of this post are computed once and
+            # merged into each chunk's processing info
+            post_metadata = post.get('metadata', {})
+            processing_base = {
+                'original_length': orig_len,
+                'chunked': True,
+                'total_chunks': total_chunks,
+                'cleaning_applied': True
+            }
+            
+            for i, chunk in enumerate(chunks):
+                # Calculate metrics for this chunk
+                chunk_word_count = len(chunk.split())
+                
+                # Only the chunk-specific fields live in the overlay; the rest of the
+                # original post (url, date, headings, ...) is shared, not copied.
+                processed_posts.append(ChainMap({
+                    'content': chunk,
+                    'title': f"{title} (Part {i+1}/{total_chunks})",
+                    'original_title': title,
+                    'chunk_index': i,
+                    'total_chunks': total_chunks,
+                    'metadata': {
+                        **post_metadata,
+                        'content_processing': {
+                            **processing_base,
+                            'chunk_length': len(chunk),
+                            'chunk_word_count': chunk_word_count,
+                            'chunk_reading_time_minutes': round(chunk_word_count / 225, 1),
+                            'chunk_number': i + 1
+                        }
+                    }
+                }, post))
         
-        # Remove any remaining non-printable characters
-        cleaned = ''.join(char for char in cleaned if char.isprintable() or char in '\n\t')
+        return processed_posts
+    
+    @classmethod
+    def _clean_content(cls, content: str) -> str:
+        """
+        Cleans content by removing or replacing problematic characters.
         
-        return cleaned.strip()
+        Args:
+            content: Raw content string
+            
+        Returns:
+            Cleaned content string
+        """
+        if not content:
+            return content
+        if len(content) < _CLEAN_CACHE_MAX_LENGTH:
+            return _clean_text_cached(content)
+        return _clean_text(content)
     
     @classmethod
     def _analyze_content_structure(cls, content: str) -> Dict[str, Any]:
@@ -245,27 +338,24 @@ class ContentPreprocessor:
             
             # Try to find a good break point (sentence ending)
             if chunk_end < len(content):
-                # Look for sentence endings within the last 20% of the chunk
+                # Use the last sentence ending within the last 20% of the chunk,
+                # looking a bit ahead. The search runs on the content in place
+                # (pos/endpos) rather than on a copied slice of it.
                 search_start = max(current_pos + int(chunk_size * 0.8), current_pos + 500)
-                search_area = content[search_start:chunk_end + 100]  # Look a bit ahead
+                last_match = None
+                for last_match in _SENTENCE_END_RE.finditer(content, search_start, chunk_end + 100):
+                    pass
                 
-                # Find sentence endings
-                sentence_endings = []
-                for match in re.finditer(r'[.!?]\s+[A-Z]', search_area):
-                    sentence_endings.append(search_start + match.start() + 1)
-                
-                if sentence_endings:
-                    chunk_end = sentence_endings[-1]  # Use the last sentence ending
+                if last_match is not None:
+                    chunk_end = last_match.start() + 1
             
             # Extract chunk
             chunk = content[current_pos:chunk_end].strip()
             
-            # Add context markers for chunked content
-            if current_pos > 0:
-                chunk = "[Continued from previous section] " + chunk
-            
-            if chunk_end < len(content):
-                chunk = chunk + " [Continued in next section]"
+            # Add context markers for chunked content, building the string once
+            prefix = "[Continued from previous section] " if current_pos > 0 else ""
+            suffix = " [Continued in next section]" if chunk_end < len(content) else ""
+            chunk = f"{prefix}{chunk}{suffix}"
             
             chunks.append(chunk)
             
@@ -293,7 +383,7 @@ class ContentPreprocessor:
             List of posts with chunks merged back together
         """
         # Separate chunked and non-chunked posts
-        chunked_groups = {}
+        chunked_groups = defaultdict(list)
         non_chunked = []
         
         for post in enriched_posts:
@@ -303,23 +393,23 @@ class ContentPreprocessor:
                 processing_info = post.get('content_processing', {})  # Fallback to old structure
             
             if processing_info.get('chunked', False):
+                # Chunks of one post share its URL; two posts can share a title
                 original_title = post.get('original_title', post.get('title'))
-                if original_title not in chunked_groups:
-                    chunked_groups[original_title] = []
-                chunked_groups[original_title].append(post)
+                chunked_groups[post.get('url') or original_title].append(post)
             else:
                 non_chunked.append(post)
         
-        # Merge chunks back together
-        merged_posts = non_chunked.copy()
+        # Merge chunks back together (non-chunked posts are passed through as-is)
+        merged_posts = non_chunked
         
-        for original_title, chunks in chunked_groups.items():
+        for chunks in chunked_groups.values():
             # Sort chunks by chunk_index
             chunks.sort(key=lambda x: x.get('chunk_index', 0))
             
             # Take the first chunk as the base and merge others into it
             if chunks:
-                merged_post = chunks[0].copy()
+                merged_post = dict(chunks[0])  # Flattens the chunk overlay into a plain dict
+                original_title = merged_post.get('original_title', merged_post.get('title'))
                 merged_post['title'] = original_title  # Restore original title
                 
                 # Combine summaries
@@ -334,22 +424,21 @@ class ContentPreprocessor:
                     if keywords and keywords != 'N/A':
                         all_keywords.extend([kw.strip() for kw in keywords.split(',')])
                 
-                # Deduplicate while preserving order
-                unique_keywords = []
-                seen = set()
+                # Deduplicate case-insensitively while preserving order, stopping
+                # once the top 10 keywords are known
+                unique_keywords = {}
                 for kw in all_keywords:
-                    kw_lower = kw.lower()
-                    if kw_lower not in seen and kw.strip():
-                        unique_keywords.append(kw)
-                        seen.add(kw_lower)
+                    if kw:
+                        unique_keywords.setdefault(kw.lower(), kw)
+                        if len(unique_keywords) == 10:
+                            break
                 
-                merged_post['seo_keywords'] = ', '.join(unique_keywords[:10])  # Top 10 keywords
+                merged_post['seo_keywords'] = ', '.join(unique_keywords.values())  # Top 10 keywords
                 
                 # Use the most common funnel_stage
                 funnel_stages = [chunk.get('funnel_stage', '') for chunk in chunks if chunk.get('funnel_stage') and chunk.get('funnel_stage') != 'N/A']
                 if funnel_stages:
                     # Use the most frequent stage, or first if tied
-                    from collections import Counter
                     stage_counts = Counter(funnel_stages)
                     merged_post['funnel_stage'] = stage_counts.most_common(1)[0][0]
                 
@@ -372,4 +461,15 @@ class ContentPreprocessor:
         if chunked_groups:
             logger.info(f"Merged {sum(len(chunks) for chunks in chunked_groups.values())} chunks back into {len(chunked_groups)} posts")
         
-        return merged_posts
\ No newline at end of file
+        return merged_posts
+
+
+def _process_batch(posts: List[Dict[str, Any]], max_content_length: int,
+                   chunk_size: int, chunk_overlap: int) -> List[Dict[str, Any]]:
+    """Preprocesses a batch of posts; module-level so process pool workers can pickle it."""
+    processed_posts = []
+    for post in posts:
+        processed_posts.extend(
+            ContentPreprocessor._prepare_post(post, max_content_length, chunk_size, chunk_overlap)
+        )
+    return processed_posts
@@ -0,0 +1,121 @@
+# src/transform/enrichment_cache.py
+# This file contains a persistent cache of live enrichment results.
+
+import os
+import json
+import time
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+class EnrichmentCache:
+    """
+    Caches live enrichment results keyed by a hash of the model and prompt, so
+    content that was already enriched is never sent to the API again.
+
+    Results live in a SQLite table on disk, with a small in-memory LRU layer in
+    front of it for repeated lookups within a run.
+    """
+    def __init__(self, db_path, memory_entries=1024):
+        self.db_path = db_path
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        self._disabled = False
+
+    @staticmethod
+    def make_key(model_name, prompt):
+        """Returns the cache key for a prompt sent to the given model."""
+        return hashlib.sha256(f"{model_name}|{prompt}".encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """
+        Returns the cached (summary, seo_keywords, funnel_stage, target_audience,
+        strategic_analysis) tuple for the key, or None on a miss.
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT summary, seo_keywords, funnel_stage, target_audience, strategic_analysis "
+                    "FROM enrichment_cache WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not read from enrichment cache: {e}")
+                return None
+            if row is None:
+                return None
+
+            value = (row[0], row[1], row[2], row[3], json.loads(row[4]))
+            self._remember(key, value)
+            return value
+
+    def put(self, key, value):
+        """Stores an enrichment result tuple under the key."""
+        summary, seo_keywords, funnel_stage, target_audience, strategic_analysis = value
+        with self._lock:
+            self._remember(key, value)
+
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO enrichment_cache "
+                        "(key, summary, seo_keywords, funnel_stage, target_audience, strategic_analysis, ts) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (key, summary, seo_keywords, funnel_stage, target_audience,
+                         json.dumps(strategic_analysis), int(time.time()))
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Could not write to enrichment cache: {e}")
+
+    def close(self):
+        """Closes the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key, value):
+        """Adds a value to the in-memory layer, evicting the least recently used entry."""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _connect(self):
+        """
+        Opens the database once per cache. If it can't be opened, the cache
+        falls back to the in-memory layer only.
+        """
+        if self._conn is not None or self._disabled:
+            return self._conn
+        try:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS enrichment_cache ("
+                "key TEXT PRIMARY KEY, summary TEXT, seo_keywords TEXT, funnel_stage TEXT, "
+                "target_audience TEXT, strategic_analysis TEXT, ts INTEGER)"
+            )
+            conn.commit()
+            self._conn = conn
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Enrichment cache at {self.db_path} is unavailable, using memory only: {e}")
+            self._disabled = True
+        return self._conn
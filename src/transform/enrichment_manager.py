@@ -8,6 +8,7 @@ from typing import List, Dict, Any, Optional, Tuple
 from .content_preprocessor import ContentPreprocessor
 from .live import transform_posts_live
 from .batch_manager import BatchJobManager
+from src.api_connector import GeminiAPIConnector
 from src.state_management.state_manager import StateManager
 from src.exceptions import EnrichmentError
 
@@ -22,10 +23,14 @@ class EnrichmentManager:
     It discovers posts with missing data and submits them for enrichment via
     either live or batch API calls.
     """
-    def __init__(self, app_config: Dict[str, Any], state_manager: StateManager, batch_manager: BatchJobManager):
+    def __init__(self, app_config: Dict[str, Any], state_manager: StateManager, batch_manager: BatchJobManager,
+                 api_connector: Optional[GeminiAPIConnector] = None):
         self.batch_manager = batch_manager
         self.state_manager = state_manager
         self.app_config = app_config
+        self.api_connector = api_connector
+        # competitor name -> (posts list, {url: index in that list}) from discovery
+        self._url_index: Dict[str, Tuple[List[Dict[str, Any]], Dict[str, int]]] = {}
 
     async def enrich_posts(
         self, 
@@ -46,7 +51,7 @@ class EnrichmentManager:
         Args:
             competitor: Competitor configuration dictionary
             posts_to_enrich: List of posts that need enrichment
-            all_posts_for_merge: All posts to merge with enriched results
+            all_posts_for_merge: All posts to merge with enriched results (updated in place)
             batch_threshold: Threshold for switching between live/batch mode
             live_model: Model name for live enrichment
             batch_model: Model name for batch enrichment
@@ -69,17 +74,25 @@ class EnrichmentManager:
             # Check if preprocessing created chunks (affects our batch threshold decision)
             if len(processed_posts) < batch_threshold:
                 logger.info(f"Processing {len(processed_posts)} items in LIVE mode...")
-                enriched_posts = await transform_posts_live(processed_posts, live_model)
+                enriched_posts = await transform_posts_live(processed_posts, live_model, connector=self.api_connector)
                 if not enriched_posts:
                     return None
                 
                 # Merge chunked results back together if necessary
                 merged_posts = ContentPreprocessor.merge_chunked_results(enriched_posts)
                 
-                # Merge the new enriched data with the original posts
-                enriched_map = {post['url']: post for post in merged_posts}
-                final_posts = [enriched_map.get(post['url'], post) for post in all_posts_for_merge]
-                return final_posts
+                # Everything was enriched (e.g. freshly scraped posts): nothing to merge into
+                if all_posts_for_merge is posts_to_enrich or len(merged_posts) == len(all_posts_for_merge):
+                    return merged_posts
+                
+                # Merge the new enriched data into the original posts in place, so
+                # only the enriched slots are touched rather than copying the corpus
+                url_to_idx = self._get_url_index(competitor_name, all_posts_for_merge)
+                for enriched_post in merged_posts:
+                    idx = url_to_idx.get(enriched_post.get('url'))
+                    if idx is not None:
+                        all_posts_for_merge[idx] = enriched_post
+                return all_posts_for_merge
             else:
                 logger.info(f"Processing {len(processed_posts)} items in BATCH mode...")
                 await self.batch_manager.submit_new_jobs(
@@ -101,6 +114,30 @@ class EnrichmentManager:
                 details={"batch_threshold": batch_threshold, "wait": wait}
             )
 
+    def _get_url_index(self, competitor_name: str, posts: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Returns a {url: position} index for `posts`, reusing the one cached for the
+        competitor while it was built for this same list (e.g. during discovery).
+        
+        Args:
+            competitor_name: Name of the competitor
+            posts: List of posts to index
+            
+        Returns:
+            Dictionary mapping each post URL to its index in `posts`
+        """
+        cached = self._url_index.get(competitor_name)
+        if cached is not None and cached[0] is posts:
+            return cached[1]
+        
+        url_to_idx = {}
+        for i, post in enumerate(posts):
+            url = post.get('url')
+            if url:
+                url_to_idx[url] = i
+        self._url_index[competitor_name] = (posts, url_to_idx)
+        return url_to_idx
+
     def _find_posts_to_enrich(self, competitor_name: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
         Loads all posts from the 'processed' directory and returns a tuple of:
@@ -110,6 +147,9 @@ class EnrichmentManager:
         Args:
             competitor_name: Name of the competitor
             
+        If the state manager's enrichment stats show that nothing needs
+        enrichment, the data files are not read and both lists are empty.
+        
         Returns:
             Tuple of (all_posts, posts_needing_enrichment)
             
@@ -117,42 +157,66 @@ class EnrichmentManager:
             EnrichmentError: If loading processed data fails
         """
         try:
-            processed_posts = self.state_manager.load_processed_data(competitor_name)
+            if self.state_manager.is_fully_enriched(competitor_name):
+                logger.info(f"All processed posts for '{competitor_name}' are fully enriched (from saved stats)")
+                return [], []
+            
+            processed_posts = []
             posts_to_enrich = []
             failed_count = 0
             missing_count = 0
             
-            for post in processed_posts:
+            # Classify rows as they are streamed from the state files; every post is
+            # still kept because the merge and the final save need the full set
+            url_to_idx = {}
+            # Missing-field masks of the first few posts, kept for the example log lines
+            examples = []
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            
+            for post in self.state_manager.iter_processed_data(competitor_name):
+                url = post.get('url')
+                if url:
+                    url_to_idx[url] = len(processed_posts)
+                processed_posts.append(post)
                 # Use data model to check if post needs enrichment
-                needs_enrichment, missing_fields = PostModel.needs_enrichment(post)
+                missing_mask = PostModel.missing_enrichment_mask(post)
                 
-                if needs_enrichment:
+                if missing_mask:
                     posts_to_enrich.append(post)
-                    logger.debug(f"Post '{post.get('title', 'unknown')}' needs enrichment - missing: {', '.join(missing_fields)}")
+                    if len(examples) < 3:
+                        examples.append((post, missing_mask))
+                    if debug_enabled:
+                        logger.debug(f"Post '{post.get('title', 'unknown')}' needs enrichment - missing: {', '.join(PostModel.missing_field_names(missing_mask))}")
                     
                     # Count different types of missing data for reporting
-                    if any('strategic_analysis' in field for field in missing_fields):
+                    if missing_mask & PostModel.MISSING_STRATEGIC:
                         missing_count += 1
                     # Check for failed status in both old and new metadata structure
                     if (post.get('enrichment_status') == 'failed' or 
                         post.get('metadata', {}).get('enrichment_status') == 'failed'):
                         failed_count += 1
             
-            # Provide detailed logging about what needs enrichment
+            # Provide detailed logging about what needs enrichment, as a single
+            # record that is only formatted when INFO is enabled
             if posts_to_enrich:
-                logger.info(f"Found {len(posts_to_enrich)} posts needing enrichment:")
-                if missing_count > 0:
-                    logger.info(f"  - {missing_count} posts missing strategic analysis or other enrichment data")
-                if failed_count > 0:
-                    logger.info(f"  - {failed_count} posts with previous enrichment failures")
-                
-                # Show some example missing fields for the first few posts
-                for i, post in enumerate(posts_to_enrich[:3]):
-                    _, missing_fields = PostModel.needs_enrichment(post)
-                    logger.info(f"  - '{post.get('title', 'unknown')[:50]}...' missing: {', '.join(missing_fields[:3])}")
+                if logger.isEnabledFor(logging.INFO):
+                    summary_lines = [f"Found {len(posts_to_enrich)} posts needing enrichment:"]
+                    if missing_count > 0:
+                        summary_lines.append(f"  - {missing_count} posts missing strategic analysis or other enrichment data")
+                    if failed_count > 0:
+                        summary_lines.append(f"  - {failed_count} posts with previous enrichment failures")
+                    
+                    # Show some example missing fields for the first few posts
+                    for post, missing_mask in examples:
+                        missing_fields = PostModel.missing_field_names(missing_mask)
+                        summary_lines.append(f"  - '{post.get('title', 'unknown')[:50]}...' missing: {', '.join(missing_fields[:3])}")
+                    logger.info("\n".join(summary_lines))
                     
             else:
                 logger.info(f"All {len(processed_posts)} posts are fully enriched with strategic analysis")
+            
+            # Remember where each post sits so enrich_posts can merge by index
+            self._url_index[competitor_name] = (processed_posts, url_to_idx)
                     
             return processed_posts, posts_to_enrich
             
@@ -160,5 +224,5 @@ class EnrichmentManager:
             logger.error(f"Failed to find posts to enrich for '{competitor_name}': {e}")
             raise EnrichmentError(
                 f"Failed to load posts for enrichment: {str(e)}",
-                details={"competitor": competitor_name, "operation": "load_processed_data"}
+                details={"competitor": competitor_name, "operation": "iter_processed_data"}
             )
\ No newline at end of file
@@ -1,18 +1,39 @@
 # src/transform/live.py
 # This file contains the high-level router for live API processing.
 
+import asyncio
 import logging
+from typing import Optional
 from src.api_connector import GeminiAPIConnector
 
 logger = logging.getLogger(__name__)
 
-async def transform_posts_live(posts, model_name):
+# Fallback connector for callers that don't pass one, created on first use. A
+# connector whose client failed to initialise is kept too, so later calls
+# short-circuit instead of retrying the construction.
+_CONNECTOR: Optional[GeminiAPIConnector] = None
+_CONNECTOR_LOCK = asyncio.Lock()
+
+async def _get_connector():
+    """Returns the shared fallback connector, creating it once."""
+    global _CONNECTOR
+    if _CONNECTOR is None:
+        async with _CONNECTOR_LOCK:
+            if _CONNECTOR is None:
+                _CONNECTOR = GeminiAPIConnector()
+    return _CONNECTOR
+
+async def transform_posts_live(posts, model_name, connector=None):
     """
     Transforms a batch of extracted post data by enriching it with live,
     asynchronous calls to the Gemini API via the connector.
+
+    Pass the application's shared connector so its HTTP connection pool is
+    reused across calls; otherwise a lazily created module-level one is used.
     """
-    connector = GeminiAPIConnector() # <-- The connector is now instantiated here
+    if connector is None:
+        connector = await _get_connector()
     if not connector.client:
         return posts # Return original posts if connector failed
     
-    return await connector.batch_enrich_posts_live(posts, model_name)
\ No newline at end of file
+    return await connector.batch_enrich_posts_live(posts, model_name)
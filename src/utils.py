@@ -2,11 +2,91 @@
 # This file contains shared helper functions for the application.
 
 import json
+import atexit
+import functools
 import logging
 import time
+from collections import Counter
+from datetime import date, datetime
+from operator import itemgetter
+
+try:
+    # Optional: orjson is several times faster than the stdlib for (de)serialisation
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# --- JSON Helpers ---
+def json_loads(data):
+    """Parses a JSON document from str or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj, default=None):
+    """
+    Serialises obj to a compact JSON string, using orjson when it is installed.
+    `default` is called for objects that aren't natively serialisable.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default).decode('utf-8')
+    return json.dumps(obj, default=default, ensure_ascii=False, separators=(',', ':'))
+
+def json_dumps_bytes(obj, default=None):
+    """
+    Serialises obj to compact UTF-8 JSON bytes, using orjson when it is installed.
+    `default` is called for objects that aren't natively serialisable.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default)
+    return json.dumps(obj, default=default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+# --- Post Helpers ---
+def parse_publication_date(value):
+    """
+    Parses a YYYY-MM-DD publication date. Uses the C-implemented
+    date.fromisoformat, falling back to strptime for dates that aren't
+    zero-padded (e.g. '2024-1-5').
+
+    Raises:
+        ValueError: If the value isn't a valid date.
+    """
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+
+def _is_iso_date_shape(value):
+    """True for strings shaped like a zero-padded YYYY-MM-DD date."""
+    return (len(value) == 10 and value[4] == '-' and value[7] == '-'
+            and value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit())
+
+def sort_posts_by_date(posts):
+    """
+    Returns the posts newest first, followed by the posts without a
+    publication date in their original order.
+
+    Zero-padded YYYY-MM-DD strings sort chronologically as plain strings, so
+    they are used as the sort key directly; only other spellings (e.g.
+    '2024-1-5') are parsed and normalised.
+
+    Raises:
+        ValueError: If a publication date that isn't zero-padded can't be parsed.
+    """
+    with_dates, without_dates = [], []
+    for post in posts:
+        publication_date = post.get('publication_date')
+        if publication_date and publication_date != 'N/A':
+            if not _is_iso_date_shape(publication_date):
+                publication_date = parse_publication_date(publication_date).isoformat()
+            with_dates.append((publication_date, post))
+        else:
+            without_dates.append(post)
+    with_dates.sort(key=itemgetter(0), reverse=True)
+    return [post for _, post in with_dates] + without_dates
+
 # --- Configuration Management ---
 _CONFIG = {}
 _PROMPTS = {}
@@ -15,8 +95,8 @@ def _load_config():
     """Loads the configuration from the config file into global variables."""
     global _CONFIG, _PROMPTS
     try:
-        with open('config/config.json', 'r') as f:
-            _CONFIG = json.load(f)
+        with open('config/config.json', 'rb') as f:
+            _CONFIG = json_loads(f.read())
             _PROMPTS = _CONFIG.get('prompts', {})
     except (FileNotFoundError, json.JSONDecodeError) as e:
         logger.error(f"Could not load configuration from config.json: {e}")
@@ -40,19 +120,43 @@ def get_content_processing_config():
         'api_content_limit': 50000
     })
 
-def get_prompt(prompt_name, content, headings=None, primary_competitors=None, dxp_competitors=None):
+def get_live_enrichment_config():
+    """Returns the live enrichment configuration parameters."""
+    if not _CONFIG:
+        _load_config()
+    
+    return _CONFIG.get('live_enrichment', {
+        'max_concurrency': 10,  # Maximum in-flight live API requests
+        'per_call_timeout': 120,  # Seconds allowed per post, retries included
+        'requests_per_minute': 500,  # API calls started per minute, retries included
+        'posts_per_request': 1,  # Posts sent together in one live request
+        'max_connections': 64  # Size of the shared client's HTTP connection pool
+    })
+
+def get_batch_enrichment_config():
+    """Returns the batch enrichment configuration parameters."""
+    if not _CONFIG:
+        _load_config()
+    
+    return _CONFIG.get('batch_enrichment', {
+        'max_concurrent_downloads': 4  # Batch job results downloaded at once
+    })
+
+@functools.cache
+def _get_prompt_prefix(prompt_name, primary_competitors, dxp_competitors):
     """
-    Retrieves a prompt instruction from the config and combines it with the
-    programmatic context.
+    Returns everything in a prompt that precedes the content (instruction,
+    competitor lists and the content label), or None if the prompt is unknown.
+    Memoized per prompt and competitor tuples, so the config is only consulted
+    and the lists only joined on the first call of a run.
     """
     if not _PROMPTS:
         _load_prompts()
-    
+
     prompt_instruction = _PROMPTS.get(prompt_name)
     if not prompt_instruction:
-        logger.error(f"Prompt instruction '{prompt_name}' not found in configuration.")
-        return ""
-    
+        return None
+
     # --- UPDATED: Add tiered competitor lists to the prompt ---
     competitors_text = ""
     if primary_competitors:
@@ -60,21 +164,46 @@ def get_prompt(prompt_name, content, headings=None, primary_competitors=None, dx
     if dxp_competitors:
         competitors_text += f"\n\nOther DXP/CMS Competitors: {', '.join(dxp_competitors)}"
 
+    return f"{prompt_instruction}{competitors_text}\n\nContent: "
+
+def get_prompt(prompt_name, content, headings=None, primary_competitors=None, dxp_competitors=None):
+    """
+    Retrieves a prompt instruction from the config and combines it with the
+    programmatic context. Content longer than the configured api_content_limit
+    is cut to that length, so an oversized post never reaches the request body.
+    """
+    prefix = _get_prompt_prefix(prompt_name, tuple(primary_competitors or ()), tuple(dxp_competitors or ()))
+    if prefix is None:
+        logger.error(f"Prompt instruction '{prompt_name}' not found in configuration.")
+        return ""
+
+    api_content_limit = get_content_processing_config().get('api_content_limit')
+    if content and api_content_limit and len(content) > api_content_limit:
+        logger.warning(f"Content is {len(content)} chars, truncating to the API limit of {api_content_limit}")
+        content = content[:api_content_limit]
+
     # Combine the instruction with the context
-    return f"{prompt_instruction}{competitors_text}\n\nContent: {content}"
+    return prefix + content
 
 
 # --- Messaging and Reporting Management ---
 
 
+# Terminal batch job states that count as a failure
+FAILED_JOB_STATES = frozenset(("JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"))
+
+def _count_job_states(statuses):
+    """Returns (succeeded, failed) job counts from a single pass over the statuses."""
+    counts = Counter(statuses)
+    return counts["JOB_STATE_SUCCEEDED"], sum(counts[state] for state in FAILED_JOB_STATES)
+
 def get_job_status_summary(status_list):
     """
     Analyzes a list of job status strings and returns a user-friendly
     summary message and a boolean indicating if all jobs succeeded.
     """
     total_jobs = len(status_list)
-    succeeded_jobs = status_list.count("JOB_STATE_SUCCEEDED")
-    failed_jobs = sum(1 for s in status_list if s in ["JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"])
+    succeeded_jobs, failed_jobs = _count_job_states(status_list)
     
     if failed_jobs > 0:
         summary = f"  - {failed_jobs}/{total_jobs} job(s) failed. Please check the job logs in the Google Cloud Console."
@@ -105,8 +234,7 @@ def get_batch_status_report(statuses):
         return False, "No job statuses found to report."
 
     total_jobs = len(statuses)
-    succeeded_count = statuses.count("JOB_STATE_SUCCEEDED")
-    failed_count = sum(1 for s in statuses if s in ["JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"])
+    succeeded_count, failed_count = _count_job_states(statuses)
     
     # Case 1: One or more jobs have failed permanently
     if failed_count > 0:
@@ -125,38 +253,56 @@ def get_batch_status_report(statuses):
 
 
 # --- Performance Estimate for better UX ---
+_PERFORMANCE_LOG_PATH = 'config/performance_log.json'
+# The log is read once and kept in memory; updates are written back at exit
+_PERF_LOG = None
+_PERF_DIRTY = False
 
-def get_performance_estimate():
-    """Reads the performance log and returns the average seconds per post."""
-    try:
-        with open('config/performance_log.json', 'r') as f:
-            log = json.load(f)
-        # Default to 5s if key is missing or invalid
-        return log.get('average_seconds_per_post', 5.0)
-    except (FileNotFoundError, json.JSONDecodeError):
-        # Return a default value if the file doesn't exist or is invalid
-        return 5.0
-
-def update_performance_log(job_duration_seconds, num_posts):
-    """Updates the performance log with data from a completed job."""
-    try:
+def _load_performance_log():
+    """Loads the performance log into memory on first use and returns it."""
+    global _PERF_LOG
+    if _PERF_LOG is None:
         try:
-            with open('config/performance_log.json', 'r') as f:
-                log = json.load(f)
+            with open(_PERFORMANCE_LOG_PATH, 'rb') as f:
+                _PERF_LOG = json_loads(f.read())
         except (FileNotFoundError, json.JSONDecodeError):
             # If log is missing or corrupt, start a new one
-            log = {"total_posts_processed": 0, "total_time_seconds": 0}
+            _PERF_LOG = {"total_posts_processed": 0, "total_time_seconds": 0}
+    return _PERF_LOG
 
-        log['total_posts_processed'] += num_posts
-        log['total_time_seconds'] += job_duration_seconds
+def get_performance_estimate():
+    """Returns the average seconds per post from the performance log."""
+    # Default to 5s if the key is missing
+    return _load_performance_log().get('average_seconds_per_post', 5.0)
+
+def update_performance_log(job_duration_seconds, num_posts):
+    """Updates the performance log with data from a completed job. It is written to disk at exit."""
+    global _PERF_DIRTY
+    try:
+        log = _load_performance_log()
+        log['total_posts_processed'] = log.get('total_posts_processed', 0) + num_posts
+        log['total_time_seconds'] = log.get('total_time_seconds', 0) + job_duration_seconds
         
         # Recalculate the average
         if log['total_posts_processed'] > 0:
             log['average_seconds_per_post'] = round(log['total_time_seconds'] / log['total_posts_processed'], 2)
 
-        with open('config/performance_log.json', 'w') as f:
-            json.dump(log, f, indent=4)
+        _PERF_DIRTY = True
         logger.debug("Performance log updated.")
 
-    except (IOError, TypeError) as e:
-        logger.warning(f"Could not update performance log: {e}")
\ No newline at end of file
+    except TypeError as e:
+        logger.warning(f"Could not update performance log: {e}")
+
+def flush_performance_log():
+    """Writes the in-memory performance log to disk if it has changed."""
+    global _PERF_DIRTY
+    if not _PERF_DIRTY:
+        return
+    try:
+        with open(_PERFORMANCE_LOG_PATH, 'w') as f:
+            json.dump(_PERF_LOG, f, indent=4)
+        _PERF_DIRTY = False
+    except IOError as e:
+        logger.warning(f"Could not write performance log: {e}")
+
+atexit.register(flush_performance_log)
\ No newline at end of file
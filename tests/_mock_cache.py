@@ -0,0 +1,44 @@
+# tests/_mock_cache.py
+# This file contains spec'd mock templates that are built once and cloned per test.
+
+import copy
+import functools
+import importlib
+from unittest.mock import MagicMock
+
+# Classes that fixtures mock, imported only when a fixture first needs them
+_CLASS_MODULES = {
+    'DIContainer': 'src.di_container',
+    'ScraperManager': 'src.extract.scraper_manager',
+    'EnrichmentManager': 'src.transform.enrichment_manager',
+    'BatchJobManager': 'src.transform.batch_manager',
+    'ExportManager': 'src.load.export_manager',
+    'StateManager': 'src.state_management.state_manager',
+    'GeminiAPIConnector': 'src.api_connector',
+    'ContentPreprocessor': 'src.transform.content_preprocessor',
+}
+
+def __getattr__(name):
+    """Imports a mocked class on first access, e.g. _mock_cache.StateManager."""
+    if name in _CLASS_MODULES:
+        return getattr(importlib.import_module(_CLASS_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+@functools.cache
+def _template(class_name):
+    """Builds the spec'd template for a class; this introspects the whole class, so it runs once."""
+    return MagicMock(spec=__getattr__(class_name))
+
+def clone(template):
+    """
+    Returns an independent copy of a mock template.
+
+    copy.deepcopy is used rather than copy.copy: a shallow copy shares the
+    template's child mocks, so a return_value set on one copy would leak into
+    every other copy of the same template.
+    """
+    return copy.deepcopy(template)
+
+def spec_mock(class_name):
+    """Returns a fresh MagicMock(spec=...) for the named class, cloned from the cached template."""
+    return clone(_template(class_name))
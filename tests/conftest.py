@@ -3,29 +3,27 @@
 
 import sys
 import os
+import io
+import copy
 import json
+import functools
+import shutil
 import pytest
-from unittest.mock import MagicMock, AsyncMock, patch, mock_open
-from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, AsyncMock, patch, mock_open
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from datetime import datetime
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.di_container import DIContainer
-from src.extract.scraper_manager import ScraperManager
-from src.transform.enrichment_manager import EnrichmentManager
-from src.transform.batch_manager import BatchJobManager
-from src.load.export_manager import ExportManager
-from src.state_management.state_manager import StateManager
-from src.api_connector import GeminiAPIConnector
-from src.transform.content_preprocessor import ContentPreprocessor  # Fixed import path
+from tests._mock_cache import clone, spec_mock
 
 # =============================================================================
 # REALISTIC TEST DATA FIXTURES
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_competitor_config():
     """Provides a realistic competitor configuration for testing."""
     return {
@@ -45,47 +43,55 @@ def sample_competitor_config():
         'next_page_selector': 'a.next-page'
     }
 
-@pytest.fixture
+# Sample posts shared read-only by every test
+_SAMPLE_POSTS = tuple(MappingProxyType(post) for post in [
+    {
+        'title': 'Test Post 1',
+        'url': 'https://test.com/post1',
+        'content': 'This is test content for the first post. It includes multiple sentences to test processing.',
+        'publication_date': '2025-01-01',
+        'seo_meta_keywords': 'test, content, blog',
+        'headings': [
+            {'tag': 'h1', 'text': 'Main Title'},
+            {'tag': 'h2', 'text': 'Introduction'}
+        ],
+        'schemas': [
+            {'@type': 'Article', 'headline': 'Test Post 1'}
+        ],
+        'summary': 'N/A',
+        'seo_keywords': 'N/A',
+        'funnel_stage': 'N/A',
+        'enrichment_status': 'pending'
+    },
+    {
+        'title': 'Test Post 2',
+        'url': 'https://test.com/post2',
+        'content': 'This is test content for the second post. It also contains comprehensive information.',
+        'publication_date': '2025-01-02',
+        'seo_meta_keywords': 'test, example, guide',
+        'headings': [
+            {'tag': 'h1', 'text': 'Second Post Title'},
+            {'tag': 'h2', 'text': 'Overview'}
+        ],
+        'schemas': [],
+        'summary': 'N/A',
+        'seo_keywords': 'N/A',
+        'funnel_stage': 'N/A',
+        'enrichment_status': 'pending'
+    }
+])
+
+@pytest.fixture(scope="session")
 def sample_posts():
-    """Returns sample posts with realistic data structure."""
-    return [
-        {
-            'title': 'Test Post 1',
-            'url': 'https://test.com/post1',
-            'content': 'This is test content for the first post. It includes multiple sentences to test processing.',
-            'publication_date': '2025-01-01',
-            'seo_meta_keywords': 'test, content, blog',
-            'headings': [
-                {'tag': 'h1', 'text': 'Main Title'},
-                {'tag': 'h2', 'text': 'Introduction'}
-            ],
-            'schemas': [
-                {'@type': 'Article', 'headline': 'Test Post 1'}
-            ],
-            'summary': 'N/A',
-            'seo_keywords': 'N/A',
-            'funnel_stage': 'N/A',
-            'enrichment_status': 'pending'
-        },
-        {
-            'title': 'Test Post 2',
-            'url': 'https://test.com/post2',
-            'content': 'This is test content for the second post. It also contains comprehensive information.',
-            'publication_date': '2025-01-02',
-            'seo_meta_keywords': 'test, example, guide',
-            'headings': [
-                {'tag': 'h1', 'text': 'Second Post Title'},
-                {'tag': 'h2', 'text': 'Overview'}
-            ],
-            'schemas': [],
-            'summary': 'N/A',
-            'seo_keywords': 'N/A',
-            'funnel_stage': 'N/A',
-            'enrichment_status': 'pending'
-        }
-    ]
+    """Returns sample posts with realistic data structure, read-only."""
+    return _SAMPLE_POSTS
 
 @pytest.fixture
+def sample_posts_mutable():
+    """Returns private, mutable copies of the sample posts."""
+    return [copy.deepcopy(dict(post)) for post in _SAMPLE_POSTS]
+
+@pytest.fixture(scope="session")
 def sample_enriched_posts():
     """Returns sample posts with enrichment data."""
     return [
@@ -117,27 +123,46 @@ def sample_enriched_posts():
         }
     ]
 
-@pytest.fixture
+# Content that will definitely exceed the chunking threshold, built once at import
+_LONG_CONTENT = ("This is a very long post content that will be used to test the chunking functionality. " * 200 +
+                 "It contains multiple sentences with proper punctuation. " * 100 +
+                 "The content should be split intelligently at sentence boundaries when processed.")
+
+_LONG_CONTENT_POST = {
+    'title': 'Long Content Post',
+    'url': 'https://test.com/long-post',
+    'content': _LONG_CONTENT,
+    'publication_date': '2025-01-01',
+    'seo_meta_keywords': 'long, content, chunking',
+    'headings': [
+        {'tag': 'h1', 'text': 'Very Long Article'},
+        {'tag': 'h2', 'text': 'Section 1'},
+        {'tag': 'h2', 'text': 'Section 2'}
+    ],
+    'schemas': [{'@type': 'Article', 'wordCount': len(_LONG_CONTENT)}]
+}
+
+@pytest.fixture(scope="session")
 def sample_long_content_post():
-    """Returns a post with very long content to test chunking."""
-    # Create content that will definitely exceed chunking threshold
-    long_content = ("This is a very long post content that will be used to test the chunking functionality. " * 200 + 
-                   "It contains multiple sentences with proper punctuation. " * 100 +
-                   "The content should be split intelligently at sentence boundaries when processed.")
-    
-    return {
-        'title': 'Long Content Post',
-        'url': 'https://test.com/long-post',
-        'content': long_content,
-        'publication_date': '2025-01-01',
-        'seo_meta_keywords': 'long, content, chunking',
-        'headings': [
-            {'tag': 'h1', 'text': 'Very Long Article'},
-            {'tag': 'h2', 'text': 'Section 1'},
-            {'tag': 'h2', 'text': 'Section 2'}
-        ],
-        'schemas': [{'@type': 'Article', 'wordCount': len(long_content)}]
-    }
+    """Returns a read-only post with very long content to test chunking."""
+    return MappingProxyType(_LONG_CONTENT_POST)
+
+@pytest.fixture
+def sample_long_content_post_mutable(sample_long_content_post):
+    """Returns a private, mutable copy of the long content post."""
+    return copy.deepcopy(dict(sample_long_content_post))
+
+# Size-limit inputs are built on first use and shared for the rest of the run;
+# strings are immutable, so sharing them is safe
+@pytest.fixture(scope="session")
+def long_content_10k():
+    """Returns 10KB of unbroken content that always needs chunking."""
+    return 'A' * 10000
+
+@pytest.fixture(scope="session")
+def big_content_50mb():
+    """Returns 50MB of content, larger than a single batch request allows."""
+    return 'x' * (50 * 1024 * 1024)
 
 @pytest.fixture
 def sample_failed_enrichment_posts():
@@ -182,7 +207,9 @@ def multilingual_content_post():
 # CONFIGURATION FIXTURES
 # =============================================================================
 
-@pytest.fixture
+# Session-scoped fixtures are shared by every test: copy them before mutating.
+
+@pytest.fixture(scope="session")
 def mock_app_config():
     """Provides a comprehensive mock application configuration."""
     return {
@@ -208,7 +235,7 @@ def mock_app_config():
         }
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_competitor_config():
     """Provides comprehensive mock competitor configuration."""
     return {
@@ -258,6 +285,14 @@ def mock_multiple_competitor_config():
 # REALISTIC MOCK FACTORIES
 # =============================================================================
 
+# The default success response, serialised once
+_DEFAULT_KEYWORDS = ("test", "content", "keywords")
+_DEFAULT_RESPONSE_JSON = json.dumps({
+    "summary": "Test summary",
+    "seo_keywords": list(_DEFAULT_KEYWORDS),
+    "funnel_stage": "ToFu"
+})
+
 @pytest.fixture
 def realistic_api_response_factory():
     """Factory for creating realistic Gemini API responses."""
@@ -268,25 +303,22 @@ def realistic_api_response_factory():
         funnel_stage="ToFu",
         error_type=None
     ):
-        if keywords is None:
-            keywords = ["test", "content", "keywords"]
-        
         if error_type == "api_timeout":
             return None
         elif error_type == "invalid_json":
-            return MagicMock(text="Invalid JSON response content")
+            return SimpleNamespace(text="Invalid JSON response content")
         elif error_type == "afc_message":
-            return MagicMock(text="AFC is enabled for this request")
+            return SimpleNamespace(text="AFC is enabled for this request")
+        elif keywords is None and summary == "Test summary" and funnel_stage == "ToFu":
+            return SimpleNamespace(text=_DEFAULT_RESPONSE_JSON)
         else:
             # Successful response
             response_data = {
                 "summary": summary,
-                "seo_keywords": keywords,
+                "seo_keywords": list(_DEFAULT_KEYWORDS) if keywords is None else keywords,
                 "funnel_stage": funnel_stage
             }
-            mock_response = MagicMock()
-            mock_response.text = json.dumps(response_data)
-            return mock_response
+            return SimpleNamespace(text=json.dumps(response_data))
     
     return _create_response
 
@@ -294,14 +326,12 @@ def realistic_api_response_factory():
 def batch_job_response_factory():
     """Factory for creating realistic batch job responses."""
     def _create_batch_response(job_state="JOB_STATE_SUCCEEDED", job_id="batches/test-job-123"):
-        mock_job = MagicMock()
-        mock_job.name = job_id
-        mock_job.state.name = job_state
-        
+        # Only succeeded jobs have a destination file, as with the real API
+        dest = None
         if job_state == "JOB_STATE_SUCCEEDED":
-            mock_job.dest.file_name = f"result-{job_id.split('/')[-1]}"
+            dest = SimpleNamespace(file_name=f"result-{job_id.split('/')[-1]}")
         
-        return mock_job
+        return SimpleNamespace(name=job_id, state=SimpleNamespace(name=job_state), dest=dest)
     
     return _create_batch_response
 
@@ -321,14 +351,18 @@ def async_http_context_manager(mocker):
 # DI CONTAINER AND MANAGER MOCKS
 # =============================================================================
 
-@pytest.fixture
-def mock_di_container(mocker, mock_app_config, mock_competitor_config):
-    """Comprehensive DIContainer mock with proper manager initialization."""
-    mock_container = MagicMock(spec=DIContainer)
-    
-    # Configuration properties
-    mock_container.app_config = mock_app_config
-    mock_container.competitor_config = mock_competitor_config
+@pytest.fixture(scope="session")
+def _di_container_class(session_mocker):
+    """
+    Patches src.orchestrator.DIContainer once per session. Only run_pipeline
+    instantiates it, and mock_di_container points it at each test's container.
+    """
+    return session_mocker.patch('src.orchestrator.DIContainer')
+
+@pytest.fixture(scope="session")
+def _di_container_template(mock_competitor_config):
+    """Builds the DIContainer mock and its manager sub-mocks once per session."""
+    mock_container = spec_mock('DIContainer')
     
     # Configuration methods
     mock_container.get_competitors_to_process.return_value = mock_competitor_config['competitors']
@@ -336,17 +370,18 @@ def mock_di_container(mocker, mock_app_config, mock_competitor_config):
     mock_container.get_batch_threshold.return_value = 10
     
     # Manager properties with proper specs
-    mock_container.state_manager = MagicMock(spec=StateManager)
-    mock_container.scraper_manager = MagicMock(spec=ScraperManager)
-    mock_container.enrichment_manager = MagicMock(spec=EnrichmentManager)
-    mock_container.batch_manager = MagicMock(spec=BatchJobManager)
-    mock_container.export_manager = MagicMock(spec=ExportManager)
-    mock_container.api_connector = MagicMock(spec=GeminiAPIConnector)
+    mock_container.state_manager = spec_mock('StateManager')
+    mock_container.scraper_manager = spec_mock('ScraperManager')
+    mock_container.enrichment_manager = spec_mock('EnrichmentManager')
+    mock_container.batch_manager = spec_mock('BatchJobManager')
+    mock_container.export_manager = spec_mock('ExportManager')
+    mock_container.api_connector = spec_mock('GeminiAPIConnector')
     
     # Setup default behaviors
     mock_container.state_manager.load_raw_urls.return_value = set()
     mock_container.state_manager.load_raw_data.return_value = []
     mock_container.state_manager.load_processed_data.return_value = []
+    mock_container.state_manager.is_fully_enriched.return_value = False
     mock_container.state_manager.save_raw_data.return_value = "test_file.json"
     mock_container.state_manager.save_processed_data.return_value = "processed_file.json"
     mock_container.state_manager.get_latest_raw_filepath.return_value = "/test/path.json"
@@ -357,138 +392,184 @@ def mock_di_container(mocker, mock_app_config, mock_competitor_config):
     mock_container.enrichment_manager._find_posts_to_enrich = MagicMock(return_value=([], []))
     mock_container.batch_manager.check_and_load_results = AsyncMock()
     mock_container.batch_manager.submit_new_jobs = AsyncMock()
-    
-    # Mock the DIContainer class instantiation
-    mocker.patch('src.orchestrator.DIContainer', return_value=mock_container)
-    
     return mock_container
 
 @pytest.fixture
-def mock_state_manager(mocker):
-    """Enhanced StateManager mock with realistic behaviors."""
-    mock_manager = MagicMock(spec=StateManager)
+def mock_di_container(_di_container_class, _di_container_template, mock_app_config, mock_competitor_config):
+    """Comprehensive DIContainer mock with proper manager initialization."""
+    mock_container = clone(_di_container_template)
     
-    # Default return values
+    # Configuration properties are shared with their session fixtures, not copied
+    mock_container.app_config = mock_app_config
+    mock_container.competitor_config = mock_competitor_config
+    
+    # Point the session-wide DIContainer patch at this test's container
+    _di_container_class.reset_mock(side_effect=True)
+    _di_container_class.return_value = mock_container
+    
+    return mock_container
+
+@pytest.fixture(scope="session")
+def _state_manager_template():
+    """Builds the spec'd StateManager mock once per session."""
+    mock_manager = spec_mock('StateManager')
     mock_manager.load_raw_urls.return_value = set()
     mock_manager.load_raw_data.return_value = []
     mock_manager.load_processed_data.return_value = []
+    mock_manager.is_fully_enriched.return_value = False
     mock_manager.save_raw_data.return_value = "test_file.json"
     mock_manager.save_processed_data.return_value = "processed_file.json"
     mock_manager.get_latest_raw_filepath.return_value = "/test/path.json"
+    return mock_manager
+
+@pytest.fixture
+def mock_state_manager(mocker, _state_manager_template):
+    """Enhanced StateManager mock with realistic behaviors."""
+    mock_manager = clone(_state_manager_template)
     
-    # Add call tracking
-    mock_manager.save_calls = []
-    
-    def track_save_calls(*args, **kwargs):
-        mock_manager.save_calls.append((args, kwargs))
-        return "saved_file.json"
-    
-    mock_manager.save_raw_data.side_effect = track_save_calls
-    mock_manager.save_processed_data.side_effect = track_save_calls
+    # The side effect refers back to the mock, so it is wired on the copy
+    mock_manager.iter_processed_data.side_effect = lambda competitor_name: iter(mock_manager.load_processed_data.return_value)
     
     mocker.patch('src.state_management.state_manager.StateManager', return_value=mock_manager)
     return mock_manager
 
+@pytest.fixture(scope="session")
+def _scraper_manager_template():
+    """Builds the spec'd ScraperManager mock once per session."""
+    mock_manager = spec_mock('ScraperManager')
+    mock_manager.scrape_and_return_posts = AsyncMock(return_value=None)
+    return mock_manager
+
 @pytest.fixture
-def mock_scraper_manager(mocker):
+def mock_scraper_manager(mocker, _scraper_manager_template):
     """Enhanced ScraperManager mock."""
-    mock_manager = MagicMock(spec=ScraperManager)
-    mock_manager.scrape_and_return_posts = AsyncMock(return_value=None)
+    mock_manager = clone(_scraper_manager_template)
     
     mocker.patch('src.extract.scraper_manager.ScraperManager', return_value=mock_manager)
     return mock_manager
 
-@pytest.fixture
-def mock_enrichment_manager(mocker):
-    """Enhanced EnrichmentManager mock."""
-    mock_manager = MagicMock(spec=EnrichmentManager)
+@pytest.fixture(scope="session")
+def _enrichment_manager_template():
+    """Builds the spec'd EnrichmentManager mock once per session."""
+    mock_manager = spec_mock('EnrichmentManager')
     mock_manager.enrich_posts = AsyncMock(return_value=None)
     mock_manager._find_posts_to_enrich.return_value = ([], [])
+    return mock_manager
+
+@pytest.fixture
+def mock_enrichment_manager(mocker, _enrichment_manager_template):
+    """Enhanced EnrichmentManager mock."""
+    mock_manager = clone(_enrichment_manager_template)
     
     mocker.patch('src.transform.enrichment_manager.EnrichmentManager', return_value=mock_manager)
     return mock_manager
 
-@pytest.fixture
-def mock_batch_manager(mocker):
-    """Enhanced BatchJobManager mock."""
-    mock_manager = MagicMock(spec=BatchJobManager)
+@pytest.fixture(scope="session")
+def _batch_manager_template():
+    """Builds the spec'd BatchJobManager mock once per session."""
+    mock_manager = spec_mock('BatchJobManager')
     mock_manager.check_and_load_results = AsyncMock(return_value=None)
     mock_manager.submit_new_jobs = AsyncMock(return_value=None)
     mock_manager.consolidate_results = AsyncMock(return_value=[])
+    return mock_manager
+
+@pytest.fixture
+def mock_batch_manager(mocker, _batch_manager_template):
+    """Enhanced BatchJobManager mock."""
+    mock_manager = clone(_batch_manager_template)
     
     mocker.patch('src.transform.batch_manager.BatchJobManager', return_value=mock_manager)
     return mock_manager
 
+@pytest.fixture(scope="session")
+def _export_manager_template():
+    """Builds the spec'd ExportManager mock once per session."""
+    mock_manager = spec_mock('ExportManager')
+    mock_manager.run_export_process = MagicMock()
+    return mock_manager
+
 @pytest.fixture
-def mock_export_manager(mocker):
+def mock_export_manager(mocker, _export_manager_template):
     """Enhanced ExportManager mock."""
-    mock_manager = MagicMock(spec=ExportManager)
-    mock_manager.run_export_process = MagicMock()
+    mock_manager = clone(_export_manager_template)
     
     mocker.patch('src.load.export_manager.ExportManager', return_value=mock_manager)
     return mock_manager
 
-@pytest.fixture
-def mock_api_connector(mocker):
-    """Comprehensive GeminiAPIConnector mock with realistic behaviors."""
-    mock_connector = MagicMock(spec=GeminiAPIConnector)
+@functools.cache
+def _api_template():
+    """Builds, once, the spec'd GeminiAPIConnector mock that mock_api_connector clones."""
+    mock_connector = spec_mock('GeminiAPIConnector')
     
     # Setup client
     mock_connector.client = MagicMock()
     
-    # Setup async methods with realistic return values
-    mock_connector.enrich_post_live = AsyncMock(
-        return_value=("Test summary", "test, keywords", "ToFu")
-    )
-    mock_connector.batch_enrich_posts_live = AsyncMock(return_value=[])
+    # The spec already makes the async methods AsyncMocks; only their results are set
+    mock_connector.enrich_post_live.return_value = ("Test summary", "test, keywords", "ToFu", "Marketers", {})
+    mock_connector.batch_enrich_posts_live.return_value = []
     
     # Setup batch methods
-    mock_connector.create_batch_job = MagicMock(return_value="batches/mock-job-id")
-    mock_connector.check_batch_job = MagicMock(return_value="JOB_STATE_SUCCEEDED")
-    mock_connector.download_batch_results = MagicMock(return_value=[])
-    mock_connector.list_batch_jobs = MagicMock(return_value=[])
-    mock_connector.cancel_batch_job = MagicMock()
-    mock_connector.delete_batch_job_file = MagicMock()
+    mock_connector.create_batch_job.return_value = "batches/mock-job-id"
+    mock_connector.check_batch_job.return_value = "JOB_STATE_SUCCEEDED"
+    mock_connector.download_batch_results.return_value = []
+    mock_connector.list_batch_jobs.return_value = []
+    return mock_connector
+
+@pytest.fixture
+def mock_api_connector(mocker):
+    """Comprehensive GeminiAPIConnector mock with realistic behaviors."""
+    mock_connector = clone(_api_template())
     
     # Mock in multiple locations where it might be imported
     mocker.patch('src.api_connector.GeminiAPIConnector', return_value=mock_connector)
     mocker.patch('src.transform.live.GeminiAPIConnector', return_value=mock_connector)
+    mocker.patch('src.transform.batch_manager.GeminiAPIConnector', return_value=mock_connector)
     
     return mock_connector
 
-@pytest.fixture
-def mock_content_preprocessor(mocker):
-    """Enhanced ContentPreprocessor mock with realistic behaviors."""
-    mock_preprocessor = MagicMock(spec=ContentPreprocessor)
+def _identity(posts):
+    """Returns its argument unchanged; the default preprocessor side effect."""
+    return posts
+
+def _simulate_chunking(posts):
+    """Simulates chunking for testing"""
+    result = []
+    for post in posts:
+        if len(post.get('content', '')) > 6000:  # Simulate chunking threshold
+            # Create 2 chunks
+            for i in range(2):
+                chunk_post = post.copy()
+                chunk_post['title'] = f"{post['title']} (Part {i+1}/2)"
+                chunk_post['original_title'] = post['title']
+                chunk_post['chunk_index'] = i
+                chunk_post['total_chunks'] = 2
+                chunk_post['content_processing'] = {
+                    'chunked': True,
+                    'chunk_number': i + 1,
+                    'total_chunks': 2
+                }
+                result.append(chunk_post)
+        else:
+            result.append(post)
+    return result
+
+@pytest.fixture(scope="session")
+def _content_preprocessor_template():
+    """Builds the spec'd ContentPreprocessor mock once per session."""
+    mock_preprocessor = spec_mock('ContentPreprocessor')
     
     # Default behavior: return posts unchanged unless specified
-    mock_preprocessor.prepare_posts_for_enrichment = MagicMock(side_effect=lambda posts: posts)
-    mock_preprocessor.merge_chunked_results = MagicMock(side_effect=lambda posts: posts)
+    mock_preprocessor.prepare_posts_for_enrichment.side_effect = _identity
+    mock_preprocessor.merge_chunked_results.side_effect = _identity
     
     # Add methods for testing chunking behavior
-    def simulate_chunking(posts):
-        """Simulates chunking for testing"""
-        result = []
-        for post in posts:
-            if len(post.get('content', '')) > 6000:  # Simulate chunking threshold
-                # Create 2 chunks
-                for i in range(2):
-                    chunk_post = post.copy()
-                    chunk_post['title'] = f"{post['title']} (Part {i+1}/2)"
-                    chunk_post['original_title'] = post['title']
-                    chunk_post['chunk_index'] = i
-                    chunk_post['total_chunks'] = 2
-                    chunk_post['content_processing'] = {
-                        'chunked': True,
-                        'chunk_number': i + 1,
-                        'total_chunks': 2
-                    }
-                    result.append(chunk_post)
-            else:
-                result.append(post)
-        return result
-    
-    mock_preprocessor.simulate_chunking = simulate_chunking
+    mock_preprocessor.simulate_chunking = _simulate_chunking
+    return mock_preprocessor
+
+@pytest.fixture
+def mock_content_preprocessor(mocker, _content_preprocessor_template):
+    """Enhanced ContentPreprocessor mock with realistic behaviors."""
+    mock_preprocessor = clone(_content_preprocessor_template)
     
     # Mock in the locations where it's imported
     mocker.patch('src.transform.content_preprocessor.ContentPreprocessor', mock_preprocessor)
@@ -500,132 +581,84 @@ def mock_content_preprocessor(mocker):
 # CLI ARGUMENT FIXTURES
 # =============================================================================
 
-@pytest.fixture
-def mock_args_scrape():
-    """Mock CLI arguments for scrape command."""
-    return {
-        'days': 30,
-        'all': False,
-        'competitor': 'test_competitor',
-        'scrape': True,
-        'enrich': False,
-        'enrich_raw': False,
-        'check_job': False,
-        'export': None,
-        'export_format': None,
-        'wait': False,
-        'get_posts': False
-    }
+# Arguments shared by every command; each command only sets the flags it needs
+_BASE_ARGS = {
+    'competitor': 'test_competitor',
+    'scrape': False,
+    'get_posts': False,
+    'enrich': False,
+    'enrich_raw': False,
+    'check_job': False,
+    'export': None,
+    'export_format': None,
+    'wait': False,
+    'days': None,
+    'all': False
+}
+
+_COMMAND_ARGS = {
+    'scrape': {'scrape': True, 'days': 30},
+    'get_posts': {'get_posts': True, 'days': 30},
+    'enrich': {'enrich': True},
+    'export': {'export': True, 'export_format': 'json'},
+    'check_job': {'check_job': True},
+}
+
+# Read-only argument sets shared by every test; use args_override to change a field
+_ARGS = {
+    command: MappingProxyType({**_BASE_ARGS, **overrides})
+    for command, overrides in _COMMAND_ARGS.items()
+}
 
 @pytest.fixture
-def mock_args_get_posts():
-    """Mock CLI arguments for get-posts command."""
-    return {
-        'days': 30,
-        'all': False,
-        'competitor': 'test_competitor',
-        'scrape': False,
-        'enrich': False,
-        'enrich_raw': False,
-        'check_job': False,
-        'export': None,
-        'export_format': None,
-        'wait': False,
-        'get_posts': True
-    }
-
-@pytest.fixture
-def mock_args_enrich():
-    """Mock CLI arguments for enrich command."""
-    return {
-        'competitor': 'test_competitor',
-        'enrich': True,
-        'enrich_raw': False,
-        'check_job': False,
-        'export': None,
-        'export_format': None,
-        'wait': False,
-        'get_posts': False,
-        'scrape': False,
-        'days': None,
-        'all': False
-    }
-
-@pytest.fixture
-def mock_args_export():
-    """Mock CLI arguments for export command."""
-    return {
-        'competitor': 'test_competitor',
-        'export': True,
-        'export_format': 'json',
-        'enrich': False,
-        'enrich_raw': False,
-        'check_job': False,
-        'wait': False,
-        'get_posts': False,
-        'scrape': False,
-        'days': None,
-        'all': False
-    }
+def mock_args(request):
+    """
+    Mock CLI arguments for a command. Parametrize indirectly with the command name:
+    @pytest.mark.parametrize('mock_args', ['scrape'], indirect=True)
+    """
+    return _ARGS[request.param]
 
 @pytest.fixture
-def mock_args_check_job():
-    """Mock CLI arguments for check-job command."""
-    return {
-        'competitor': 'test_competitor',
-        'check_job': True,
-        'enrich': False,
-        'enrich_raw': False,
-        'export': None,
-        'export_format': None,
-        'wait': False,
-        'get_posts': False,
-        'scrape': False,
-        'days': None,
-        'all': False
-    }
+def args_override():
+    """Returns a helper that copies a read-only argument set with some fields changed."""
+    def _override(args, **changes):
+        return {**args, **changes}
+    return _override
 
 # =============================================================================
 # UTILITY AND WORKSPACE FIXTURES
 # =============================================================================
 
+# Competitor subdirectories created by the workspace and data directory fixtures
+_TEMP_COMPETITORS = ("test_competitor", "secondary_competitor")
+
+def _make_competitor_dirs(*parents):
+    """Creates each competitor subdirectory under every parent, parents included."""
+    for parent in parents:
+        for competitor in _TEMP_COMPETITORS:
+            (parent / competitor).mkdir(parents=True)
+
 @pytest.fixture
 def temp_workspace(tmp_path):
     """Creates a temporary workspace directory structure."""
     workspace = tmp_path / "workspace"
-    workspace.mkdir()
-    
-    # Create competitor subdirectories
-    (workspace / "test_competitor").mkdir()
-    (workspace / "secondary_competitor").mkdir()
-    
+    _make_competitor_dirs(workspace)
     return workspace
 
 @pytest.fixture
 def temp_data_dir(tmp_path):
     """Creates comprehensive temporary data directories."""
     data_dir = tmp_path / "data"
-    data_dir.mkdir()
-    
-    # Create raw data directories
-    raw_dir = data_dir / "raw"
-    raw_dir.mkdir()
-    (raw_dir / "test_competitor").mkdir()
-    (raw_dir / "secondary_competitor").mkdir()
-    
-    # Create processed data directories
-    processed_dir = data_dir / "processed"
-    processed_dir.mkdir()
-    (processed_dir / "test_competitor").mkdir()
-    (processed_dir / "secondary_competitor").mkdir()
-    
+    _make_competitor_dirs(data_dir / "raw", data_dir / "processed")
     return data_dir
 
-@pytest.fixture
-def temp_config_dir(tmp_path):
-    """Creates temporary config directory with mock config files."""
-    config_dir = tmp_path / "config"
-    config_dir.mkdir()
+@pytest.fixture(scope="session")
+def temp_config_dir(tmp_path_factory):
+    """
+    Creates a temporary config directory with mock config files, once per session.
+    Use temp_config_dir_mutable for a copy that a test may change.
+    """
+    config_dir = tmp_path_factory.mktemp("config")
     
     # Create mock config.json
     config_json = {
@@ -651,17 +684,20 @@ def temp_config_dir(tmp_path):
     
     return config_dir
 
+@pytest.fixture
+def temp_config_dir_mutable(tmp_path, temp_config_dir):
+    """Returns a private copy of temp_config_dir."""
+    return Path(shutil.copytree(temp_config_dir, tmp_path / "config"))
+
 @pytest.fixture
 def mock_file_operations(mocker):
     """Comprehensive file operation mocking."""
-    # Mock os operations
-    mocker.patch('os.makedirs')
-    mocker.patch('os.path.exists', return_value=True)
-    mocker.patch('os.path.isdir', return_value=True)
-    mocker.patch('os.listdir', return_value=['test_file.json'])
-    mocker.patch('os.path.join', side_effect=lambda *args: '/'.join(args))
-    mocker.patch('os.remove')
-    mocker.patch('os.rename')
+    # Mock os operations, one patch per module
+    os_mocks = mocker.patch.multiple('os', makedirs=DEFAULT, listdir=DEFAULT, remove=DEFAULT, rename=DEFAULT)
+    path_mocks = mocker.patch.multiple('os.path', exists=DEFAULT, isdir=DEFAULT)
+    os_mocks['listdir'].return_value = ['test_file.json']
+    path_mocks['exists'].return_value = True
+    path_mocks['isdir'].return_value = True
     
     # Mock file operations
     mock_file = mock_open(read_data='{"test": "data"}')
@@ -669,10 +705,29 @@ def mock_file_operations(mocker):
     
     return {
         'open': mock_file,
-        'makedirs': mocker.patch('os.makedirs'),
-        'exists': mocker.patch('os.path.exists'),
-        'isdir': mocker.patch('os.path.isdir'),
-        'listdir': mocker.patch('os.listdir'),
-        'remove': mocker.patch('os.remove'),
-        'rename': mocker.patch('os.rename')
-    }
\ No newline at end of file
+        'makedirs': os_mocks['makedirs'],
+        'exists': path_mocks['exists'],
+        'isdir': path_mocks['isdir'],
+        'listdir': os_mocks['listdir'],
+        'remove': os_mocks['remove'],
+        'rename': os_mocks['rename']
+    }
+
+def _fake_open(files):
+    """
+    Returns an open() replacement that serves the given {path: bytes} contents
+    from memory, in binary or text mode depending on the requested mode.
+    """
+    def _open(path, mode='r', *args, **kwargs):
+        data = files[str(path)]
+        return io.BytesIO(data) if 'b' in mode else io.StringIO(data.decode('utf-8'))
+    return _open
+
+@pytest.fixture
+def fake_open_factory():
+    """
+    Provides a factory for in-memory open() replacements. Patch builtins.open
+    with fake_open_factory({path: contents}) so each path reads its own data,
+    whatever order the code under test opens them in.
+    """
+    return _fake_open
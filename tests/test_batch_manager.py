@@ -10,12 +10,13 @@ from unittest.mock import MagicMock, AsyncMock, mock_open
 from src.transform.batch_manager import BatchJobManager
 from src.exceptions import BatchJobError
 
-@pytest.fixture
+# These literals are only read by the tests, so they are built once per session
+@pytest.fixture(scope="session")
 def mock_app_config():
     """Provides a mock application configuration."""
     return {"batch_threshold": 10}
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_pending_jobs():
     """Sample pending jobs data."""
     return {
@@ -23,21 +24,31 @@ def mock_pending_jobs():
         "jobs": [
             {
                 "job_id": "batches/test-job-1",
-                "raw_posts_file": "temp_posts_chunk_1.jsonl",
+                "raw_posts_file": "a1b2c3/temp_posts_chunk_1.jsonl",
                 "num_posts": 5
             },
             {
                 "job_id": "batches/test-job-2", 
-                "raw_posts_file": "temp_posts_chunk_2.jsonl",
+                "raw_posts_file": "a1b2c3/temp_posts_chunk_2.jsonl",
                 "num_posts": 3
             }
         ]
     }
 
-@pytest.mark.asyncio
 class TestBatchJobManager:
     """Test suite for BatchJobManager functionality."""
 
+    def test_init_reuses_injected_dependencies(self, mock_app_config, mock_state_manager, mocker):
+        """Tests that injected dependencies are used instead of building new ones."""
+        mock_connector_class = mocker.patch('src.transform.batch_manager.GeminiAPIConnector')
+        connector = MagicMock()
+
+        manager = BatchJobManager(mock_app_config, mock_state_manager, connector)
+
+        assert manager.api_connector is connector
+        assert manager.state_manager is mock_state_manager
+        mock_connector_class.assert_not_called()
+
     async def test_submit_new_jobs_single_chunk(self, mock_app_config, sample_competitor_config, sample_posts, mock_api_connector, mocker, tmp_path):
         """Tests submitting jobs when posts fit in single chunk."""
         # Mock workspace creation
@@ -158,34 +169,46 @@ class TestBatchJobManager:
 
         assert result is None
 
-    async def test_consolidate_results_success(self, mock_app_config, sample_competitor_config, mock_pending_jobs, mock_api_connector, mocker):
+    async def test_consolidate_results_success(self, mock_app_config, sample_competitor_config, mock_pending_jobs, mock_api_connector, fake_open_factory, mocker):
         """Tests successful result consolidation."""
-        # Mock file operations
+        workspace = os.path.join('workspace', sample_competitor_config['name'])
+        source_posts = [
+            {'title': 'Post 1', 'url': 'https://test.com/post-1'},
+            {'title': 'Post 2', 'url': 'https://test.com/post-2'},
+        ]
+
+        # Serve the chunk files and the source file from memory, keyed by path
         mocker.patch('os.path.exists', return_value=True)
-        mocker.patch('builtins.open', mock_open(read_data='{"title": "Test Post"}'))
-        
-        # Mock API download
-        mock_api_connector.download_batch_results.return_value = [
-            {'title': 'Enriched Post', 'summary': 'Test summary', 'seo_keywords': 'test, keywords'}
+        mocker.patch('builtins.open', fake_open_factory({
+            os.path.join(workspace, 'a1b2c3/temp_posts_chunk_1.jsonl'): (json.dumps(source_posts[0]) + '\n').encode(),
+            os.path.join(workspace, 'a1b2c3/temp_posts_chunk_2.jsonl'): (json.dumps(source_posts[1]) + '\n').encode(),
+            'source_file.json': json.dumps(source_posts).encode(),
+        }))
+
+        # Mock API download, one enriched post per job
+        mock_api_connector.download_batch_results.side_effect = lambda job_id, posts: [
+            {**post, 'summary': 'Test summary', 'seo_keywords': 'test, keywords', 'funnel_stage': 'ToFu'}
+            for post in posts
         ]
-        
-        # Mock performance tracking
+
+        # Mock performance tracking and download settings
         mocker.patch('src.utils.update_performance_log')
-        
-        # Mock content preprocessor merge
-        mocker.patch('src.content_preprocessor.ContentPreprocessor.merge_chunked_results', side_effect=lambda x: x)
+        mocker.patch('src.utils.get_batch_enrichment_config', return_value={'max_concurrent_downloads': 4})
 
         manager = BatchJobManager(mock_app_config)
-        
+        mock_save = mocker.patch.object(manager.state_manager, 'save_processed_data')
+
         result = await manager.consolidate_results(
-            sample_competitor_config, 
-            mock_pending_jobs['jobs'], 
-            mock_app_config, 
+            sample_competitor_config,
+            mock_pending_jobs['jobs'],
+            mock_app_config,
             "source_file.json"
         )
 
         assert len(result) == len(mock_pending_jobs['jobs'])  # One result per job
-        mock_api_connector.download_batch_results.assert_called()
+        assert [post['summary'] for post in result] == ['Test summary', 'Test summary']
+        assert mock_api_connector.download_batch_results.call_count == 2
+        mock_save.assert_called_once_with(result, sample_competitor_config['name'], 'source_file.json')
 
     def test_split_posts_into_chunks_small_posts(self, mock_app_config):
         """Tests chunking when posts are small enough for single chunk."""
@@ -197,11 +220,10 @@ class TestBatchJobManager:
         assert len(chunks) == 1
         assert len(chunks[0]) == 5
 
-    def test_split_posts_into_chunks_large_posts(self, mock_app_config):
+    def test_split_posts_into_chunks_large_posts(self, mock_app_config, big_content_50mb):
         """Tests chunking when posts exceed size limits."""
         # Create posts that will exceed size limit
-        large_content = 'x' * (50 * 1024 * 1024)  # 50MB content
-        large_posts = [{'content': large_content} for _ in range(3)]
+        large_posts = [{'content': big_content_50mb} for _ in range(3)]
         
         manager = BatchJobManager(mock_app_config)
         chunks = manager._split_posts_into_chunks(large_posts)
@@ -233,20 +255,28 @@ class TestBatchJobManager:
         
         mock_file = mock_open()
         mocker.patch('builtins.open', mock_file)
+        mock_replace = mocker.patch('os.replace')
 
         manager = BatchJobManager(mock_app_config)
         manager._save_pending_jobs("test_competitor", job_list, "source.json")
 
-        mock_file.assert_called_once()
+        # Written to a temporary file first, then moved into place
+        jobs_file_path = str(tmp_path / "pending_jobs.json")
+        mock_file.assert_called_once_with(f"{jobs_file_path}.tmp", "wb")
+        mock_replace.assert_called_once_with(f"{jobs_file_path}.tmp", jobs_file_path)
+        written = mock_file().write.call_args[0][0]
+        assert json.loads(written) == {"source_raw_filepath": "source.json", "jobs": job_list}
 
-    def test_cleanup_workspace(self, mock_app_config, mock_pending_jobs, mocker):
+    def test_cleanup_workspace(self, mock_app_config, sample_competitor_config, mock_pending_jobs, mocker):
         """Tests workspace cleanup after successful processing."""
         mocker.patch('os.path.exists', return_value=True)
-        mocker.patch('os.remove')
+        mock_remove = mocker.patch('os.remove')
+        mock_rmtree = mocker.patch('shutil.rmtree')
 
         manager = BatchJobManager(mock_app_config)
         manager._cleanup_workspace(sample_competitor_config, mock_pending_jobs['jobs'])
 
-        # Should remove job files and pending jobs file
-        expected_removes = len(mock_pending_jobs['jobs']) + 1  # job files + pending_jobs.json
-        assert mocker.patch('os.remove').call_count >= expected_removes
\ No newline at end of file
+        # The submission folder goes in one call; only pending_jobs.json is removed on its own
+        workspace = os.path.join('workspace', sample_competitor_config['name'])
+        mock_rmtree.assert_called_once_with(os.path.join(workspace, 'a1b2c3'), ignore_errors=True)
+        mock_remove.assert_called_once_with(os.path.join(workspace, 'pending_jobs.json'))
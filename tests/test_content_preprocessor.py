@@ -2,22 +2,22 @@
 # This file contains unit tests for the content preprocessing logic.
 
 import pytest
-from src.content_preprocessor import ContentPreprocessor
+from src.transform.content_preprocessor import ContentPreprocessor
 
 class TestContentPreprocessor:
     """Test suite for ContentPreprocessor functionality."""
 
     def test_clean_content_removes_smart_quotes(self):
         """Test that smart quotes are properly converted to regular quotes."""
-        content = "This is 'quoted text' with "smart quotes" and—em dashes."
+        content = "This is \u2018quoted text\u2019 with \u201csmart quotes\u201d and\u2014em dashes."
         
         cleaned = ContentPreprocessor._clean_content(content)
         
-        assert "'" not in cleaned
-        assert "'" not in cleaned
-        assert """ not in cleaned
-        assert """ not in cleaned
-        assert "—" not in cleaned
+        assert "\u2018" not in cleaned
+        assert "\u2019" not in cleaned
+        assert "\u201c" not in cleaned
+        assert "\u201d" not in cleaned
+        assert "\u2014" not in cleaned
         assert cleaned == "This is 'quoted text' with \"smart quotes\" and - em dashes."
 
     def test_clean_content_handles_unicode_characters(self):
@@ -41,6 +41,14 @@ class TestContentPreprocessor:
         assert "\n\n" not in cleaned
         assert cleaned == "Text with excessive whitespace."
 
+    def test_clean_content_long_content_bypasses_cache(self):
+        """Test that content too long for the cleaning cache is cleaned the same way."""
+        snippet = "\u201cQuoted\u201d   text\u2026 "
+        long_content = snippet * 1000
+        
+        assert ContentPreprocessor._clean_content(long_content) == \
+            " ".join([ContentPreprocessor._clean_content(snippet)] * 1000)
+
     def test_prepare_posts_short_content(self, sample_posts):
         """Test preprocessing posts with content that doesn't need chunking."""
         processed = ContentPreprocessor.prepare_posts_for_enrichment(sample_posts)
@@ -92,11 +100,9 @@ class TestContentPreprocessor:
             clean_chunk = chunk.replace(" [Continued in next section]", "")
             assert clean_chunk.endswith(('.', '!', '?'))
 
-    def test_create_content_chunks_with_continuation_markers(self):
+    def test_create_content_chunks_with_continuation_markers(self, long_content_10k):
         """Test that continuation markers are properly added."""
-        content = "A" * 10000  # Long content that will definitely be chunked
-        
-        chunks = ContentPreprocessor._create_content_chunks(content, "Test")
+        chunks = ContentPreprocessor._create_content_chunks(long_content_10k, "Test")
         
         # Should have multiple chunks
         assert len(chunks) > 1
@@ -237,6 +243,30 @@ class TestContentPreprocessor:
         assert len(chunked_posts) == 1
         assert chunked_posts[0]['summary'] == 'Chunk 1 summary Chunk 2 summary'
 
+    def test_merge_chunked_results_keeps_same_titled_posts_apart(self):
+        """Test that chunks are grouped by post URL, not by title."""
+        posts = [
+            {
+                'title': f'Shared Title (Part {i + 1}/2)',
+                'original_title': 'Shared Title',
+                'url': url,
+                'chunk_index': i,
+                'summary': f'{url} part {i + 1}',
+                'content_processing': {'chunked': True}
+            }
+            for url in ('https://test.com/a', 'https://test.com/b')
+            for i in range(2)
+        ]
+        
+        merged = ContentPreprocessor.merge_chunked_results(posts)
+        
+        assert len(merged) == 2
+        assert {p['url']: p['summary'] for p in merged} == {
+            'https://test.com/a': 'https://test.com/a part 1 https://test.com/a part 2',
+            'https://test.com/b': 'https://test.com/b part 1 https://test.com/b part 2'
+        }
+        assert all(p['title'] == 'Shared Title' for p in merged)
+
     def test_handles_empty_content(self):
         """Test handling of posts with no content."""
         posts = [
@@ -0,0 +1,75 @@
+# tests/test_enrichment_cache.py
+# This file contains unit tests for the live enrichment cache.
+
+from unittest.mock import MagicMock, AsyncMock
+
+from src.api_connector import GeminiAPIConnector
+from src.transform.enrichment_cache import EnrichmentCache
+
+RESULT = ("A summary", "seo, keywords", "ToFu", "Marketing teams", {"content_depth": "Deep"})
+
+class TestEnrichmentCache:
+    """Test suite for EnrichmentCache functionality."""
+
+    def test_make_key_depends_on_model_and_prompt(self):
+        """Tests that keys differ by model and by prompt, and are stable."""
+        key = EnrichmentCache.make_key("gemini-2.0-flash", "prompt")
+
+        assert key == EnrichmentCache.make_key("gemini-2.0-flash", "prompt")
+        assert key != EnrichmentCache.make_key("gemini-2.0-flash-lite", "prompt")
+        assert key != EnrichmentCache.make_key("gemini-2.0-flash", "other prompt")
+
+    def test_put_then_get_survives_reopen(self, tmp_path):
+        """Tests that stored results are read back from disk by a new cache."""
+        db_path = str(tmp_path / "cache" / "enrichment.sqlite")
+        cache = EnrichmentCache(db_path)
+        cache.put("key", RESULT)
+        cache.close()
+
+        reopened = EnrichmentCache(db_path)
+
+        assert reopened.get("key") == RESULT
+        assert reopened.get("missing") is None
+        reopened.close()
+
+    def test_memory_layer_evicts_least_recently_used(self, tmp_path):
+        """Tests that the in-memory layer is bounded while disk keeps every entry."""
+        cache = EnrichmentCache(str(tmp_path / "enrichment.sqlite"), memory_entries=2)
+        cache.put("a", RESULT)
+        cache.put("b", RESULT)
+        cache.get("a")
+        cache.put("c", RESULT)
+
+        assert list(cache._memory) == ["a", "c"]
+        assert cache.get("b") == RESULT
+        cache.close()
+
+    def test_unavailable_database_falls_back_to_memory(self, tmp_path):
+        """Tests that a database path that can't be opened doesn't break the cache."""
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        cache = EnrichmentCache(str(blocker / "enrichment.sqlite"))
+
+        cache.put("key", RESULT)
+
+        assert cache.get("key") == RESULT
+
+
+async def test_enrich_post_live_uses_cache(tmp_path, mocker):
+    """
+    Tests that a cached prompt skips the API call, and a fresh one is stored.
+    """
+    cache = EnrichmentCache(str(tmp_path / "enrichment.sqlite"))
+    mocker.patch('src.api_connector._get_client', return_value=MagicMock())
+    connector = GeminiAPIConnector(cache)
+    response = MagicMock()
+    response.text = '{"summary": "A summary", "seo_keywords": ["seo", "keywords"], "funnel_stage": "ToFu", "target_audience": "Marketing teams", "strategic_analysis": {"content_depth": "Deep"}}'
+    connector.client.aio.models.generate_content = AsyncMock(return_value=response)
+
+    first = await connector.enrich_post_live("Some content", "gemini-2.0-flash", "Post")
+    second = await connector.enrich_post_live("Some content", "gemini-2.0-flash", "Post")
+
+    assert first == RESULT
+    assert second == RESULT
+    connector.client.aio.models.generate_content.assert_awaited_once()
+    cache.close()
@@ -3,28 +3,46 @@
 
 import pytest
 import json
+from types import MappingProxyType
 from unittest.mock import MagicMock, AsyncMock, PropertyMock
+from google.genai import errors
 
 # Import the module to test and the connector to mock
 from src.transform import live
-from src.api_connector import GeminiAPIConnector
+from src.api_connector import GeminiAPIConnector, RateLimiter
 
-pytestmark = pytest.mark.asyncio
+@pytest.fixture(autouse=True)
+def reset_shared_connector(monkeypatch):
+    """Ensures each test starts without a cached module-level connector."""
+    monkeypatch.setattr(live, '_CONNECTOR', None)
 
-@pytest.fixture
+# Read-only posts shared by every test; the live router never modifies its input
+_MOCK_POSTS = (
+    MappingProxyType({'title': 'Live Test Post 1', 'publication_date': '2025-08-10', 'content': 'Content 1.'}),
+    MappingProxyType({'title': 'Live Test Post 2', 'publication_date': '2025-08-09', 'content': 'Content 2.'}),
+)
+
+@pytest.fixture(scope="session")
 def mock_posts():
-    """Returns a list of mock posts for testing the live transformation."""
-    return [
-        {'title': 'Live Test Post 1', 'publication_date': '2025-08-10', 'content': 'Content 1.'},
-        {'title': 'Live Test Post 2', 'publication_date': '2025-08-09', 'content': 'Content 2.'}
-    ]
+    """Returns the read-only mock posts for testing the live transformation."""
+    return _MOCK_POSTS
+
+class _StubConnector:
+    """
+    Stands in for GeminiAPIConnector with only the attributes the live router
+    uses; much cheaper to build than a spec'd MagicMock.
+    """
+    __slots__ = ("client", "batch_enrich_posts_live")
+
+    def __init__(self, client=True):
+        # The real client is created in GeminiAPIConnector.__init__; the router only checks it is set
+        self.client = object() if client else None
+        self.batch_enrich_posts_live = AsyncMock()
 
 @pytest.fixture
 def mock_api_connector(mocker):
     """Mocks the GeminiAPIConnector for isolated testing of the manager."""
-    mock_connector = MagicMock(spec=GeminiAPIConnector)
-    # The 'client' attribute is set during the real class's __init__; we need to mock it.
-    mock_connector.client = MagicMock()
+    mock_connector = _StubConnector()
     mocker.patch('src.transform.live.GeminiAPIConnector', return_value=mock_connector)
     return mock_connector
 
@@ -32,10 +50,10 @@ async def test_transform_posts_live_success(mocker, mock_posts, mock_api_connect
     """
     Tests a successful live transformation using the connector.
     """
-    mock_api_connector.batch_enrich_posts_live = AsyncMock(return_value=[
+    mock_api_connector.batch_enrich_posts_live.return_value = [
         {'title': 'Live Test Post 1', 'publication_date': '2025-08-10', 'content': 'Content 1.', 'summary': 'Mock summary 1', 'seo_keywords': 'mock1, mock2'},
         {'title': 'Live Test Post 2', 'publication_date': '2025-08-09', 'content': 'Content 2.', 'summary': 'Mock summary 2', 'seo_keywords': 'mock3, mock4'}
-    ])
+    ]
     
     # Run the function
     model_name_to_test = "gemini-2.0-flash"
@@ -46,4 +64,163 @@ async def test_transform_posts_live_success(mocker, mock_posts, mock_api_connect
     mock_api_connector.batch_enrich_posts_live.assert_called_once()
     
     assert transformed_posts[0]['summary'] == "Mock summary 1"
-    assert transformed_posts[0]['seo_keywords'] == "mock1, mock2"
\ No newline at end of file
+    assert transformed_posts[0]['seo_keywords'] == "mock1, mock2"
+async def test_transform_posts_live_uses_injected_connector(mocker, mock_posts):
+    """
+    Tests that a shared connector is used as-is instead of creating a new one.
+    """
+    connector_cls = mocker.patch('src.transform.live.GeminiAPIConnector')
+    shared_connector = _StubConnector()
+    shared_connector.batch_enrich_posts_live.return_value = mock_posts
+
+    transformed_posts = await live.transform_posts_live(mock_posts, "gemini-2.0-flash", connector=shared_connector)
+
+    assert transformed_posts == mock_posts
+    connector_cls.assert_not_called()
+    shared_connector.batch_enrich_posts_live.assert_awaited_once_with(mock_posts, "gemini-2.0-flash")
+
+async def test_transform_posts_live_reuses_fallback_connector(mocker, mock_posts):
+    """
+    Tests that the fallback connector is created once, even when its client is unavailable.
+    """
+    dead_connector = _StubConnector(client=False)
+    connector_cls = mocker.patch('src.transform.live.GeminiAPIConnector', return_value=dead_connector)
+
+    first = await live.transform_posts_live(mock_posts, "gemini-2.0-flash")
+    second = await live.transform_posts_live(mock_posts, "gemini-2.0-flash")
+
+    assert first is mock_posts and second is mock_posts
+    connector_cls.assert_called_once()
+
+async def test_rate_limiter_spaces_out_calls(mocker):
+    """
+    Tests that the rate limiter hands out evenly spaced slots to a burst of calls.
+    """
+    sleep = mocker.patch('src.api_connector.asyncio.sleep', new_callable=AsyncMock)
+    mocker.patch('src.api_connector.time.monotonic', return_value=100.0)
+    limiter = RateLimiter(requests_per_minute=120)
+
+    for _ in range(3):
+        await limiter.wait()
+
+    assert [c.args[0] for c in sleep.await_args_list] == [pytest.approx(0.5), pytest.approx(1.0)]
+
+async def test_enrich_post_live_retries_rate_limits_but_not_client_errors(mocker):
+    """
+    Tests that a 429 is retried after a jittered delay, while other 4xx errors stop immediately.
+    """
+    mocker.patch('src.api_connector._get_client', return_value=MagicMock())
+    sleep = mocker.patch('src.api_connector.asyncio.sleep', new_callable=AsyncMock)
+    connector = GeminiAPIConnector()
+    connector.rate_limiter = None
+    response = MagicMock()
+    response.text = '{"summary": "Summary", "seo_keywords": ["seo"], "funnel_stage": "MoFu"}'
+    rate_limited = errors.ClientError(429, {'error': {'message': 'Quota exceeded', 'status': 'RESOURCE_EXHAUSTED'}})
+    generate = AsyncMock(side_effect=[rate_limited, response])
+    connector.client.aio.models.generate_content = generate
+
+    result = await connector.enrich_post_live("Some content", "gemini-2.0-flash", "Post")
+
+    assert result[0] == "Summary"
+    assert generate.await_count == 2
+    assert 0 <= sleep.await_args.args[0] <= 1
+
+    bad_request = errors.ClientError(400, {'error': {'message': 'Bad request', 'status': 'INVALID_ARGUMENT'}})
+    generate = AsyncMock(side_effect=bad_request)
+    connector.client.aio.models.generate_content = generate
+
+    result = await connector.enrich_post_live("Other content", "gemini-2.0-flash", "Post")
+
+    assert result[:3] == ("N/A", "N/A", "N/A")
+    generate.assert_awaited_once()
+
+async def test_retry_delay_honours_retry_after():
+    """
+    Tests that a Retry-After header overrides the backoff, capped at the maximum delay.
+    """
+    response = MagicMock()
+    response.headers = {'retry-after': '7'}
+    error = errors.ClientError(429, {'error': {'message': 'Quota exceeded'}}, response)
+
+    assert GeminiAPIConnector._retry_delay(0, error) == 7.0
+    response.headers = {'retry-after': '600'}
+    assert GeminiAPIConnector._retry_delay(0, error) == 60
+
+async def test_enrich_post_live_uses_parsed_response(mocker):
+    """
+    Tests that a response already decoded by the SDK against the schema is used as-is.
+    """
+    mocker.patch('src.api_connector._get_client', return_value=MagicMock())
+    connector = GeminiAPIConnector()
+    connector.rate_limiter = None
+    response = MagicMock()
+    response.parsed = {'summary': 'Summary', 'seo_keywords': ['a', 'b'], 'funnel_stage': 'BoFu',
+                       'target_audience': 'IT professionals', 'strategic_analysis': {'content_depth': 'Deep'}}
+    response.text = 'not json'
+    generate = AsyncMock(return_value=response)
+    connector.client.aio.models.generate_content = generate
+
+    result = await connector.enrich_post_live("Some content", "gemini-2.0-flash", "Post")
+
+    assert result == ('Summary', 'a, b', 'BoFu', 'IT professionals', {'content_depth': 'Deep'})
+    assert generate.await_args.kwargs['config'].response_schema is not None
+
+async def test_batch_enrich_posts_live_dedupes_identical_content(mocker):
+    """
+    Tests that posts sharing content are enriched with a single API call.
+    """
+    mocker.patch('src.api_connector._get_client', return_value=MagicMock())
+    connector = GeminiAPIConnector()
+    result = ('Summary', 'seo', 'ToFu', 'Marketing teams', {'content_depth': 'Deep'})
+    connector.enrich_post_live = AsyncMock(return_value=result)
+    posts = [
+        {'title': 'Original', 'content': 'Shared content for both posts', 'publication_date': '2024-01-01'},
+        {'title': 'Syndicated', 'content': 'Shared content for both posts', 'publication_date': '2024-01-02'},
+        {'title': 'Empty', 'content': 'N/A', 'publication_date': 'N/A'},
+    ]
+
+    enriched = await connector.batch_enrich_posts_live(posts, "gemini-2.0-flash")
+
+    connector.enrich_post_live.assert_awaited_once()
+    assert [p['summary'] for p in enriched] == ['Summary', 'Summary', 'N/A']
+    assert enriched[0]['strategic_analysis'] is not enriched[1]['strategic_analysis']
+
+async def test_enrich_posts_group_live_splits_results_and_falls_back(mocker):
+    """
+    Tests that a grouped response is mapped back by position, and that a mismatched one
+    falls back to per-post calls.
+    """
+    mocker.patch('src.api_connector._get_client', return_value=MagicMock())
+    connector = GeminiAPIConnector()
+    connector.rate_limiter = None
+    posts = [{'title': 'One', 'content': 'First post content'}, {'title': 'Two', 'content': 'Second post content'}]
+    response = MagicMock()
+    response.parsed = [
+        {'summary': 'First', 'seo_keywords': ['a'], 'funnel_stage': 'ToFu', 'target_audience': 'IT', 'strategic_analysis': {}},
+        {'summary': 'Second', 'seo_keywords': ['b'], 'funnel_stage': 'MoFu', 'target_audience': 'IT', 'strategic_analysis': {}},
+    ]
+    connector.client.aio.models.generate_content = AsyncMock(return_value=response)
+    connector.enrich_post_live = AsyncMock()
+
+    results = await connector.enrich_posts_group_live(posts, "gemini-2.0-flash")
+
+    assert [r[0] for r in results] == ['First', 'Second']
+    connector.enrich_post_live.assert_not_awaited()
+
+    response.parsed = response.parsed[:1]
+    connector.enrich_post_live = AsyncMock(return_value=('Single', 'seo', 'BoFu', 'IT', {}))
+
+    results = await connector.enrich_posts_group_live(posts, "gemini-2.0-flash")
+
+    assert [r[0] for r in results] == ['Single', 'Single']
+    assert connector.enrich_post_live.await_count == 2
+
+async def test_group_posts_respects_count_and_size():
+    """
+    Tests that posts are packed in order without exceeding the group size or character budget.
+    """
+    posts = [{'content': 'x' * size} for size in (10, 10, 10, 30, 5)]
+
+    groups = GeminiAPIConnector._group_posts(posts, posts_per_request=2, max_chars=25)
+
+    assert [[len(p['content']) for p in group] for group in groups] == [[10, 10], [10], [30], [5]]
@@ -6,58 +6,36 @@ import json
 from types import SimpleNamespace
 from src.load import exporters
 
-def test_format_as_md_with_headings():
-    """
-    Tests that the markdown formatter correctly handles headings
-    when the tag format is correct.
-    """
-    posts = [
-        {
-            'title': 'Test Post',
-            'url': 'https://example.com/test-post',
-            'publication_date': '2025-08-26',
-            'summary': 'A test summary.',
-            'seo_keywords': 'keyword1, keyword2',
-            'seo_meta_keywords': 'meta1, meta2',
-            'funnel_stage': 'ToFu',
-            'headings': [
-                {'tag': 'h1', 'text': 'Main Heading'},
-                {'tag': 'h2', 'text': 'Sub Heading'},
-                {'tag': 'h3', 'text': 'Sub-sub Heading'}
-            ],
-            'schemas': []
-        }
-    ]
-    
-    expected_output_part = "# Main Heading\n## Sub Heading\n### Sub-sub Heading"
-    
-    formatted_data = exporters._format_as_md(posts)
-    assert expected_output_part in formatted_data
+# Fields shared by the markdown formatter tests; each test adds its own headings
+_BASE_POST = {
+    'title': 'Test Post',
+    'url': 'https://example.com/test-post',
+    'publication_date': '2025-08-26',
+    'summary': 'A test summary.',
+    'seo_keywords': 'keyword1, keyword2',
+    'seo_meta_keywords': 'meta1, meta2',
+    'funnel_stage': 'ToFu',
+    'schemas': []
+}
 
-def test_format_as_md_with_invalid_headings(caplog):
+@pytest.mark.parametrize("headings,expected_output_part", [
+    # Valid tags are nested by level in the outline
+    ([{'tag': 'h1', 'text': 'Main Heading'},
+      {'tag': 'h2', 'text': 'Sub Heading'},
+      {'tag': 'h3', 'text': 'Sub-sub Heading'}],
+     "- Main Heading\n- Sub Heading\n  - Sub-sub Heading"),
+    # An invalid tag is listed at the top level instead of crashing
+    ([{'tag': 'h1', 'text': 'Main Heading'},
+      {'tag': 'h', 'text': 'Invalid Heading'},
+      {'tag': 'h2', 'text': 'Sub Heading'}],
+     "- Main Heading\n- Invalid Heading\n- Sub Heading"),
+], ids=["valid_headings", "invalid_headings"])
+def test_format_as_md_headings(headings, expected_output_part):
     """
-    Tests that the markdown formatter gracefully handles
-    invalid headings without crashing.
+    Tests that the markdown formatter outlines headings by level and
+    handles invalid heading tags gracefully.
     """
-    posts = [
-        {
-            'title': 'Bad Post',
-            'url': 'https://example.com/bad-post',
-            'publication_date': '2025-08-26',
-            'summary': 'A bad test summary.',
-            'seo_keywords': 'keyword1, keyword2',
-            'seo_meta_keywords': 'meta1, meta2',
-            'funnel_stage': 'ToFu',
-            'headings': [
-                {'tag': 'h1', 'text': 'Main Heading'},
-                {'tag': 'h', 'text': 'Invalid Heading'}, # <-- This is the invalid tag
-                {'tag': 'h2', 'text': 'Sub Heading'}
-            ],
-            'schemas': []
-        }
-    ]
-    
-    expected_output_part = "# Main Heading\n- Invalid Heading\n## Sub Heading"
+    posts = [{**_BASE_POST, 'headings': headings}]
     
     formatted_data = exporters._format_as_md(posts)
-    assert expected_output_part in formatted_data
\ No newline at end of file
+    assert expected_output_part in formatted_data
@@ -10,12 +10,19 @@ from types import SimpleNamespace # <--- ADD THIS
 from src.extract.blog_patterns import single_list
 from src.extract._common import ScrapeStats
 
+# Listing pages served to the pagination test, built once at import. The
+# scraper only reads status_code and text, so the responses can be shared.
+_PAGE_1_HTML = '<html><body><a class="post" href="/post1">Post 1</a><a class="next" href="/blog?page=2">Next</a></body></html>'
+_PAGE_2_HTML = '<html><body><h1>No more posts</h1></body></html>'
+_MOCK_REQUEST = httpx.Request("GET", "https://loopy.com")
+_PAGE_1 = httpx.Response(200, html=_PAGE_1_HTML, request=_MOCK_REQUEST)
+_PAGE_2 = httpx.Response(200, html=_PAGE_2_HTML, request=_MOCK_REQUEST)
+
 @pytest.fixture
 def mock_stats():
     """A simple fixture to provide a stats object for tests."""
     return ScrapeStats()
 
-@pytest.mark.asyncio
 async def test_single_list_scraper_prevents_infinite_loop(mocker, mock_stats):
     """
     Tests that the single_list scraper correctly stops and prevents an infinite loop.
@@ -30,15 +37,7 @@ async def test_single_list_scraper_prevents_infinite_loop(mocker, mock_stats):
         "next_page_selector": "a.next"
     }
 
-    page_1_html = '<html><body><a class="post" href="/post1">Post 1</a><a class="next" href="/blog?page=2">Next</a></body></html>'
-    page_2_html = '<html><body><h1>No more posts</h1></body></html>'
-
-    # --- FIX: Provide a dummy request object to the mock responses ---
-    mock_request = httpx.Request("GET", "https://loopy.com")
-    mock_get = AsyncMock(side_effect=[
-        httpx.Response(200, html=page_1_html, request=mock_request),
-        httpx.Response(200, html=page_2_html, request=mock_request),
-    ])
+    mock_get = AsyncMock(side_effect=[_PAGE_1, _PAGE_2])
     mocker.patch('httpx.AsyncClient.get', mock_get)
     
     mocker.patch('src.extract.blog_patterns.single_list._get_post_details', new_callable=AsyncMock, return_value={"title": "Mock Post"})
@@ -17,7 +17,6 @@ from src.exceptions import (
     BatchJobError
 )
 
-@pytest.mark.asyncio
 class TestOrchestrator:
     """Comprehensive test suite for the orchestrator workflow management."""
 
@@ -25,14 +24,15 @@ class TestOrchestrator:
     # SCRAPE WORKFLOW TESTS
     # =============================================================================
 
-    async def test_run_pipeline_scrape_workflow_success(self, mock_di_container, mock_args_scrape, sample_posts, caplog):
+    @pytest.mark.parametrize('mock_args', ['scrape'], indirect=True)
+    async def test_run_pipeline_scrape_workflow_success(self, mock_di_container, mock_args, sample_posts, caplog):
         """Tests successful scrape workflow execution."""
         # Setup mocks for successful scraping
         mock_di_container.scraper_manager.scrape_and_return_posts.return_value = sample_posts
         mock_di_container.state_manager.save_raw_data.return_value = 'scraped_data.json'
 
         with caplog.at_level(logging.INFO):
-            result = await run_pipeline(mock_args_scrape)
+            result = await run_pipeline(mock_args)
 
         # Verify the workflow was executed correctly
         mock_di_container.scraper_manager.scrape_and_return_posts.assert_called_once_with(
@@ -53,13 +53,14 @@ class TestOrchestrator:
         # Verify logging
         assert "Starting scrape-only process" in caplog.text
 
-    async def test_run_pipeline_scrape_workflow_no_posts_found(self, mock_di_container, mock_args_scrape, caplog):
+    @pytest.mark.parametrize('mock_args', ['scrape'], indirect=True)
+    async def test_run_pipeline_scrape_workflow_no_posts_found(self, mock_di_container, mock_args, caplog):
         """Tests scrape workflow when no posts are found."""
         # Setup mocks for no posts found
         mock_di_container.scraper_manager.scrape_and_return_posts.return_value = None
 
         with caplog.at_level(logging.INFO):
-            result = await run_pipeline(mock_args_scrape)
+            result = await run_pipeline(mock_args)
 
         # Should still succeed but with 0 posts
         assert result['success'] is True
@@ -72,12 +73,13 @@ class TestOrchestrator:
         # Verify logging
         assert "No new posts found" in caplog.text
 
-    async def test_run_pipeline_scrape_workflow_scraper_exception(self, mock_di_container, mock_args_scrape):
+    @pytest.mark.parametrize('mock_args', ['scrape'], indirect=True)
+    async def test_run_pipeline_scrape_workflow_scraper_exception(self, mock_di_container, mock_args):
         """Tests scrape workflow when scraper raises exception."""
         # Setup scraper to raise exception
         mock_di_container.scraper_manager.scrape_and_return_posts.side_effect = Exception("Network error")
 
-        result = await run_pipeline(mock_args_scrape)
+        result = await run_pipeline(mock_args)
 
         # Should return structured error
         assert result['error'] is True
@@ -85,13 +87,14 @@ class TestOrchestrator:
         assert 'Network error' in result['message']
         assert 'test_competitor' in result['details']['competitors']
 
-    async def test_run_pipeline_scrape_workflow_state_save_failure(self, mock_di_container, mock_args_scrape, sample_posts):
+    @pytest.mark.parametrize('mock_args', ['scrape'], indirect=True)
+    async def test_run_pipeline_scrape_workflow_state_save_failure(self, mock_di_container, mock_args, sample_posts):
         """Tests scrape workflow when state saving fails."""
         # Setup successful scraping but failed saving
         mock_di_container.scraper_manager.scrape_and_return_posts.return_value = sample_posts
         mock_di_container.state_manager.save_raw_data.return_value = None
 
-        result = await run_pipeline(mock_args_scrape)
+        result = await run_pipeline(mock_args)
 
         # Should return structured error
         assert result['error'] is True
@@ -123,7 +126,8 @@ class TestOrchestrator:
     # GET-POSTS WORKFLOW TESTS (Full Pipeline)
     # =============================================================================
 
-    async def test_run_pipeline_get_posts_workflow_success(self, mock_di_container, mock_args_get_posts, sample_posts, sample_enriched_posts, caplog):
+    @pytest.mark.parametrize('mock_args', ['get_posts'], indirect=True)
+    async def test_run_pipeline_get_posts_workflow_success(self, mock_di_container, mock_args, sample_posts, sample_enriched_posts, caplog):
         """Tests successful full pipeline execution (scrape + enrich + save)."""
         # Setup mocks for full pipeline
         mock_di_container.scraper_manager.scrape_and_return_posts.return_value = sample_posts
@@ -132,7 +136,7 @@ class TestOrchestrator:
         mock_di_container.state_manager.save_processed_data.return_value = 'processed_file.json'
 
         with caplog.at_level(logging.INFO):
-            result = await run_pipeline(mock_args_get_posts)
+            result = await run_pipeline(mock_args)
 
         # Verify the full pipeline was executed in order
         mock_di_container.scraper_manager.scrape_and_return_posts.assert_called_once()
@@ -160,12 +164,13 @@ class TestOrchestrator:
         assert "Starting full pipeline" in caplog.text
         assert "Completed processing" in caplog.text
 
-    async def test_run_pipeline_get_posts_workflow_no_scraping_results(self, mock_di_container, mock_args_get_posts, caplog):
+    @pytest.mark.parametrize('mock_args', ['get_posts'], indirect=True)
+    async def test_run_pipeline_get_posts_workflow_no_scraping_results(self, mock_di_container, mock_args, caplog):
         """Tests get-posts workflow when scraping returns no results."""
         mock_di_container.scraper_manager.scrape_and_return_posts.return_value = None
 
         with caplog.at_level(logging.INFO):
-            result = await run_pipeline(mock_args_get_posts)
+            result = await run_pipeline(mock_args)
 
         # Should succeed but with 0 posts processed
         assert result['success'] is True
@@ -177,14 +182,15 @@ class TestOrchestrator:
         # Verify logging
         assert "No new posts found" in caplog.text
 
-    async def test_run_pipeline_get_posts_workflow_enrichment_returns_none(self, mock_di_container, mock_args_get_posts, sample_posts):
+    @pytest.mark.parametrize('mock_args', ['get_posts'], indirect=True)
+    async def test_run_pipeline_get_posts_workflow_enrichment_returns_none(self, mock_di_container, mock_args, sample_posts):
         """Tests get-posts workflow when enrichment returns None (batch mode)."""
         # Setup successful scraping but enrichment returns None (batch processing)
         mock_di_container.scraper_manager.scrape_and_return_posts.return_value = sample_posts
         mock_di_container.state_manager.save_raw_data.return_value = 'raw_file.json'
         mock_di_container.enrichment_manager.enrich_posts.return_value = None
 
-        result = await run_pipeline(mock_args_get_posts)
+        result = await run_pipeline(mock_args)
 
         # Should succeed but with 0 posts processed (batch mode)
         assert result['success'] is True
@@ -220,14 +226,15 @@ class TestOrchestrator:
     # ENRICH WORKFLOW TESTS
     # =============================================================================
 
-    async def test_run_pipeline_enrich_workflow_success(self, mock_di_container, mock_args_enrich, sample_posts, sample_enriched_posts, caplog):
+    @pytest.mark.parametrize('mock_args', ['enrich'], indirect=True)
+    async def test_run_pipeline_enrich_workflow_success(self, mock_di_container, mock_args, sample_posts, sample_enriched_posts, caplog):
         """Tests successful enrich workflow for existing processed data."""
         # Setup mocks for enrichment workflow
         mock_di_container.enrichment_manager._find_posts_to_enrich.return_value = (sample_posts, sample_posts)
         mock_di_container.enrichment_manager.enrich_posts.return_value = sample_enriched_posts
 
         with caplog.at_level(logging.INFO):
-            result = await run_pipeline(mock_args_enrich)
+            result = await run_pipeline(mock_args)
 
         # Verify enrichment workflow
         mock_di_container.enrichment_manager._find_posts_to_enrich.assert_called_once_with('test_competitor')
@@ -246,13 +253,14 @@ class TestOrchestrator:
         # Verify logging
         assert "Will enrich" in caplog.text
 
-    async def test_run_pipeline_enrich_workflow_no_posts_need_enrichment(self, mock_di_container, mock_args_enrich, sample_enriched_posts, caplog):
+    @pytest.mark.parametrize('mock_args', ['enrich'], indirect=True)
+    async def test_run_pipeline_enrich_workflow_no_posts_need_enrichment(self, mock_di_container, mock_args, sample_enriched_posts, caplog):
         """Tests enrich workflow when no posts need enrichment."""
         # Setup: all posts already enriched
         mock_di_container.enrichment_manager._find_posts_to_enrich.return_value = (sample_enriched_posts, [])
 
         with caplog.at_level(logging.INFO):
-            result = await run_pipeline(mock_args_enrich)
+            result = await run_pipeline(mock_args)
 
         # Should not call enrichment if no posts need it
         mock_di_container.enrichment_manager.enrich_posts.assert_not_called()
@@ -317,11 +325,12 @@ class TestOrchestrator:
     # CHECK-JOB WORKFLOW TESTS
     # =============================================================================
 
-    async def test_run_pipeline_check_job_workflow_success(self, mock_di_container, mock_args_check_job, sample_enriched_posts):
+    @pytest.mark.parametrize('mock_args', ['check_job'], indirect=True)
+    async def test_run_pipeline_check_job_workflow_success(self, mock_di_container, mock_args, sample_enriched_posts):
         """Tests successful check-job workflow."""
         mock_di_container.batch_manager.check_and_load_results.return_value = sample_enriched_posts
 
-        result = await run_pipeline(mock_args_check_job)
+        result = await run_pipeline(mock_args)
 
         mock_di_container.batch_manager.check_and_load_results.assert_called_once_with(
             mock_di_container.get_competitors_to_process.return_value[0],
@@ -332,11 +341,12 @@ class TestOrchestrator:
         assert result['operation'] == 'check_job'
         assert result['results_count'] == len(sample_enriched_posts)
 
-    async def test_run_pipeline_check_job_workflow_no_results(self, mock_di_container, mock_args_check_job):
+    @pytest.mark.parametrize('mock_args', ['check_job'], indirect=True)
+    async def test_run_pipeline_check_job_workflow_no_results(self, mock_di_container, mock_args):
         """Tests check-job workflow when no results are available."""
         mock_di_container.batch_manager.check_and_load_results.return_value = None
 
-        result = await run_pipeline(mock_args_check_job)
+        result = await run_pipeline(mock_args)
 
         assert result['success'] is True
         assert result['results_count'] == 0
@@ -361,9 +371,10 @@ class TestOrchestrator:
     # EXPORT WORKFLOW TESTS
     # =============================================================================
 
-    async def test_run_pipeline_export_workflow_success(self, mock_di_container, mock_args_export):
+    @pytest.mark.parametrize('mock_args', ['export'], indirect=True)
+    async def test_run_pipeline_export_workflow_success(self, mock_di_container, mock_args):
         """Tests successful export workflow."""
-        result = await run_pipeline(mock_args_export)
+        result = await run_pipeline(mock_args)
 
         # Should check jobs first, then export
         mock_di_container.batch_manager.check_and_load_results.assert_called_once()
@@ -422,7 +433,8 @@ class TestOrchestrator:
         assert 'No valid command specified' in result['message']
         assert 'available_commands' in result['details']
 
-    async def test_run_pipeline_structured_exception_handling(self, mock_di_container, mock_args_scrape):
+    @pytest.mark.parametrize('mock_args', ['scrape'], indirect=True)
+    async def test_run_pipeline_structured_exception_handling(self, mock_di_container, mock_args):
         """Tests that ETL exceptions are properly structured for LLM consumption."""
         # Setup enrichment manager to raise a structured exception
         mock_di_container.scraper_manager.scrape_and_return_posts.side_effect = ScrapingError(
@@ -432,7 +444,7 @@ class TestOrchestrator:
             details={"retry_count": 3}
         )
 
-        result = await run_pipeline(mock_args_scrape)
+        result = await run_pipeline(mock_args)
 
         # Verify structured error response
         assert result['error'] is True
@@ -443,13 +455,14 @@ class TestOrchestrator:
         assert result['details']['retry_count'] == 3
         assert result['error_type'] == 'ScrapingError'
 
-    async def test_run_pipeline_unexpected_exception_handling(self, mock_di_container, mock_args_scrape, caplog):
+    @pytest.mark.parametrize('mock_args', ['scrape'], indirect=True)
+    async def test_run_pipeline_unexpected_exception_handling(self, mock_di_container, mock_args, caplog):
         """Tests handling of unexpected (non-ETL) exceptions."""
         # Setup to raise unexpected exception
         mock_di_container.scraper_manager.scrape_and_return_posts.side_effect = ValueError("Unexpected error")
 
         with caplog.at_level(logging.ERROR):
-            result = await run_pipeline(mock_args_scrape)
+            result = await run_pipeline(mock_args)
 
         # Should wrap in generic ETL error
         assert result['error'] is True
@@ -460,7 +473,8 @@ class TestOrchestrator:
         # Should log the error
         assert "Unexpected error in pipeline" in caplog.text
 
-    async def test_run_pipeline_enrichment_error_propagation(self, mock_di_container, mock_args_enrich):
+    @pytest.mark.parametrize('mock_args', ['enrich'], indirect=True)
+    async def test_run_pipeline_enrichment_error_propagation(self, mock_di_container, mock_args):
         """Tests proper propagation of enrichment errors."""
         mock_di_container.enrichment_manager._find_posts_to_enrich.return_value = ([], [])
         mock_di_container.enrichment_manager.enrich_posts.side_effect = EnrichmentError(
@@ -470,7 +484,7 @@ class TestOrchestrator:
             details={"timeout_duration": 30}
         )
 
-        result = await run_pipeline(mock_args_enrich)
+        result = await run_pipeline(mock_args)
 
         assert result['error'] is True
         assert result['error_code'] == 'ENRICHMENT_ERROR'
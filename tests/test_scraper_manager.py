@@ -13,7 +13,6 @@ async def async_gen(items):
     for item in items:
         yield item
 
-@pytest.mark.asyncio
 class TestScraperManager:
     """Test suite for ScraperManager functionality."""
 
@@ -27,7 +26,7 @@ class TestScraperManager:
         result = await manager.scrape_and_return_posts(sample_competitor_config, 30, False)
 
         mock_state_manager.load_raw_urls.assert_called_once_with("test_competitor")
-        assert result == sample_posts
+        assert result == list(sample_posts)
 
     async def test_scrape_and_return_posts_no_posts(self, mock_app_config, sample_competitor_config, mock_state_manager, mocker):
         """Tests handling when no posts are found during scraping."""
@@ -55,7 +54,7 @@ class TestScraperManager:
         # Verify extract was called with existing URLs
         call_args = mock_extract.call_args
         assert call_args[0][4] == existing_urls  # existing_urls parameter
-        assert result == sample_posts
+        assert result == list(sample_posts)
 
     async def test_scrape_and_return_posts_uses_batch_size_from_config(self, mock_state_manager, sample_competitor_config, sample_posts, mocker):
         """Tests that batch size is taken from app config."""
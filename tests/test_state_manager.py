@@ -3,6 +3,7 @@
 
 import pytest
 import os
+import copy
 import json
 from unittest.mock import MagicMock, mock_open
 from datetime import datetime
@@ -10,6 +11,7 @@ from datetime import datetime
 from src.state_management.state_manager import StateManager
 from src.state_management.json_adapter import JsonAdapter
 from src.state_management.csv_adapter import CsvAdapter
+from src.state_management.parquet_adapter import ParquetAdapter
 
 class TestStateManager:
     """Test suite for StateManager functionality."""
@@ -81,7 +83,7 @@ class TestStateManager:
         result = manager.load_raw_data("test_competitor")
         
         manager.adapter.read.assert_called_once_with("test_competitor", file_type='raw')
-        assert result == sample_posts
+        assert result == list(sample_posts)
 
     def test_load_processed_data(self, mock_app_config, sample_enriched_posts):
         """Tests loading processed data through StateManager."""
@@ -96,6 +98,110 @@ class TestStateManager:
         manager.adapter.read.assert_called_once_with("test_competitor", file_type='processed')
         assert result == sample_enriched_posts
 
+    def test_load_processed_data_uses_cache(self, mock_app_config, sample_enriched_posts, tmp_path, monkeypatch):
+        """Tests that unchanged data files are only read once."""
+        monkeypatch.chdir(tmp_path)
+        data_dir = tmp_path / 'data' / 'processed' / 'test_competitor'
+        data_dir.mkdir(parents=True)
+        (data_dir / 'posts.json').write_text('[]')
+        
+        manager = StateManager(mock_app_config)
+        manager.adapter = MagicMock()
+        manager.adapter.read.return_value = sample_enriched_posts
+        
+        first = manager.load_processed_data("test_competitor")
+        second = manager.load_processed_data("test_competitor")
+        
+        manager.adapter.read.assert_called_once()
+        assert first == second == sample_enriched_posts
+        assert first is not second
+
+    def test_load_processed_data_cache_invalidation(self, mock_app_config, sample_enriched_posts, tmp_path, monkeypatch):
+        """Tests that saving or changing data files forces a re-read."""
+        monkeypatch.chdir(tmp_path)
+        data_dir = tmp_path / 'data' / 'processed' / 'test_competitor'
+        data_dir.mkdir(parents=True)
+        (data_dir / 'posts.json').write_text('[]')
+        
+        manager = StateManager(mock_app_config)
+        manager.adapter = MagicMock()
+        manager.adapter.read.return_value = sample_enriched_posts
+        
+        manager.load_processed_data("test_competitor")
+        manager.save_processed_data(sample_enriched_posts, "test_competitor", "source_file.json")
+        manager.load_processed_data("test_competitor")
+        (data_dir / 'other.json').write_text('[]')
+        manager.load_processed_data("test_competitor")
+        
+        assert manager.adapter.read.call_count == 3
+
+    def _fully_enriched_post(self):
+        """Returns a post with every required enrichment field filled in."""
+        return {
+            'title': 'Complete Post',
+            'url': 'https://test.com/complete',
+            'content': 'This post has content and complete enrichment data.',
+            'summary': 'Summary',
+            'seo_keywords': 'one, two',
+            'funnel_stage': 'ToFu',
+            'target_audience': 'Marketers',
+            'strategic_analysis': {
+                'content_angle': 'How-to Guide',
+                'competitive_differentiation': 'Unique angle',
+                'content_freshness_score': '8/10',
+                'target_persona_indicators': 'Marketing',
+                'content_depth': 'Deep'
+            }
+        }
+
+    def test_is_fully_enriched_from_stats(self, tmp_path, monkeypatch):
+        """Tests that saving fully enriched posts lets discovery skip reading them."""
+        monkeypatch.chdir(tmp_path)
+        manager = StateManager({'storage': {'adapter': 'json'}})
+        
+        manager.save_processed_data([self._fully_enriched_post()], "test_competitor", "source_file.json")
+        
+        assert manager.is_fully_enriched("test_competitor") is True
+
+    def test_is_fully_enriched_with_pending_posts(self, sample_enriched_posts, tmp_path, monkeypatch):
+        """Tests that posts missing enrichment fields are counted in the stats."""
+        monkeypatch.chdir(tmp_path)
+        manager = StateManager({'storage': {'adapter': 'json'}})
+        
+        manager.save_processed_data(sample_enriched_posts, "test_competitor", "source_file.json")
+        
+        assert manager.is_fully_enriched("test_competitor") is False
+
+    def test_is_fully_enriched_ignores_stale_stats(self, tmp_path, monkeypatch):
+        """Tests that data files changed or added outside the manager invalidate the stats."""
+        monkeypatch.chdir(tmp_path)
+        manager = StateManager({'storage': {'adapter': 'json'}})
+        manager.save_processed_data([self._fully_enriched_post()], "test_competitor", "source_file.json")
+        
+        (tmp_path / 'data' / 'processed' / 'test_competitor' / 'manual.json').write_text('[]')
+        
+        assert manager.is_fully_enriched("test_competitor") is False
+
+    def test_is_fully_enriched_no_data(self, mock_app_config, tmp_path, monkeypatch):
+        """Tests that a competitor without processed data is never reported as enriched."""
+        monkeypatch.chdir(tmp_path)
+        manager = StateManager(mock_app_config)
+        
+        assert manager.is_fully_enriched("test_competitor") is False
+
+    def test_iter_processed_data(self, mock_app_config, sample_enriched_posts):
+        """Tests streaming processed data through StateManager."""
+        manager = StateManager(mock_app_config)
+        
+        # Mock the adapter
+        manager.adapter = MagicMock()
+        manager.adapter.iter_read.return_value = iter(sample_enriched_posts)
+        
+        result = list(manager.iter_processed_data("test_competitor"))
+        
+        manager.adapter.iter_read.assert_called_once_with("test_competitor", file_type='processed')
+        assert result == sample_enriched_posts
+
     def test_load_raw_urls(self, mock_app_config):
         """Tests loading raw URLs through StateManager."""
         expected_urls = {'https://test.com/post1', 'https://test.com/post2'}
@@ -212,19 +318,19 @@ class TestJsonAdapter:
         
         assert result is None
 
-    def test_read_success(self, sample_posts, mocker):
+    def test_read_success(self, sample_posts_mutable, mocker):
         """Tests successful reading of JSON data."""
         mocker.patch('os.path.isdir', return_value=True)
         mocker.patch('os.listdir', return_value=['file1.json', 'file2.json'])
         mocker.patch('builtins.open', mock_open())
-        mocker.patch('json.load', return_value=sample_posts)
+        mocker.patch('json.load', return_value=sample_posts_mutable)
         
         adapter = JsonAdapter()
         
         result = adapter.read("test_competitor", "raw")
         
         # Should return posts for each file (doubled)
-        assert len(result) == len(sample_posts) * 2
+        assert len(result) == len(sample_posts_mutable) * 2
 
     def test_read_no_directory(self, mocker):
         """Tests reading when directory doesn't exist."""
@@ -296,4 +402,100 @@ class TestJsonAdapter:
         result = adapter.read_urls("test_competitor", "raw")
         
         # Should only include valid URLs
-        assert result == {'https://test.com/post1'}
\ No newline at end of file
+        assert result == {'https://test.com/post1'}
+
+
+class TestCsvAdapter:
+    """Test suite for CsvAdapter functionality."""
+
+    def _write_csv(self, path, rows):
+        """Writes rows to a CSV file with a title/url header."""
+        lines = ["title,url"] + [f"{title},{url}" for title, url in rows]
+        path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+    def test_iter_read_streams_rows(self, tmp_path, monkeypatch):
+        """Tests that iter_read yields rows lazily from every CSV file."""
+        monkeypatch.chdir(tmp_path)
+        data_dir = tmp_path / 'data' / 'processed' / 'test_competitor'
+        data_dir.mkdir(parents=True)
+        self._write_csv(data_dir / 'posts.csv', [('Post 1', 'https://test.com/post1'), ('Post 2', 'https://test.com/post2')])
+        
+        adapter = CsvAdapter()
+        rows = adapter.iter_read("test_competitor", "processed")
+        
+        assert next(rows) == {'title': 'Post 1', 'url': 'https://test.com/post1'}
+        assert [row['url'] for row in rows] == ['https://test.com/post2']
+
+    def test_read_matches_iter_read(self, tmp_path, monkeypatch):
+        """Tests that read returns the same posts as iter_read."""
+        monkeypatch.chdir(tmp_path)
+        data_dir = tmp_path / 'data' / 'raw' / 'test_competitor'
+        data_dir.mkdir(parents=True)
+        self._write_csv(data_dir / 'posts.csv', [('Post 1', 'https://test.com/post1')])
+        
+        adapter = CsvAdapter()
+        
+        assert adapter.read("test_competitor", "raw") == list(adapter.iter_read("test_competitor", "raw"))
+
+    def test_save_does_not_modify_posts(self, sample_posts_mutable, tmp_path, monkeypatch):
+        """Tests that saving encodes nested fields in the file without touching the posts."""
+        monkeypatch.chdir(tmp_path)
+        original = copy.deepcopy(sample_posts_mutable)
+        
+        adapter = CsvAdapter()
+        adapter.save(sample_posts_mutable, "test_competitor", "raw")
+        
+        assert sample_posts_mutable == original
+        rows = adapter.read("test_competitor", "raw")
+        assert [row['url'] for row in rows] == [post['url'] for post in original]
+        assert [json.loads(row['headings']) for row in rows] == [post['headings'] for post in original]
+
+    def test_read_no_directory(self, tmp_path, monkeypatch):
+        """Tests reading when directory doesn't exist."""
+        monkeypatch.chdir(tmp_path)
+        
+        adapter = CsvAdapter()
+        
+        assert adapter.read("test_competitor", "raw") == []
+
+    def test_read_urls_skips_empty_urls(self, tmp_path, monkeypatch):
+        """Tests reading URLs by column index, ignoring rows without a URL."""
+        monkeypatch.chdir(tmp_path)
+        data_dir = tmp_path / 'data' / 'raw' / 'test_competitor'
+        data_dir.mkdir(parents=True)
+        self._write_csv(data_dir / 'posts.csv', [('Post 1', 'https://test.com/post1'), ('Post 2', '')])
+        
+        adapter = CsvAdapter()
+        
+        assert adapter.read_urls("test_competitor", "raw") == {'https://test.com/post1'}
+
+
+class TestParquetAdapter:
+    """Test suite for ParquetAdapter functionality."""
+
+    def test_requires_pyarrow(self, mocker):
+        """Tests that the adapter fails clearly when pyarrow is not installed."""
+        mocker.patch('src.state_management.parquet_adapter.pq', None)
+        
+        with pytest.raises(ImportError, match="pyarrow"):
+            ParquetAdapter()
+
+    def test_round_trip(self, sample_enriched_posts, tmp_path, monkeypatch):
+        """Tests that posts, including nested fields, survive a save and read."""
+        pytest.importorskip("pyarrow")
+        monkeypatch.chdir(tmp_path)
+        adapter = ParquetAdapter()
+        
+        filepath = adapter.save(sample_enriched_posts, "test_competitor", "processed", "source_file.json")
+        
+        assert filepath.endswith("source_file.parquet")
+        assert adapter.read("test_competitor", "processed") == sample_enriched_posts
+
+    def test_read_urls(self, sample_enriched_posts, tmp_path, monkeypatch):
+        """Tests reading only the url column."""
+        pytest.importorskip("pyarrow")
+        monkeypatch.chdir(tmp_path)
+        adapter = ParquetAdapter()
+        adapter.save(sample_enriched_posts, "test_competitor", "raw")
+        
+        assert adapter.read_urls("test_competitor", "raw") == {post['url'] for post in sample_enriched_posts}